@@ -0,0 +1,54 @@
+"""
+Microbenchmark for the request/response dispatch path of `NetlabConnection`.
+
+Starts a :py:class:`netlab.standin.StandInServer` on localhost, then measures how many
+``call()`` round trips per second a single connection completes at several concurrency levels.
+
+::
+
+    python benchmarks/bench_calls.py --calls 20000 --concurrency 1 10 100 500
+"""
+
+import argparse
+import asyncio
+import time
+
+from netlab.async_client import NetlabConnection
+from netlab.auth import get_system_config
+from netlab.standin import StandInServer
+
+
+async def _run(calls, concurrency, port):
+    config = get_system_config(None, {'host': '127.0.0.1', 'port': port, 'user': 'bench', 'token': 'bench',
+                                      'ssl': False})
+    reader, writer = await asyncio.open_connection('127.0.0.1', port, limit=config.message_byte_limit)
+    connection = NetlabConnection(reader, writer, config)
+    await connection._connect()
+
+    async def worker(n):
+        for _ in range(n):
+            await connection.call('internal.mbusd.ping')
+
+    start = time.perf_counter()
+    await asyncio.gather(*[worker(calls // concurrency) for _ in range(concurrency)])
+    elapsed = time.perf_counter() - start
+
+    await connection._disconnect()
+    return (calls // concurrency) * concurrency / elapsed
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--calls', type=int, default=20000)
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 10, 100, 500])
+    parser.add_argument('--port', type=int, default=19901)
+    args = parser.parse_args()
+
+    async with StandInServer(port=args.port):
+        for concurrency in args.concurrency:
+            rate = await _run(args.calls, concurrency, args.port)
+            print('concurrency {:>5}: {:>10.0f} calls/sec'.format(concurrency, rate))
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,65 @@
+"""
+Benchmark for the codecs in `netlab.codec`.
+
+Prints the decode and encode times of each installed codec for synthetic ``pod.list`` and
+``user.account.search.task`` responses from :py:class:`netlab.standin.StandInServer`, and the time to encode a
+ping request. ``tests/test_codec.py`` checks that the codecs agree.
+
+::
+
+    python benchmarks/bench_codec.py --records 10000 --repeat 5
+"""
+
+import argparse
+import json
+import time
+import uuid
+
+from netlab.codec import CODECS, JsonCodec
+from netlab.standin import StandInServer
+
+
+def _frames(records):
+    server = StandInServer(records=records, accounts=records)
+    return {
+        'pod_list': json.dumps({'id': '1', 'result': server.handlers['pod.list']({})}).encode(),
+        'user_account_search': json.dumps({'id': '1', 'result': server.handlers['user.account.search.task'](
+            {'page': 1, 'limit': records})}).encode(),
+    }
+
+
+def _best(function, data, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(data)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--records', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    reference = JsonCodec()
+    frames = _frames(args.records)
+    codecs = [cls() for cls in CODECS.values()]
+
+    for name, frame in frames.items():
+        message = reference.decode(frame)
+        for codec in codecs:
+            print('{:<20} {:<8} decode {:>8.1f} ms  encode {:>8.1f} ms'.format(
+                name, codec.name, _best(codec.decode, frame, args.repeat) * 1000,
+                _best(codec.encode, message, args.repeat) * 1000))
+
+    ping = uuid.uuid4()
+    for codec in codecs:
+        seconds = _best(lambda count: [codec.encode_request(ping, 'internal.mbusd.ping', {}) for _ in range(count)],
+                        10000, args.repeat)
+        print('{:<20} {:<8} encode {:>8.2f} us per request'.format('ping', codec.name, seconds / 10000 * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""
+Benchmark for aggregating list results as rows against ``columnar=True`` columns.
+
+Decodes synthetic ``system.perf.query`` and ``pod.list`` responses from :py:class:`netlab.standin.StandInServer`
+the way each mode receives them, then rolls them up: the mean of each perf metric, and the total and used pods of
+each pod type as in ``samples/PRTG/netlab_pod_usage.py``. Times include decoding and field conversion. The
+memory held by the decoded rows and by the columns is printed as well.
+
+::
+
+    python benchmarks/bench_columns.py --records 100000 --repeat 5
+"""
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from collections import Counter, defaultdict
+from itertools import compress
+
+from netlab.api.pod import PodApiMixin
+from netlab.api.system import SystemApiMixin
+from netlab.codec import get_codec
+from netlab.columns import to_columns
+from netlab.standin import StandInServer
+
+
+def _perf_rows(rows):
+    sums, counts = defaultdict(float), Counter()
+    for row in rows:
+        sums[row['sp_metric']] += float(row['sp_value'])
+        counts[row['sp_metric']] += 1
+    return {metric: sums[metric] / counts[metric] for metric in counts}
+
+
+def _perf_columns(columns):
+    sums, counts = defaultdict(float), Counter(columns['sp_metric'])
+    for metric, value in zip(columns['sp_metric'], columns['sp_value']):
+        sums[metric] += value
+    return {metric: sums[metric] / counts[metric] for metric in counts}
+
+
+def _pods_rows(rows):
+    total, used = Counter(), Counter()
+    for pod in rows:
+        total[pod['pt_id']] += 1
+        if pod['pod_res_id']:
+            used[pod['pt_id']] += 1
+    return total, used
+
+
+def _pods_columns(columns):
+    return Counter(columns['pt_id']), Counter(compress(columns['pt_id'], columns['pod_res_id']))
+
+
+def _held(build):
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def _best(function, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--records', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    server = StandInServer(records=args.records)
+    codec = get_codec()
+    cases = {
+        'system_perf_query': ('system.perf.query', SystemApiMixin.system_perf_props, _perf_rows, _perf_columns),
+        'pod_list': ('pod.list', PodApiMixin.pod_list_props, _pods_rows, _pods_columns),
+    }
+    for name, (method, properties, by_rows, by_columns) in cases.items():
+        payload = json.dumps(server.handlers[method]({})).encode()
+
+        def rows():
+            return by_rows(codec.decode(payload))
+
+        def columns():
+            return by_columns(to_columns(codec.decode_raw(payload), properties))
+
+        result = rows()
+        assert result == columns(), name
+        print('{:<20} {:>7} rows  rows {:>8.1f} ms {:>6.1f} MB  columns {:>8.1f} ms {:>6.1f} MB'.format(
+            name, args.records, _best(rows, args.repeat) * 1000, _held(lambda: codec.decode(payload)) / 1e6,
+            _best(columns, args.repeat) * 1000,
+            _held(lambda: to_columns(codec.decode_raw(payload), properties)) / 1e6))
+
+
+if __name__ == '__main__':
+    main()
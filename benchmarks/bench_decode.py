@@ -0,0 +1,121 @@
+"""
+Benchmark for decoding large NETLAB+ responses with `netlab.serializer.deserialize`.
+
+Builds synthetic ``pod.list`` and ``user.account.search.task`` payloads with
+:py:class:`netlab.standin.StandInServer`, then times decoding each one with the current field decoder table
+against the original per-set ``process()`` the table replaced.
+
+It then times a scan reading two fields of every record, once from fully converted records and once from
+:py:class:`netlab.records.LazyRecord` results, both decoded with the default codec.
+
+::
+
+    python benchmarks/bench_decode.py --records 10000 --repeat 5
+"""
+
+import argparse
+import json
+import time
+
+from netlab import serializer
+from netlab.codec import get_codec
+from netlab.records import lazy_records
+from netlab.standin import StandInServer
+
+SCANS = {
+    'pod_list': (lambda result: result, ('pod_id', 'pod_current_state')),
+    'user_account_search': (lambda result: result['data'], ('acc_id', 'acc_type')),
+}
+
+
+def _resolve_enum(enum, value):
+    # serializer.resolve_enum before the enums were compiled into lookup tables
+    if not isinstance(enum, tuple):
+        enum = (enum,)
+    for e in enum:
+        try:
+            return e(value)
+        except:  # noqa
+            pass
+    raise ValueError(value)
+
+
+def _process_sets(obj):
+    # serializer.process before the field sets were compiled into serializer.FIELD_DECODERS
+    s = serializer
+    for field, value in obj.items():
+        if field in s.DATE_FIELDS:
+            obj[field] = s.to_date(value)
+        if field in s.DATETIME_FIELDS:
+            obj[field] = s.to_datetime(value)
+        if field in s.TIMEDELTA_FIELDS:
+            obj[field] = s.to_timedelta(value)
+        if field in s.BOOLEAN_FIELDS:
+            obj[field] = s.to_bool(value)
+        if field in s.DECIMAL_FIELDS:
+            obj[field] = s.to_decimal(value)
+        if field in s.INT_FIELDS:
+            obj[field] = s.to_int(value)
+        if field in s.UUID_FIELDS:
+            obj[field] = s.to_uuid(value)
+        if field in s.ENUMS and value is not None:
+            obj[field] = _resolve_enum(s.ENUMS[field], value)
+        if field in s.ENUM_CSV and value is not None:
+            enum = s.ENUM_CSV[field]
+            obj[field] = list(map(lambda v: enum[v], value.split(',')))
+        if field in s.STR_CSV:
+            obj[field] = value.split(',')
+        if field in s.BLANK_IS_NONE_FIELDS and value == '':
+            obj[field] = None
+    return obj
+
+
+def _payloads(records):
+    server = StandInServer(records=records, accounts=records)
+    return {
+        'pod_list': json.dumps({'id': '1', 'result': server.handlers['pod.list']({})}).encode(),
+        'user_account_search': json.dumps({'id': '1', 'result': server.handlers['user.account.search.task'](
+            {'page': 1, 'limit': records})}).encode(),
+    }
+
+
+def _best(decode, payload, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        decode(payload)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--records', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    for name, payload in _payloads(args.records).items():
+        baseline = _best(lambda data: json.loads(data, object_hook=_process_sets), payload, args.repeat)
+        current = _best(serializer.deserialize, payload, args.repeat)
+        assert serializer.deserialize(payload) == json.loads(payload, object_hook=_process_sets)
+        print('{:<20} {:>6.1f} MB  sets {:>8.1f} ms  table {:>8.1f} ms  {:>5.2f}x'.format(
+            name, len(payload) / 1e6, baseline * 1000, current * 1000, baseline / current))
+
+    codec = get_codec()
+    for name, payload in _payloads(args.records).items():
+        records, fields = SCANS[name]
+
+        def scan(message):
+            return [[record[field] for field in fields] for record in records(message['result'])]
+
+        raw = _best(lambda data: scan(codec.decode_raw(data)), payload, args.repeat)
+        eager = _best(lambda data: scan(codec.decode(data)), payload, args.repeat)
+        lazy = _best(lambda data: scan(lazy_records(codec.decode_raw(data))), payload, args.repeat)
+        assert scan(lazy_records(codec.decode_raw(payload))) == scan(codec.decode(payload))
+        # conversion cost is the time above scanning the unconverted message
+        print('{:<20} scan {:<27} unconverted {:>7.1f} ms  eager +{:>6.1f} ms  lazy +{:>6.1f} ms'.format(
+            name, ', '.join(fields), raw * 1000, (eager - raw) * 1000, (lazy - raw) * 1000))
+
+
+if __name__ == '__main__':
+    main()
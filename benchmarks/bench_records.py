@@ -0,0 +1,81 @@
+"""
+Benchmark for the memory and iteration cost of `netlab.records.Record` rows against plain dicts.
+
+Decodes synthetic ``user.account.search.task`` and ``pod.list`` responses from
+:py:class:`netlab.standin.StandInServer`, keeps the rows as dicts or as records of the property lists that
+``user_account_list(records=True)`` and ``pod_list(records=True)`` use, then measures the memory the rows hold and
+the time to read two fields of every row, by key from dicts and by attribute from records.
+
+::
+
+    python benchmarks/bench_records.py --accounts 50000 --pods 5000
+"""
+
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from operator import attrgetter, itemgetter
+
+from netlab.api.pod import PodApiMixin
+from netlab.api.user import UserApiMixin
+from netlab.codec import get_codec
+from netlab.records import to_records
+from netlab.standin import StandInServer
+
+
+def _rows(args):
+    server = StandInServer(records=args.pods, accounts=args.accounts)
+    search = server.handlers['user.account.search.task']({'page': 1, 'limit': args.accounts})
+    return {
+        'accounts': (json.dumps(search['data']).encode(), 'Account', UserApiMixin.user_account_list_props,
+                     ('acc_id', 'acc_user_id')),
+        'pods': (json.dumps(server.handlers['pod.list']({})).encode(), 'Pod', PodApiMixin.pod_list_props,
+                 ('pod_id', 'pod_current_state')),
+    }
+
+
+def _measure(build):
+    gc.collect()
+    tracemalloc.start()
+    rows = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return rows, size
+
+
+def _scan(rows, getter):
+    best = float('inf')
+    for _ in range(5):
+        start = time.perf_counter()
+        for row in rows:
+            getter(row)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--accounts', type=int, default=50000)
+    parser.add_argument('--pods', type=int, default=5000)
+    args = parser.parse_args()
+
+    codec = get_codec()
+    for name, (payload, cls_name, properties, fields) in _rows(args).items():
+        dicts, dict_size = _measure(lambda: codec.decode(payload))
+        del dicts
+        records, record_size = _measure(lambda: to_records(codec.decode(payload), cls_name, properties))
+        dicts = codec.decode(payload)
+        assert records == dicts
+        print('{:<10} {:>6} rows  memory dicts {:>6.1f} MB  records {:>6.1f} MB  per row container {:>5} B vs {:>4} B'
+              .format(name, len(records), dict_size / 1e6, record_size / 1e6, sys.getsizeof(dicts[0]),
+                      sys.getsizeof(records[0])))
+        print('{:<10} scan {:<28} dicts {:>6.1f} ms  records {:>6.1f} ms'.format(
+            name, ', '.join(fields), _scan(dicts, itemgetter(*fields)) * 1000,
+            _scan(records, attrgetter(*fields)) * 1000))
+
+
+if __name__ == '__main__':
+    main()
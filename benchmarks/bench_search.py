@@ -0,0 +1,62 @@
+"""
+Benchmark for paging through ``user_account_search_iter`` at fixed page sizes, sized pages and prefetch windows.
+
+Starts a :py:class:`netlab.standin.StandInServer` on localhost, whose ``user.account.search.task`` pages complete
+after **task_latency**, then reads every account, once with two properties and once with all of them, at each
+page limit and prefetch window and prints the time it took and the largest page asked for. A limit of ``auto``
+lets a :py:class:`netlab.paging.PageSizer` pick the size of each page.
+
+::
+
+    python benchmarks/bench_search.py --accounts 2000 20000 --limit 100 500 auto --prefetch 1 4
+"""
+
+import argparse
+import asyncio
+import time
+
+from netlab.api.user import UserApiMixin
+from netlab.async_client import NetlabClient
+from netlab.paging import PageSizer
+from netlab.standin import StandInServer
+
+
+async def _read(client, properties, limit, prefetch):
+    sizer = PageSizer() if limit == 'auto' else None
+    largest = 0 if sizer is None else sizer.limit
+    start = time.perf_counter()
+    count = 0
+    async for _ in client.user_account_search_iter(
+            properties=properties, limit=sizer or int(limit), prefetch=prefetch):
+        count += 1
+        if sizer is not None:
+            largest = max(largest, sizer.limit)
+    return count, time.perf_counter() - start, largest or int(limit)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--accounts', type=int, nargs='+', default=[2000, 20000])
+    parser.add_argument('--limit', nargs='+', default=['100', '500', 'auto'])
+    parser.add_argument('--prefetch', type=int, nargs='+', default=[1, 4])
+    parser.add_argument('--latency', type=float, default=0.005)
+    parser.add_argument('--task-latency', type=float, default=0.05)
+    args = parser.parse_args()
+
+    cases = {'narrow': ['acc_id', 'acc_user_id'], 'all': UserApiMixin.user_account_list_props}
+    for accounts in args.accounts:
+        async with StandInServer(port=0, accounts=accounts, latency=args.latency,
+                                 task_latency=args.task_latency) as server:
+            config = {'host': '127.0.0.1', 'port': server.port, 'user': 'bench', 'token': 'bench', 'ssl': False}
+            async with NetlabClient(config=config) as client:
+                for name, properties in cases.items():
+                    for limit in args.limit:
+                        for prefetch in args.prefetch:
+                            count, elapsed, largest = await _read(client, properties, limit, prefetch)
+                            assert count == accounts, count
+                            print('{:>6} accounts {:<6} limit {:>4} prefetch {:>2}: {:>8.1f} ms, pages up to {}'
+                                  .format(accounts, name, limit, prefetch, elapsed * 1000, largest))
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
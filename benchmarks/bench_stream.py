@@ -0,0 +1,96 @@
+"""
+Benchmark for exporting a large list result read whole against ``stream=True``.
+
+Starts :py:class:`netlab.standin.StandInServer` in a process of its own, then writes every row of a
+``system_perf_query`` and of a single page ``user_account_search`` to a discarded CSV, once from the returned list
+and once from the :py:class:`netlab.streaming.ResultStream`. Prints the time of each export, the time until the
+first row was written and, from a second traced run, the peak memory the client allocated.
+
+::
+
+    python benchmarks/bench_stream.py --records 50000
+"""
+
+import argparse
+import asyncio
+import csv
+import gc
+import io
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+from netlab.async_client import NetlabClient
+
+
+async def _rows(result):
+    if hasattr(result, '__anext__'):
+        async for row in result:
+            yield row
+    else:
+        for row in result:
+            yield row
+
+
+async def _export(call, stream):
+    start = time.perf_counter()
+    result = await call(stream)
+    first = None
+    out = io.StringIO()
+    writer = None
+    async for row in _rows(result):
+        if writer is None:
+            first = time.perf_counter() - start
+            writer = csv.DictWriter(out, list(row))
+            writer.writeheader()
+        writer.writerow(row)
+        out.seek(0)
+        out.truncate()
+    return time.perf_counter() - start, first
+
+
+async def _peak(call, stream):
+    gc.collect()
+    tracemalloc.start()
+    await _export(call, stream)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--records', type=int, default=50000)
+    args = parser.parse_args()
+
+    server = await asyncio.create_subprocess_exec(
+        sys.executable, '-m', 'netlab.standin', '--port', '0', '--records', str(args.records),
+        '--accounts', str(args.records), stdout=asyncio.subprocess.PIPE)
+    try:
+        host, port = (await server.stdout.readline()).decode().split()[-1].rsplit(':', 1)
+        config = {'host': host, 'port': int(port), 'user': 'standin', 'token': 'standin', 'ssl': False,
+                  'decode_offload_threshold': 0}
+        async with NetlabClient(config=config) as client:
+            async def perf(stream):
+                return await client.system_perf_query(start_time=datetime(2022, 1, 1), stream=stream)
+
+            async def accounts(stream):
+                page = await client.user_account_search(
+                    properties=client.user_account_list_props, page=1, limit=args.records, stream=stream)
+                return page if stream else page['data']
+
+            for name, call in {'system_perf_query': perf, 'user_account_search': accounts}.items():
+                whole = await _export(call, False)
+                streamed = await _export(call, True)
+                print('{:<20} {:>7} rows  list {:>7.1f} ms first row {:>7.1f} ms peak {:>6.1f} MB'
+                      '  stream {:>7.1f} ms first row {:>6.1f} ms peak {:>6.1f} MB'.format(
+                          name, args.records, whole[0] * 1000, whole[1] * 1000, await _peak(call, False) / 1e6,
+                          streamed[0] * 1000, streamed[1] * 1000, await _peak(call, True) / 1e6))
+    finally:
+        server.terminate()
+        await server.wait()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
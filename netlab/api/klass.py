@@ -1,8 +1,9 @@
 from datetime import date
-from typing import Optional, List, Any, Union, Dict, cast
+from typing import Optional, List, Any, Union, Dict, cast, overload
 from typing_extensions import Literal
 
 from .. import enums
+from ..records import Record, to_records
 from ._client_protocol import ClientProtocol
 
 
@@ -20,20 +21,44 @@ class ClassApiMixin(ClientProtocol):
     roster_props = ['acc_display_name', 'acc_email', 'acc_full_name', 'acc_id', 'acc_last_login', 'acc_logins',
                     'acc_sort_name', 'acc_time_last_access', 'acc_type', 'acc_user_id', 'cls_id', 'lead', 'ros_team']
 
+    @overload
+    async def class_list(
+            self,
+            *,
+            com_id: Optional[int] = None,
+            member: bool = False,
+            properties: Union[List[str], Literal['default', 'all']] = "default",
+            records: Literal[True],
+            **kwargs
+        ) -> List[Record]: ...
+
+    @overload
+    async def class_list(
+            self,
+            *,
+            com_id: Optional[int] = None,
+            member: bool = False,
+            properties: Union[List[str], Literal['default', 'all']] = "default",
+            records: Literal[False] = False,
+            **kwargs
+        ) -> List[Dict[str, Any]]: ...
+
     async def class_list(
                 self,
                 *,
                 com_id: Optional[int] = None,
                 member: bool = False,
                 properties: Union[List[str], Literal['default', 'all']] = "default",
+                records: bool = False,
                 **kwargs
-            ) -> List[Dict[str, Any]]:
+            ) -> Union[List[Dict[str, Any]], List[Record]]:
         """
         This method allows you to retrieve a list of classes and their properties.
 
         :param com_id: Community ID.
         :param member: If true, get list of classes the caller is in.
         :param properties: List of properties to retrieve. See Properties section for list of available properties.
+        :param records: Return :py:class:`netlab.records.Record` objects instead of dicts.
 
         :return: On success, returns an object with the requested properties:
 
@@ -89,7 +114,13 @@ class ClassApiMixin(ClientProtocol):
             properties = self.class_props
         if properties == 'default':
             properties = self.class_default_props
-        return await self.call(method, com_id=com_id, member=member, properties=properties, **kwargs)
+        if records:
+            # records are made from converted rows, whatever the connection defaults to
+            kwargs.setdefault('raw', False)
+        result = await self.call(method, com_id=com_id, member=member, properties=properties, **kwargs)
+        if records:
+            return to_records(result, 'Class', properties)
+        return result
 
     async def class_add(
                 self,
@@ -380,6 +411,7 @@ class ClassApiMixin(ClientProtocol):
                 *,
                 cls_id: int,
                 leads: bool = False,
+                records: bool = False,
                 **kwargs
             ):
         """
@@ -388,6 +420,7 @@ class ClassApiMixin(ClientProtocol):
         :param cls_id: Local system class.
         :param leads: `None` Return all users in the roster (leads and learners).
             `True` Return lead instructors only. `False` Return learners only.
+        :param records: Return :py:class:`netlab.records.Record` objects instead of dicts.
 
         :return: On success, returns an object with the requested properties:
 
@@ -422,7 +455,12 @@ class ClassApiMixin(ClientProtocol):
         """
 
         method = "class.roster.list"
-        return await self.call(method, cls_id=cls_id, leads=leads, **kwargs)
+        if records:
+            kwargs.setdefault('raw', False)
+        result = await self.call(method, cls_id=cls_id, leads=leads, **kwargs)
+        if records:
+            return to_records(result, 'RosterAccount', self.roster_props)
+        return result
 
     async def class_roster_remove(
                 self,
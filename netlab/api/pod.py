@@ -1,4 +1,4 @@
-from typing import Union, List, Dict, Any, Optional
+from typing import Union, List, Dict, Any, Optional, overload
 from typing_extensions import Literal
 
 from uuid import UUID
@@ -7,6 +7,8 @@ import re
 
 from ..utils import hdr_result, version_gte, omit_nones
 from ..datatypes import PCCloneSpec, HDRResult
+from ..records import Record, to_records
+from ..columns import Columns, to_columns
 from .. import enums
 from ._client_protocol import ClientProtocol
 
@@ -67,6 +69,10 @@ class PodApiMixin(ClientProtocol):
         'sched_image',
         'vm_alloc']
 
+    pod_list_props = ['def_topology_image', 'pod_acl_enabled', 'pod_admin_state', 'pod_cat', 'pod_current_state',
+                      'pod_desc', 'pod_dyn_vlan', 'pod_id', 'pod_managed', 'pod_name', 'pod_uuid', 'pod_res_id',
+                      'pt_apdid', 'pt_desc', 'pt_gpdid', 'pt_id', 'pt_name', 'sched_image']
+
     pod_types_default_props = ['pt_id', 'pt_name', 'pt_build']
     pod_types_props = ['pt_id', 'pt_name', 'pt_build', 'pt_gpdid', 'pt_apdid', 'pt_desc', 'pt_index', 'pt_type',
                        'sched_image', 'def_topology_image', 'def_im_name', 'def_vlan_map', 'pt_tabs', 'pt_actions',
@@ -370,16 +376,50 @@ class PodApiMixin(ClientProtocol):
         res_param.update(kwargs)
         return await self.call(method, **res_param)
 
+    @overload
+    async def pod_list(
+            self,
+            *,
+            pod_cat: Optional[enums.PodCategory] = None,
+            records: bool = False,
+            columnar: Literal[True],
+            **kwargs
+        ) -> Columns: ...
+
+    @overload
+    async def pod_list(
+            self,
+            *,
+            pod_cat: Optional[enums.PodCategory] = None,
+            records: Literal[True],
+            columnar: Literal[False] = False,
+            **kwargs
+        ) -> List[Record]: ...
+
+    @overload
+    async def pod_list(
+            self,
+            *,
+            pod_cat: Optional[enums.PodCategory] = None,
+            records: Literal[False] = False,
+            columnar: Literal[False] = False,
+            **kwargs
+        ) -> List[Dict[str, Any]]: ...
+
     async def pod_list(
                 self,
                 *,
                 pod_cat: Optional[enums.PodCategory] = None,
+                records: bool = False,
+                columnar: bool = False,
                 **kwargs
-            ) -> List[Dict[str, Any]]:
+            ) -> Union[List[Dict[str, Any]], List[Record], Columns]:
         """
         List pods on the system.
 
         :param pod_cat: Pod category type.
+        :param records: Return :py:class:`netlab.records.Record` objects instead of dicts.
+        :param columnar: Return :py:class:`netlab.columns.Columns`, one column per property, instead of dicts.
         :return: Returns a list of dictionary objects containing the following properties:
 
         **Properties**
@@ -423,12 +463,21 @@ class PodApiMixin(ClientProtocol):
         """
         method = "pod.list"
 
-        res_param = {}
+        res_param: Dict[str, Any] = {}
         if pod_cat is not None:
             res_param['pod_cat'] = pod_cat
 
         res_param.update(kwargs)
-        return await self.call(method, **res_param)
+        if columnar:
+            res_param['raw'] = True
+            return to_columns(await self.call(method, **res_param), self.pod_list_props)
+        if records:
+            # records are made from converted rows, whatever the connection defaults to
+            res_param.setdefault('raw', False)
+        result = await self.call(method, **res_param)
+        if records:
+            return to_records(result, 'Pod', self.pod_list_props)
+        return result
 
     async def pod_list_used_ids(self, **kwargs) -> List[int]:
         """
@@ -869,18 +918,38 @@ class PodApiMixin(ClientProtocol):
         res_param.update(kwargs)
         return await self.call(method, **res_param)
 
+    @overload
+    async def pod_types_list(
+            self,
+            *,
+            properties: Union[List[str], Literal['all', 'default']] = "default",
+            records: Literal[True],
+            **kwargs
+        ) -> List[Record]: ...
+
+    @overload
+    async def pod_types_list(
+            self,
+            *,
+            properties: Union[List[str], Literal['all', 'default']] = "default",
+            records: Literal[False] = False,
+            **kwargs
+        ) -> List[Dict[str, Any]]: ...
+
     async def pod_types_list(
                 self,
                 *,
                 properties: Union[List[str], Literal['all', 'default']] = "default",
+                records: bool = False,
                 **kwargs
-            ) -> List[Dict[str, Any]]:
+            ) -> Union[List[Dict[str, Any]], List[Record]]:
         """
         Obtain a list of pod types.
 
         :param properties: Properties consist of any combination of properties listed below under Properties.
                            You may also use **"all"** to include all properties, or **"default"** for a smaller subset
                            of properties.
+        :param records: Return :py:class:`netlab.records.Record` objects instead of dicts.
         :return: On success, returns [rt_id, pt_build, pt_name] by default, or the following properties if requested.
 
         **Properties**
@@ -956,7 +1025,12 @@ class PodApiMixin(ClientProtocol):
         if properties == 'default':
             properties = self.pod_types_default_props
 
-        return await self.call(method, properties=properties, **kwargs)
+        if records:
+            kwargs.setdefault('raw', False)
+        result = await self.call(method, properties=properties, **kwargs)
+        if records:
+            return to_records(result, 'PodType', properties)
+        return result
 
     async def pod_remove_task(
                 self,
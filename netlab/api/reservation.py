@@ -1,9 +1,11 @@
-from typing import Optional, Any, Dict, List
+from typing import Optional, Any, Dict, List, Union
 from typing_extensions import Literal
 from datetime import datetime, timedelta, date as date_type
 
 from .. import enums
 from ..utils import minimum_version, omit_nones
+from ..columns import Columns, to_columns
+from ..streaming import ResultStream
 from ._client_protocol import ClientProtocol
 
 from typing import overload
@@ -379,6 +381,8 @@ class ReservationApiMixin(ClientProtocol):
             max_time: Optional[datetime] = None,
             cls_id: Optional[int] = None,
             pod_id: Optional[int] = None,
+            columnar: Literal[False] = False,
+            stream: Literal[False] = False,
         ) -> List[Dict[str, Any]]: ...
 
     @overload
@@ -391,8 +395,40 @@ class ReservationApiMixin(ClientProtocol):
             max_time: Optional[datetime] = None,
             com_id: Optional[int] = None,
             pod_id: Optional[int] = None,
+            columnar: Literal[False] = False,
+            stream: Literal[False] = False,
         ) -> List[Dict[str, Any]]: ...
 
+    @overload
+    async def reservation_query(
+            self,
+            *,
+            active: Optional[bool] = None,
+            scope: enums.ReservationScope = enums.ReservationScope.ALL,
+            min_time: Optional[datetime] = None,
+            max_time: Optional[datetime] = None,
+            com_id: Optional[int] = None,
+            cls_id: Optional[int] = None,
+            pod_id: Optional[int] = None,
+            columnar: Literal[True],
+            stream: bool = False,
+        ) -> Columns: ...
+
+    @overload
+    async def reservation_query(
+            self,
+            *,
+            active: Optional[bool] = None,
+            scope: enums.ReservationScope = enums.ReservationScope.ALL,
+            min_time: Optional[datetime] = None,
+            max_time: Optional[datetime] = None,
+            com_id: Optional[int] = None,
+            cls_id: Optional[int] = None,
+            pod_id: Optional[int] = None,
+            columnar: Literal[False] = False,
+            stream: Literal[True],
+        ) -> ResultStream: ...
+
     async def reservation_query(
                 self,
                 *,
@@ -403,8 +439,10 @@ class ReservationApiMixin(ClientProtocol):
                 com_id: Optional[int] = None,
                 cls_id: Optional[int] = None,
                 pod_id: Optional[int] = None,
+                columnar: bool = False,
+                stream: bool = False,
                 **kwargs
-            ) -> List[Dict[str, Any]]:
+            ) -> Union[List[Dict[str, Any]], Columns, ResultStream]:
         """
         Return a list of reservations filtered on criteria. Take note of the acceptable overrides.
 
@@ -415,6 +453,9 @@ class ReservationApiMixin(ClientProtocol):
         :param max_time: Maximum time range.
         :param min_time: Minimum time range.
         :param pod_id: Pod identifier.
+        :param columnar: Return :py:class:`netlab.columns.Columns`, one column per property, instead of dicts.
+        :param stream: Return a :py:class:`netlab.streaming.ResultStream` that decodes the rows as they are read,
+            instead of a list.
 
         :return: On success, returns an object with the following properties:
 
@@ -519,7 +560,10 @@ class ReservationApiMixin(ClientProtocol):
             res_param['scope'] = scope
 
         res_param.update(kwargs)
-        return await self.call(method, **res_param)
+        if columnar:
+            res_param['raw'] = True
+            return to_columns(await self.call(method, **res_param))
+        return await self.call(method, stream=stream, **res_param)
 
     async def reservation_time_now(
                 self,
@@ -1,13 +1,18 @@
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Union, overload
+from typing_extensions import Literal
 
 from ..utils import minimum_version
+from ..columns import Columns, to_columns
+from ..streaming import ResultStream
 from ._client_protocol import ClientProtocol
 
 from .system_results import SystemStatusGetResult
 
 
 class SystemApiMixin(ClientProtocol):
+    system_perf_props = ['sp_time', 'sp_metric', 'sp_source', 'sp_value']
+
     async def system_status_get(self, **kwargs) -> SystemStatusGetResult:
         """
         This method allows you to query NETLAB+ system information.
@@ -172,6 +177,45 @@ class SystemApiMixin(ClientProtocol):
         method = 'system.time.timezone.list'
         return await self.call(method, **kwargs)
 
+    @overload
+    async def system_perf_query(
+            self,
+            *,
+            start_time: datetime,
+            end_time: Optional[datetime] = None,
+            metrics: Optional[List[str]] = None,
+            sources: Optional[List[str]] = None,
+            columnar: Literal[True],
+            stream: bool = False,
+            **kwargs,
+        ) -> Columns: ...
+
+    @overload
+    async def system_perf_query(
+            self,
+            *,
+            start_time: datetime,
+            end_time: Optional[datetime] = None,
+            metrics: Optional[List[str]] = None,
+            sources: Optional[List[str]] = None,
+            columnar: Literal[False] = False,
+            stream: Literal[True],
+            **kwargs,
+        ) -> ResultStream: ...
+
+    @overload
+    async def system_perf_query(
+            self,
+            *,
+            start_time: datetime,
+            end_time: Optional[datetime] = None,
+            metrics: Optional[List[str]] = None,
+            sources: Optional[List[str]] = None,
+            columnar: Literal[False] = False,
+            stream: Literal[False] = False,
+            **kwargs,
+        ) -> List[Dict[str, Any]]: ...
+
     @minimum_version('19.0.1')
     async def system_perf_query(
                 self,
@@ -180,8 +224,10 @@ class SystemApiMixin(ClientProtocol):
                 end_time: Optional[datetime] = None,
                 metrics: Optional[List[str]] = None,
                 sources: Optional[List[str]] = None,
+                columnar: bool = False,
+                stream: bool = False,
                 **kwargs,
-            ) -> List[Dict[str, Any]]:
+            ) -> Union[List[Dict[str, Any]], Columns, ResultStream]:
         """
         This method is used to query system performance metrics.
 
@@ -190,6 +236,9 @@ class SystemApiMixin(ClientProtocol):
         :param metrics: If specified, only returns metrics from :ref:`this list<System Performance Metrics>`.
         :param sources: If specified, only returns metrics originating from sources in this list.
             Valid sources include mbusd, podspd, sysspd, respd, userspd, vmspd, histpd, filespd.
+        :param columnar: Return :py:class:`netlab.columns.Columns`, one column per property, instead of dicts.
+        :param stream: Return a :py:class:`netlab.streaming.ResultStream` that decodes the rows as they are read,
+            instead of a list.
         :return: A list of dicts with the following properties.
 
         **Properties**
@@ -221,4 +270,6 @@ class SystemApiMixin(ClientProtocol):
             'sources': sources
         }
 
-        return await self.call(method, **params, **kwargs)
+        if columnar:
+            return to_columns(await self.call(method, **params, **dict(kwargs, raw=True)), self.system_perf_props)
+        return await self.call(method, **params, stream=stream, **kwargs)
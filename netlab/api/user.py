@@ -1,8 +1,13 @@
-from typing import Optional, List, Dict, Any, Union, AsyncGenerator
+import asyncio
+from collections import deque
+from typing import Optional, List, Dict, Any, Union, AsyncGenerator, Deque, Tuple, cast, overload
 from typing_extensions import Literal
 
 from .. import enums
-from ..utils import minimum_version
+from ..utils import minimum_version, IdSet
+from ..paging import PageSizer
+from ..records import Record, record_class, to_records
+from ..streaming import ResultStream
 from ._client_protocol import ClientProtocol
 
 
@@ -25,14 +30,37 @@ class UserApiMixin(ClientProtocol):
                        'com_full_name', 'com_id', 'com_max_slots_per_res', 'com_min_hours_btw_res',
                        'com_mynetlab_news', 'com_mynetlab_welcome']
 
+    @overload
+    async def user_account_list(
+            self,
+            *,
+            com_id: Optional[int] = None,
+            acc_type: Optional[enums.AccountType] = None,
+            properties: Union[List[str], Literal['all', 'default']] = "default",
+            records: Literal[True],
+            **kwargs
+        ) -> List[Record]: ...
+
+    @overload
+    async def user_account_list(
+            self,
+            *,
+            com_id: Optional[int] = None,
+            acc_type: Optional[enums.AccountType] = None,
+            properties: Union[List[str], Literal['all', 'default']] = "default",
+            records: Literal[False] = False,
+            **kwargs
+        ) -> List[Dict[str, Any]]: ...
+
     async def user_account_list(
                 self,
                 *,
                 com_id: Optional[int] = None,
                 acc_type: Optional[enums.AccountType] = None,
                 properties: Union[List[str], Literal['all', 'default']] = "default",
+                records: bool = False,
                 **kwargs
-            ) -> List[Dict[str, Any]]:
+            ) -> Union[List[Dict[str, Any]], List[Record]]:
         """
         Query a list of the user accounts in the NETLAB system. The list method
         is only restricted by community id and account types. The properties
@@ -44,6 +72,7 @@ class UserApiMixin(ClientProtocol):
         :param properties: Properties consist of any combination of properties listed below under Properties.
                            You may also use **"all"** to include all properties, or **"default"** for a smaller subset
                            of properties.
+        :param records: Return :py:class:`netlab.records.Record` objects instead of dicts.
 
         :return: A list of dictionaries (a set of records) where the dictionaries contain requested properties
             per user.
@@ -107,10 +136,21 @@ class UserApiMixin(ClientProtocol):
         if acc_type is not None:
             filters['acc_type'] = acc_type
 
-        result = []
-
-        async for user in self.user_account_search_iter(properties=properties, filter=filters, limit=500):
-            result.append(user)
+        result: List[Any] = []
+        # convert each page as it arrives, so the dicts of the whole list are never held at once
+        convert = record_class('Account', properties).from_dict if records else None
+        if records:
+            # records are made from converted rows, whatever the connection defaults to
+            kwargs.setdefault('raw', False)
+
+        # pages start at the largest limit and shrink to fit wide rows, unless the caller asks for a fixed limit
+        kwargs.setdefault('limit', None)
+        users = self.user_account_search_iter(properties=properties, filter=filters, **kwargs)
+        try:
+            async for user in users:
+                result.append(convert(user) if convert else user)
+        finally:
+            await users.aclose()
         return result
 
     @minimum_version('17.1.4')
@@ -120,7 +160,9 @@ class UserApiMixin(ClientProtocol):
                 properties: List[str] = ['acc_id'],
                 order: Optional[Union[str, List[str]]] = None,
                 filter: Any = None,  # TODO
-                limit: int = 100,
+                limit: Optional[Union[int, PageSizer]] = 100,
+                prefetch: int = 4,
+                **kwargs
             ) -> AsyncGenerator[Dict[str, Any], None]:
         """
         This method queries and/or retrieves user accounts.
@@ -133,7 +175,13 @@ class UserApiMixin(ClientProtocol):
         :param order: Sort order.
         :param filter: Search criteria. See below for how to use filters.
         :param limit: Page size collected in a single request from the server. This can be used to tune performace
-            over large record sets. Maximum 500.
+            over large record sets. Maximum 500. ``None`` asks for 500 and sizes each page after the first from
+            the size and latency of the pages before it, see `netlab.paging`. A :py:class:`netlab.paging.PageSizer`
+            does the same within its bounds, e.g. ``PageSizer(min_limit=100, max_limit=500, target_bytes=1024 * 1024)``.
+        :param prefetch: Number of pages requested at once after the first page. Accounts are still yielded in page
+            order, while the following pages are fetched. ``1`` requests one page at a time. A caller that stops
+            early should close the iterator, with ``contextlib.aclosing`` or by awaiting its ``aclose()``, so the
+            pages ahead are cancelled instead of running until the iterator is garbage collected.
 
         :return: A series of user accounts that match **filter**. This method returns an iterator, which can be
             used in for loops like a list. See
@@ -268,25 +316,78 @@ class UserApiMixin(ClientProtocol):
             **SELECT, FILTER, ORDER** | Timezone sort order.
         """
 
-        total_pages = 1
-        current_page = 1
-        acc_ids = set()
-
-        while current_page <= total_pages:
+        sizer = PageSizer() if limit is None else limit if isinstance(limit, PageSizer) else None
+        total_records = 1
+        next_offset = 0
+        acc_ids = IdSet()
+        window = max(prefetch, 1)
+        # pages requested but not yet yielded, in page order
+        pending: Deque['asyncio.Future[Tuple[int, Dict[str, Any], float]]'] = deque()
+        loop = asyncio.get_event_loop()
+
+        async def fetch(offset: int, size: int) -> Tuple[int, Dict[str, Any], float]:
+            start = loop.time()
+            # fixed size pages are asked for by number, sized pages by offset since their sizes differ
             data = await self.user_account_search(
-                page=current_page,
                 properties=properties,
                 order=order,
                 filter=filter,
-                limit=limit,
+                limit=size,
+                page=offset // size + 1 if sizer is None else None,
+                offset=offset if sizer is not None else None,
+                **kwargs
             )
-            current_page += 1
-            total_pages = data['total_pages']
-            for record in data['data']:
-                acc_id = record['acc_id']
-                if acc_id not in acc_ids:
-                    acc_ids.add(acc_id)
-                    yield record
+            return size, data, loop.time() - start
+
+        try:
+            while True:
+                while next_offset < total_records and len(pending) < window:
+                    size = cast(int, limit) if sizer is None else sizer.limit
+                    pending.append(asyncio.ensure_future(fetch(next_offset, size)))
+                    next_offset += size
+                if not pending:
+                    break
+                size, data, seconds = await pending.popleft()
+                total_records = data['total_records']
+                if sizer is not None:
+                    sizer.observe(size, data['data'], seconds)
+                for record in data['data']:
+                    if acc_ids.add(record['acc_id']):
+                        yield record
+        finally:
+            # the caller stopped early or a page failed, so the pages ahead are not needed
+            for task in pending:
+                if not task.cancel() and not task.cancelled():
+                    # retrieve the error of a page that already failed, so it isn't logged as unhandled
+                    task.exception()
+
+    @overload
+    async def user_account_search(
+            self,
+            *,
+            properties: List[str] = ['acc_id'],
+            order: Optional[Union[str, List[str]]] = None,
+            filter=None,
+            limit: int = 100,
+            page: Optional[int] = None,
+            offset: Optional[int] = None,
+            stream: Literal[True],
+            **kwargs
+        ) -> ResultStream: ...
+
+    @overload
+    async def user_account_search(
+            self,
+            *,
+            properties: List[str] = ['acc_id'],
+            order: Optional[Union[str, List[str]]] = None,
+            filter=None,
+            limit: int = 100,
+            page: Optional[int] = None,
+            offset: Optional[int] = None,
+            stream: Literal[False] = False,
+            **kwargs
+        ) -> Dict[str, Any]: ...
 
     @minimum_version('17.1.4')
     async def user_account_search(
@@ -294,12 +395,13 @@ class UserApiMixin(ClientProtocol):
                 *,
                 properties: List[str] = ['acc_id'],
                 order: Optional[Union[str, List[str]]] = None,
-                filter=None,  # TODO
+                filter=None,
                 limit: int = 100,
                 page: Optional[int] = None,
                 offset: Optional[int] = None,
+                stream: bool = False,
                 **kwargs
-            ) -> Dict[str, Any]:
+            ) -> Union[Dict[str, Any], ResultStream]:
         """
         This method queries and/or retrieves user accounts. Also see
         :meth:`~netlab.api.UserApiMixin.user_account_search_iter`.
@@ -318,6 +420,8 @@ class UserApiMixin(ClientProtocol):
             'total_records' with no accounts. A page that goes pass all records will return no accounts.
         :param offset: Starting record number. If page and offset are both None, no records are returned; only meta
             data about total users and pages are returned.
+        :param stream: Return a :py:class:`netlab.streaming.ResultStream` that decodes the accounts of the page as
+            they are read. The other properties, such as ``total_pages``, are in its ``info``.
 
         :return: A list of user accounts that match **filter**.
 
@@ -461,7 +565,7 @@ class UserApiMixin(ClientProtocol):
 
         return await self.call(
             'user.account.search.task', properties=properties, order=order, filter=new_filter,
-            limit=limit, page=page, offset=offset, **kwargs)
+            limit=limit, page=page, offset=offset, stream='data' if stream else False, **kwargs)
 
     async def user_account_get(
                 self,
@@ -841,7 +945,7 @@ class UserApiMixin(ClientProtocol):
         :param int com_id: Community identifier.
         """
 
-        return await self.call('user.community.remove', com_id=com_id)
+        return await self.call('user.community.remove', com_id=com_id, **kwargs)
 
     async def user_community_find(self, *, com_full_name: str, **kwargs) -> Optional[int]:
         """
@@ -907,7 +1011,7 @@ class UserApiMixin(ClientProtocol):
 
         return await self.call(method, com_id=com_id, properties=properties, **kwargs)
 
-    async def user_community_list(self, *, properties="default", sort_property="com_id", **kwargs):
+    async def user_community_list(self, *, properties="default", sort_property="com_id", records=False, **kwargs):
         """
         Retrieve a list of communities.
 
@@ -916,6 +1020,7 @@ class UserApiMixin(ClientProtocol):
         :type properties: list[str] or 'all' or 'default'
         :param str sort_property: Property to sort list by. Only **com_id** (default) and **com_full_name** are
                    valid options.
+        :param bool records: Return :py:class:`netlab.records.Record` objects instead of dicts.
 
         :return: A list of objects with the properties requested:
         :rtype: list[dict]
@@ -950,7 +1055,10 @@ class UserApiMixin(ClientProtocol):
         if properties == 'default':
             properties = self.community_default_props
 
-        return await self.call(method, properties=properties, sort_property=sort_property, **kwargs)
+        result = await self.call(method, properties=properties, sort_property=sort_property, **kwargs)
+        if records:
+            return to_records(result, 'Community', properties)
+        return result
 
     async def user_logins_system_get(self, **kwargs):
         """
@@ -1,4 +1,4 @@
-from typing import Optional, List, Any, Dict, overload
+from typing import Optional, List, Any, Dict, Union, overload
 from typing_extensions import Literal
 
 import warnings
@@ -6,6 +6,8 @@ import warnings
 from .. import enums
 from ..errors.vm import VirtualMachineDatacenterNotFoundError
 from ..utils import minimum_version
+from ..columns import Columns, to_columns
+from ..streaming import ResultStream
 
 from ._client_protocol import ClientProtocol
 
@@ -530,21 +532,61 @@ class VmApiMixin(ClientProtocol):
         method = "vm.inventory.get"
         return await self.call(method, vm_id=vm_id, **kwargs)
 
+    @overload
+    async def vm_inventory_list(
+            self,
+            *,
+            vdc_id: Optional[int] = None,
+            roles: Optional[List[str]] = None,
+            attached: Optional[bool] = None,
+            columnar: Literal[True],
+            stream: bool = False,
+            **kwargs
+        ) -> Columns: ...
+
+    @overload
+    async def vm_inventory_list(
+            self,
+            *,
+            vdc_id: Optional[int] = None,
+            roles: Optional[List[str]] = None,
+            attached: Optional[bool] = None,
+            columnar: Literal[False] = False,
+            stream: Literal[True],
+            **kwargs
+        ) -> ResultStream: ...
+
+    @overload
+    async def vm_inventory_list(
+            self,
+            *,
+            vdc_id: Optional[int] = None,
+            roles: Optional[List[str]] = None,
+            attached: Optional[bool] = None,
+            columnar: Literal[False] = False,
+            stream: Literal[False] = False,
+            **kwargs
+        ) -> List[Dict[str, Any]]: ...
+
     async def vm_inventory_list(
                 self,
                 *,
                 vdc_id: Optional[int] = None,
                 roles: Optional[List[str]] = None,
                 attached: Optional[bool] = None,
+                columnar: bool = False,
+                stream: bool = False,
                 **kwargs
-            ) -> List[Dict[str, Any]]:
+            ) -> Union[List[Dict[str, Any]], Columns, ResultStream]:
         """
         This method allows you to list the virtual machines from NETLAB+ inventory.
 
         :param vdc_id: VM Datacenter identifier.
         :param roles: Filter by specified roles.
         :param attached: List virtual machines attached to a pod.
-
+        :param columnar: Return :py:class:`netlab.columns.Columns`, one column per property, instead of dicts.
+        :param stream: Return a :py:class:`netlab.streaming.ResultStream` that decodes the rows as they are read,
+            instead of a list.
 
         :return: Returns an object with the following properties:
 
@@ -628,7 +670,10 @@ class VmApiMixin(ClientProtocol):
             params['attached'] = attached
 
         params.update(kwargs)
-        return await self.call(method, **params)
+        if columnar:
+            params['raw'] = True
+            return to_columns(await self.call(method, **params))
+        return await self.call(method, stream=stream, **params)
 
     async def vm_snapshot_add(
                 self,
@@ -24,17 +24,28 @@ of methods:
 
 
 import asyncio
+import functools
 import logging
 import uuid
 import ssl
+from collections import deque
 from weakref import WeakValueDictionary
-from typing import Any, Dict, Optional, NoReturn, Union, TYPE_CHECKING, cast
-
-from .serializer import serialize, deserialize
-from .auth import get_system_config
+from typing_extensions import Literal
+from typing import (
+    Any, Awaitable, Callable, Deque, Dict, Iterable, List, Optional, NoReturn, Set, Tuple, Union, TYPE_CHECKING, cast,
+)
+
+from .codec import get_codec, JsonCodec
+from .records import lazy_records
+from .streaming import ResultStream, stream_message
+from .serializer import NUMERIC_MODES
+from .auth import get_system_config, SystemConfig
 from .api import ClassApiMixin, PodApiMixin, ReservationApiMixin, SystemApiMixin, LabApiMixin, UserApiMixin, VmApiMixin
 from .errors import error_decode, ResponseFormatError
-from .errors.common import NetlabConnectionClosedError
+from .errors.common import NetlabConnectionClosedError, NetlabTimeoutError
+from .limiter import ConcurrencyLimiter
+from .cache import CallCache, CATALOG_TTLS
+from .framing import FrameReader, READ_CHUNK_SIZE
 from .config import NetlabServerConfig
 
 logger = logging.getLogger(__name__)
@@ -46,8 +57,36 @@ UGLY_TASKS = {
     'vm.datacenter.discover.hosts.task',
 }
 
+IDEMPOTENT_METHODS = {
+    'class.content.availability', 'class.content.list', 'class.get', 'class.list', 'class.roster.get',
+    'class.roster.list',
+    'history.reservation.get',
+    'internal.mbusd.ping',
+    'lab.exercise.list',
+    'pod.acl.admin.auth', 'pod.acl.admin.list', 'pod.acl.admin.pods', 'pod.acl.get', 'pod.acl.list', 'pod.get',
+    'pod.list', 'pod.list.used_ids', 'pod.pc.get', 'pod.types.get', 'pod.types.list',
+    'reservation.get', 'reservation.query', 'reservation.summary', 'reservation.time.delta',
+    'reservation.time.now', 'reservation.time.offset',
+    'system.perf.query', 'system.status.get', 'system.time.timezone.get', 'system.time.timezone.list',
+    'system.usage.cpu', 'system.usage.disk', 'system.usage.memory',
+    'task.check',
+    'user.account.get', 'user.account.search.task', 'user.community.find', 'user.community.get',
+    'user.community.list', 'user.logins.system.get', 'user.session.keepalive',
+    'vm.datacenter.get', 'vm.datacenter.list', 'vm.host.get', 'vm.host.list', 'vm.host.perf.realtime.list',
+    'vm.inventory.get', 'vm.license.list', 'vm.snapshot.get.list.task', 'vm.snapshot.get.tree.task',
+}
+"Read only methods that are safe to send again after a reconnect."
+
+WRITE_HIGH_WATER = 64 * 1024
+"Bytes of queued frames that are written without waiting for the coalescing window."
+
+RECONNECT_INITIAL_DELAY = 0.05
+RECONNECT_RETRIES = 3
+
+DecodeMode = Union[bool, Literal['bytes', 'lazy', 'float', 'stream']]
+
 if TYPE_CHECKING:  # TODO python3.9 or mypy version
-    EventQueue = asyncio.Queue[asyncio.Future[Dict[str, Any]]]
+    EventQueue = asyncio.Queue[Any]
     NoReturnTask = asyncio.Future[NoReturn]
     AnyFuture = asyncio.Future[Any]
 else:
@@ -58,6 +97,9 @@ else:
 
 __all__ = ['NetlabClient', 'NetlabConnection', 'EventStream']
 
+_CLOSED = object()
+"Placed on subscription queues when the connection is lost."
+
 
 class EventStream(object):
     """
@@ -114,15 +156,17 @@ class EventStreamFactory(object):
             event=self._event,
             criteria=self._criteria,
             handle=self._handle)
+        self._connection._subscriptions[self._handle] = (self._event, self._criteria)
         logger.debug('subscription created %s %s', self._handle, self._event)
         es = EventStream(self._connection, self._queue)
 
         return es
 
     async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        self._connection._subscriptions.pop(self._handle, None)
         if self._connection.alive():
             await self._connection.call('event.unsubscribe', handle=self._handle, event=self._event)
-            del self._connection._event_mapping[self._handle]
+            self._connection._event_mapping.pop(self._handle, None)
             logger.debug('subscription deleted %s %s', self._handle, self._event)
 
 
@@ -141,171 +185,687 @@ class NetlabConnection(ClassApiMixin, PodApiMixin, ReservationApiMixin, SystemAp
         self._writer: asyncio.StreamWriter = writer
         self._config = config
         self._event_mapping: WeakValueDictionary[uuid.UUID, EventQueue] = WeakValueDictionary()
+        self._pending: Dict[uuid.UUID, AnyFuture] = {}
+        self._subscriptions: Dict[uuid.UUID, Tuple[str, Dict[str, Any]]] = {}
+        self._closed_cause: Optional[BaseException] = None
+        self._closed = False
+        self._closing = False
+        self._ready = asyncio.Event()
+        self._ready.set()
+        self._reconnect_task: Optional[AnyFuture] = None
+        self._in_flight = 0
+        self._write_buffer: List[bytes] = []
+        self._write_buffer_size = 0
+        self._flush_handle: Optional[asyncio.Handle] = None
+        self._drain_task: Optional[AnyFuture] = None
+        self._decode_error: Optional[Exception] = None
+        self._codec = get_codec(config.json_codec)
+        self._default_mode = self._mode(None, None, None)
+        # calls whose decode mode differs from the connection's default
+        self._decode_modes: Dict[uuid.UUID, DecodeMode] = {}
+        # calls whose result frame is passed on undecoded, by id as it appears in frames
+        self._streams: Set[str] = set()
+
+        self.limiter: Optional[ConcurrencyLimiter] = None
+        "Limits calls in flight when ``max_in_flight``, ``adaptive_concurrency`` or ``method_max_in_flight`` is set."
+        if config.max_in_flight or config.adaptive_concurrency or config.method_max_in_flight:
+            self.limiter = ConcurrencyLimiter(
+                int(config.max_in_flight) if config.max_in_flight else None,
+                adaptive=bool(config.adaptive_concurrency),
+                method_max_in_flight=config.method_max_in_flight)
+
+        self.cache: Optional[CallCache] = None
+        "Caches the results of the methods in ``cache_ttl``, and of catalog methods when ``cache`` is set."
+        ttls = dict(CATALOG_TTLS) if config.cache else {}
+        ttls.update(config.cache_ttl or {})
+        if any(ttls.values()):
+            self.cache = CallCache(ttls, int(config.cache_size))
 
     async def _connect(self) -> None:
+        self._start()
+        await self._authenticate()
+        # the version is a string either way, raw keeps a connection that defaults to bytes from breaking it
+        result = await self.system_status_get(raw=True)
+        self._server_version = result['sys_sdn_version']
+
+    def _start(self) -> None:
         self._event_handler_task = asyncio.ensure_future(self._event_handler())
         self._keep_alive_task = asyncio.ensure_future(self._keep_alive())
+        self._event_handler_task.add_done_callback(self._connection_lost)
+        self._keep_alive_task.add_done_callback(self._connection_lost)
+
+    def _stop(self) -> None:
+        # frames not yet written were meant for this socket, their calls fail with it
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._write_buffer = []
+        self._write_buffer_size = 0
+        self._writer.close()
+        self._keep_alive_task.cancel()
+        self._event_handler_task.cancel()
+
+    async def _authenticate(self) -> None:
         config = self._config
-        await self.call('user.authenticate', user=config.user, token=config.token)
-        result = await self.system_status_get()
-        self._server_version = result['sys_sdn_version']
+        await self._dispatch('user.authenticate', {'user': config.user, 'token': config.token})
 
     async def _disconnect(self) -> None:
-        self._writer.close()
+        self._closing = True
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+        self._stop()
         # await self._writer.wait_closed()
-        self._keep_alive_task.cancel()
-        self._event_handler_task.cancel()
         await asyncio.wait([self._event_handler_task, self._keep_alive_task])
+        self._close()
+
+    def _connection_lost(self, task: NoReturnTask) -> None:
+        """
+        Called when either background task stops. Fails every call still waiting on a response. Unless the
+        connection is set to reconnect, also wakes every subscription so nothing waits forever on a dead socket.
+        """
+        if self._closed or task not in (self._event_handler_task, self._keep_alive_task):
+            return
+        if not task.cancelled():
+            self._closed_cause = task.exception()
+
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(self._closed_error())
+
+        if self._closing or not self._config.reconnect:
+            self._close()
+        elif self._ready.is_set():
+            logger.warning('connection to %s lost, reconnecting', self._config.host)
+            self._ready.clear()
+            self._reconnect_task = asyncio.ensure_future(self._reconnect())
+
+    def _close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        # wake anything waiting for a reconnect so it sees the connection is closed
+        self._ready.set()
+        for queue in list(self._event_mapping.values()):
+            queue.put_nowait(_CLOSED)
+
+    async def _reconnect(self) -> None:
+        """
+        Reopen the socket with exponential backoff, authenticate again and replay every live subscription.
+        Calls made in the meantime wait until this finishes.
+        """
+        config = self._config
+        loop = asyncio.get_event_loop()
+        give_up = loop.time() + float(config.reconnect_timeout)
+        delay = RECONNECT_INITIAL_DELAY
+
+        try:
+            while True:
+                self._stop()
+                try:
+                    # a connect or login that never answers must not outlast reconnect_timeout
+                    await asyncio.wait_for(self._reopen(), give_up - loop.time())
+                    break
+                except (OSError, asyncio.IncompleteReadError, NetlabConnectionClosedError, asyncio.TimeoutError) as e:
+                    if loop.time() + delay > give_up:
+                        raise NetlabConnectionClosedError('Could not reconnect to {}.'.format(config.host)) from e
+                    logger.debug('reconnect to %s failed, retrying in %ss: %s', config.host, delay, e)
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, float(config.reconnect_max_delay))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning('giving up on connection to %s: %s', config.host, e)
+            self._closed_cause = e
+            self._stop()
+            self._close()
+            return
+
+        logger.warning('reconnected to %s', config.host)
+        self._ready.set()
+
+    async def _reopen(self) -> None:
+        self._reader, self._writer = await _open_streams(self._config)
+        self._start()
+        await self._authenticate()
+        await self._resubscribe()
+
+    async def _resubscribe(self) -> None:
+        for handle, (event, criteria) in list(self._subscriptions.items()):
+            if handle not in self._event_mapping:
+                # the subscription's queue was garbage collected
+                del self._subscriptions[handle]
+                continue
+            await self._dispatch('event.subscribe', {'event': event, 'criteria': criteria, 'handle': handle})
+            logger.debug('subscription replayed %s %s', handle, event)
+
+    async def _wait_ready(self) -> None:
+        if not self._ready.is_set():
+            await self._ready.wait()
+        if self._closed:
+            raise self._closed_error()
+
+    def _closed_error(self) -> NetlabConnectionClosedError:
+        error = NetlabConnectionClosedError()
+        error.__cause__ = self._closed_cause
+        return error
+
+    def _register(self, ident: uuid.UUID, mode: DecodeMode = False) -> AnyFuture:
+        if self._closed:
+            raise self._closed_error()
+        future: AnyFuture = asyncio.get_event_loop().create_future()
+        self._pending[ident] = future
+        if mode != self._default_mode:
+            self._decode_modes[ident] = mode
+        if mode == 'stream':
+            self._streams.add(str(ident))
+        return future
+
+    def _unregister(self, ident: uuid.UUID) -> None:
+        self._pending.pop(ident, None)
+        if self._decode_modes.pop(ident, None) == 'stream':
+            self._streams.discard(str(ident))
 
     async def _keep_alive(self) -> NoReturn:
         while True:
             await asyncio.sleep(15)
             try:
-                await asyncio.wait_for(self.call('internal.mbusd.ping'), 2.0)
+                await asyncio.wait_for(self._dispatch('internal.mbusd.ping', {}), 2.0)
             except asyncio.TimeoutError as e:
                 logger.debug('keep alive packet lost')
                 raise NetlabConnectionClosedError("Keep alive packet lost.") from e
             logger.debug('keep alive packet sent')
 
     async def _event_handler(self) -> NoReturn:
-        while True:
-            bmsg = await self._reader.readuntil(b'\n')
-            logger.debug('data <--- %s', bmsg)
-
-            msg = deserialize(bmsg.decode('utf-8'))
-
-            if 'id' in msg:
-                ident = uuid.UUID(msg['id'])
-                payload = msg
-            elif 'handle' in msg:
-                ident = uuid.UUID(msg['handle'])
-                payload = msg['params']
-            else:
-                raise ResponseFormatError('message did not contain "handle" or "id"')
-
-            queue = self._event_mapping.get(ident)
+        limit = self._config.message_byte_limit
+        frames = FrameReader(self._reader, int(limit) if limit else None)
+        threshold = self._config.decode_offload_threshold
+        loop = asyncio.get_event_loop()
+        # decoded messages held back so notifications are delivered in the order they arrived
+        backlog: Deque[AnyFuture] = deque()
+        task = asyncio.current_task()
+        assert task is not None
+        drain_backlog = functools.partial(self._drain_backlog, backlog, task)
+        try:
+            while True:
+                bmsg = await frames.read_frame()
+                logger.debug('data <--- %s', bmsg)
+
+                # a streamed result is decoded by the caller as it reads the rows, see netlab.streaming
+                msg = stream_message(bmsg, self._streams) if self._streams else None
+                if msg is None:
+                    offload = threshold and len(bmsg) >= threshold
+                    decode: Callable[[bytes], Any]
+                    if self._decode_modes or self._default_mode:
+                        # a frame decoded off the loop needs the modes as they are now, one decoded here can read
+                        # them as they are
+                        modes = dict(self._decode_modes) if offload else self._decode_modes
+                        decode = functools.partial(_decode_frame, self._codec, modes=modes, default=self._default_mode)
+                    else:
+                        decode = self._codec.decode
+
+                    if offload:
+                        # large frames are decoded off the loop so pings and small replies keep flowing
+                        decoded = loop.run_in_executor(self._config.decode_executor, decode, bmsg)
+                        backlog.append(decoded)
+                        decoded.add_done_callback(drain_backlog)
+                        continue
+
+                    # frames go to the codec as bytes, without a decode to str of our own
+                    msg = decode(bmsg)
+
+                if backlog and 'id' not in msg:
+                    ready: AnyFuture = loop.create_future()
+                    ready.set_result(msg)
+                    backlog.append(ready)
+                    continue
+
+                self._handle_message(msg)
+                # a streamed frame is read by its caller from here on, don't keep it alive while waiting
+                del bmsg, msg
+        except asyncio.CancelledError:
+            if self._decode_error is not None:
+                error, self._decode_error = self._decode_error, None
+                raise error
+            raise
+        finally:
+            for decoded in backlog:
+                decoded.remove_done_callback(drain_backlog)
 
-            if queue is None:
-                continue
+    def _drain_backlog(self, backlog: Deque[AnyFuture], reader_task: AnyFuture, _: AnyFuture) -> None:
+        try:
+            while backlog and backlog[0].done():
+                self._handle_message(backlog.popleft().result())
+        except Exception as e:
+            # fail the connection the same way a bad frame read in line does
+            backlog.clear()
+            self._decode_error = e
+            reader_task.cancel()
+
+    def _handle_message(self, msg: Dict[str, Any]) -> None:
+        if 'id' in msg:
+            future = self._pending.pop(uuid.UUID(msg['id']), None)
+            payload = msg
+        elif 'handle' in msg:
+            ident = uuid.UUID(msg['handle'])
+            future = self._pending.pop(ident, None)
+            if future is None:
+                queue = self._event_mapping.get(ident)
+                if queue is not None:
+                    queue.put_nowait(msg)
+                return
+            if 'params' not in msg:
+                future.set_exception(ResponseFormatError('message did not contain "params"'))
+                return
+            payload = msg['params']
+        else:
+            raise ResponseFormatError('message did not contain "handle" or "id"')
 
-            responder: AnyFuture = asyncio.Future()
+        if future is None or future.done():
+            return
 
-            if 'result' in payload or 'event' in msg:
-                responder.set_result(msg)
-                queue.put_nowait(responder)
-            elif 'error' in payload:
-                responder.set_exception(error_decode(msg['error']))
-                queue.put_nowait(responder)
-            else:
-                raise ResponseFormatError('message did not contain "result" or "error"')
+        if 'result' in payload:
+            future.set_result(payload['result'])
+        elif payload.get('error') is not None:
+            future.set_exception(error_decode(payload['error']))
+        else:
+            future.set_exception(ResponseFormatError('message did not contain "result" or "error"'))
 
-    async def _call_method(self, ident: uuid.UUID, data: Dict[str, Any]) -> Any:
-        msg = serialize(data)
-        bmsg = msg.encode('utf-8') + b'\n'
+    def _encode(self, data: Dict[str, Any]) -> bytes:
+        bmsg = self._codec.encode_request(data['id'], data['method'], data['params'])
         logger.debug('data ---> %s', bmsg)
-        self._writer.write(bmsg)
+        return bmsg
 
+    async def _send(self, *frames: bytes) -> None:
+        """
+        Write frames. The first frame goes out immediately, frames sent after it in the same event loop
+        iteration, or within the ``write_coalesce_window``, are gathered into a single write. Waits only while
+        the transport's buffer is full.
+        """
+        window = self._config.write_coalesce_window
+        if self._flush_handle is None and not window:
+            # nothing else is waiting to go out, so send now and gather what follows in this iteration
+            self._writer.writelines(frames)
+            self._flush_handle = asyncio.get_event_loop().call_soon(self._flush)
+        else:
+            self._write_buffer.extend(frames)
+            self._write_buffer_size += sum(map(len, frames))
+
+            if self._write_buffer_size >= WRITE_HIGH_WATER:
+                self._flush()
+            elif self._flush_handle is None:
+                self._flush_handle = asyncio.get_event_loop().call_later(float(window), self._flush)
+
+        if self._writer.transport.get_write_buffer_size() > WRITE_HIGH_WATER:
+            await self._drain()
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._write_buffer:
+            self._writer.writelines(self._write_buffer)
+            self._write_buffer = []
+            self._write_buffer_size = 0
+
+    async def _drain(self) -> None:
+        # callers share one drain so concurrent senders don't each wait on the transport
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = asyncio.ensure_future(self._writer.drain())
         try:
-            await self._writer.drain()
+            await asyncio.shield(self._drain_task)
         except ConnectionResetError as e:
             raise NetlabConnectionClosedError() from e
 
-        queue: EventQueue = asyncio.Queue()
-        self._event_mapping[ident] = queue
-
-        msg = await self._wait_next_event(queue)
-
-        if 'result' in msg:
-            return msg['result']
-        elif msg.get('error') is not None:
-            raise error_decode(msg['error'])
-        else:
-            raise ResponseFormatError('message did not contain "result" or "error"')
-
-    async def _call_task(self, ident: uuid.UUID, data: Dict[str, Any]) -> Any:
+    def _prepare_task(self, data: Dict[str, Any], mode: DecodeMode = False) -> uuid.UUID:
         handle = uuid.uuid4()
-        queue: EventQueue = asyncio.Queue()
-        self._event_mapping[handle] = queue
+        self._register(handle, mode)
 
         data['params']['notify_complete'] = True
         data['params']['notify_handle'] = handle
+        return handle
 
-        await self._call_method(ident, data)
-
-        result = await self._wait_next_event(queue)
+    async def _call_method(self, ident: uuid.UUID, data: Dict[str, Any], mode: DecodeMode = False) -> Any:
+        future = self._register(ident, mode)
+        try:
+            await self._send(self._encode(data))
+            return await future
+        finally:
+            self._unregister(ident)
 
-        if 'params' not in result:
-            raise ResponseFormatError('message did not contain "params"')
-        msg = result['params']
+    async def _call_task(self, ident: uuid.UUID, data: Dict[str, Any], mode: DecodeMode = False) -> Any:
+        handle = self._prepare_task(data, mode)
+        completion = self._pending[handle]
 
-        if 'result' in msg:
-            return msg['result']
-        elif msg.get('error') is not None:
-            raise error_decode(msg['error'])
-        else:
-            raise ResponseFormatError('message did not contain "result" or "error"')
+        try:
+            # the reply only acknowledges the task, a streamed result arrives with its completion
+            await self._call_method(ident, data, True if mode == 'stream' else mode)
+            return await completion
+        finally:
+            self._unregister(handle)
 
-    async def _call_task_ugly(self, ident: uuid.UUID, data: Dict[str, Any]) -> Any:
-        task_id = await self._call_method(ident, data)
+    async def _call_task_ugly(self, ident: uuid.UUID, data: Dict[str, Any], mode: DecodeMode = False) -> Any:
+        task_id = await self._call_method(ident, data, bool(mode))
+        return await self._poll_task(task_id, mode)
 
+    async def _poll_task(self, task_id: Any, mode: DecodeMode = False) -> Any:
         while True:
-            status = await self.call('task.check', task_id=task_id)
+            # the status itself is always needed as a plain dict
+            status = await self._dispatch('task.check', {'task_id': task_id}, bool(mode))
             if status['is_complete']:
+                if mode == 'bytes':
+                    return self._codec.encode(status['result'])
+                if mode == 'lazy':
+                    return lazy_records(status['result'])
+                if mode == 'float':
+                    return self._codec.convert(status['result'], numeric='float')
                 return status['result']
             await asyncio.sleep(1)
 
     async def _wait_next_event(self, queue: EventQueue) -> Any:
-        queue_task: AnyFuture = asyncio.ensure_future(queue.get())
-
-        try:
-            completed_tasks, _ = await asyncio.wait(
-                    [queue_task, self._keep_alive_task, self._event_handler_task],
-                    return_when=asyncio.FIRST_COMPLETED,
-                )
-
-            completed_task = completed_tasks.pop()
-
-            if completed_task is queue_task:
-                future = completed_task.result()
-                result = await future
-                return result
-            else:
-                raise NetlabConnectionClosedError() from completed_task.exception()
-        finally:
-            queue_task.cancel()
-            try:
-                await queue_task
-            except asyncio.CancelledError:
-                pass
+        msg = await queue.get()
+        if msg is _CLOSED:
+            # leave the marker for any other reader of this subscription
+            queue.put_nowait(_CLOSED)
+            raise self._closed_error()
+        return msg
 
     def alive(self) -> bool:
+        if self._closed or not self._ready.is_set():
+            return False
         return not bool(self._keep_alive_task.done() or self._event_handler_task.done())
 
-    async def call(self, method: str, **kwargs: Any) -> Any:
+    async def call(
+                self,
+                method: str,
+                *,
+                timeout: Optional[float] = None,
+                deadline: Optional[float] = None,
+                raw: Optional[Union[bool, Literal['bytes']]] = None,
+                lazy: Optional[bool] = None,
+                numeric: Optional[Literal['decimal', 'float']] = None,
+                stream: Union[bool, str] = False,
+                **kwargs: Any
+            ) -> Any:
         """
+        Send a call and wait for its result. Results of the methods in :py:attr:`cache` are read from it while
+        they are cached.
 
         :param method: The NETLAB+ method name.
+        :param timeout: Seconds to wait for the call to complete, including the completion of task methods.
+            Defaults to the ``call_timeout`` config option. Every higher level method accepts this as well.
+        :param deadline: Time, on the event loop's clock (``asyncio.get_event_loop().time()``), by which the call
+            must complete. If both **timeout** and **deadline** are given, the earlier one applies.
+        :param raw: ``True`` returns the result as the server sent it, skipping field conversion, e.g. timestamps
+            stay strings. ``'bytes'`` returns the result encoded as JSON. Defaults to the ``raw`` config option.
+            Every higher level method accepts this as well, though some expect converted results.
+        :param lazy: Return objects as :py:class:`netlab.records.LazyRecord`, converting each field on first
+            access. Defaults to the ``lazy`` config option.
+        :param numeric: ``'float'`` converts `netlab.serializer.DECIMAL_FIELDS`, such as ``idle_pct`` and
+            ``sp_value``, to `float` instead of `decimal.Decimal`, with ``nan`` for blank values. It applies to
+            converted results, not raw or lazy ones. Defaults to the ``numeric`` config option.
+        :param stream: ``True`` returns a :py:class:`netlab.streaming.ResultStream` over the rows of a list result,
+            decoding and converting each row as it is read. The name of a property, such as ``'data'``, streams
+            the list in that property of an object result. **raw**, **lazy** and **numeric** apply to each row.
         :param kwargs: The arguments to pass to netlab.
 
+        :raises netlab.errors.common.NetlabTimeoutError: The call did not complete in time.
+
         .. warning::
 
             In most cases, it is better to use the higher level methods, rather than this
             low level method.
         """
+        deadline = self._deadline(timeout, deadline)
+        mode = self._mode(raw, lazy, numeric)
+        cache = self.cache
+        if stream:
+            result = await self._call(method, kwargs, deadline, 'stream')
+            return ResultStream(result, self._codec, mode, None if stream is True else stream)
+        if cache is not None and method in cache.ttls:
+            # the deadline bounds waiting for another call's fetch, as well as this call's own
+            data = await self._until(
+                cache.get(method, kwargs, lambda: self._call(method, kwargs, deadline, 'bytes')), deadline, method)
+            return _decode_result(self._codec, data, mode)
+        return await self._call(method, kwargs, deadline, mode)
+
+    async def _call(self, method: str, params: Dict[str, Any], deadline: Optional[float], mode: DecodeMode) -> Any:
+        retries = RECONNECT_RETRIES if self._config.reconnect and method in IDEMPOTENT_METHODS else 0
+
+        self._in_flight += 1
+        try:
+            while True:
+                if not self._ready.is_set():
+                    await self._until(self._wait_ready(), deadline, method)
+                try:
+                    return await self._limited_dispatch(method, params, deadline, mode)
+                except NetlabConnectionClosedError:
+                    if retries <= 0 or self._closed:
+                        raise
+                    retries -= 1
+                    logger.debug('retrying %s after reconnect', method)
+        finally:
+            self._in_flight -= 1
+
+    def _mode(self, raw: Optional[Union[bool, str]], lazy: Optional[bool], numeric: Optional[str]) -> DecodeMode:
+        if numeric is not None and numeric not in NUMERIC_MODES:
+            raise ValueError("numeric must be one of {}, not {!r}.".format(NUMERIC_MODES, numeric))
+        if raw is None:
+            # asking for lazy records or floats overrides a connection that defaults to raw
+            raw = False if lazy or numeric == 'float' else self._config.raw
+        if raw:
+            return cast(DecodeMode, raw)
+        if lazy is None:
+            lazy = False if numeric == 'float' else self._config.lazy
+        if lazy:
+            return 'lazy'
+        if numeric is None:
+            numeric = self._config.numeric
+        return 'float' if numeric == 'float' else False
+
+    def _deadline(self, timeout: Optional[float], deadline: Optional[float]) -> Optional[float]:
+        if timeout is None:
+            timeout = self._config.call_timeout
+        if timeout is not None:
+            expires = asyncio.get_event_loop().time() + float(timeout)
+            deadline = expires if deadline is None else min(deadline, expires)
+        return deadline
+
+    async def _until(self, aw: Awaitable[Any], deadline: Optional[float], method: str) -> Any:
+        """
+        Await **aw**, cancelling it if **deadline** passes first. Cancelling a call removes its pending entries.
+        """
+        if deadline is None:
+            return await aw
+
+        remaining = deadline - asyncio.get_event_loop().time()
+        try:
+            if remaining <= 0:
+                raise asyncio.TimeoutError()
+            return await asyncio.wait_for(aw, remaining)
+        except asyncio.TimeoutError as e:
+            if isinstance(e, NetlabTimeoutError):
+                raise
+            if asyncio.iscoroutine(aw):
+                aw.close()
+            raise _deadline_error(method) from e
+
+    async def _limited_dispatch(
+                self,
+                method: str,
+                params: Dict[str, Any],
+                deadline: Optional[float] = None,
+                mode: DecodeMode = False,
+            ) -> Any:
+        limiter = self.limiter
+        if limiter is None:
+            return await self._until(self._dispatch(method, params, mode), deadline, method)
+
+        await self._until(limiter.acquire(method), deadline, method)
+        loop = asyncio.get_event_loop()
+        start = loop.time()
+        overloaded = False
+        try:
+            return await self._until(self._dispatch(method, params, mode), deadline, method)
+        except (NetlabConnectionClosedError, asyncio.TimeoutError):
+            overloaded = True
+            raise
+        finally:
+            limiter.release(method, loop.time() - start, overloaded)
+
+    async def _dispatch(self, method: str, params: Dict[str, Any], mode: DecodeMode = False) -> Any:
         ident = uuid.uuid4()
         data = {
             'id': ident,
             'jsonrpc': '2.0',
             'method': method,
-            'params': kwargs
+            'params': params
         }
 
         if method in UGLY_TASKS:
-            return await self._call_task_ugly(ident, data)
+            return await self._call_task_ugly(ident, data, mode)
         elif method.endswith('.task'):
-            return await self._call_task(ident, data)
+            return await self._call_task(ident, data, mode)
         else:
-            return await self._call_method(ident, data)
+            return await self._call_method(ident, data, mode)
+
+    async def call_many(
+                self,
+                calls: Iterable[Tuple[str, Dict[str, Any]]],
+                *,
+                timeout: Optional[float] = None,
+                deadline: Optional[float] = None,
+                raw: Optional[Union[bool, Literal['bytes']]] = None,
+                lazy: Optional[bool] = None,
+                numeric: Optional[Literal['decimal', 'float']] = None,
+            ) -> List[Any]:
+        """
+        Send several calls in a single write and wait for all of their responses.
+
+        Every request is written to the socket before any response is awaited, so a batch of calls costs
+        roughly one round trip instead of one round trip per call. Task methods are supported. When the
+        connection has a :py:attr:`limiter`, the batch is sent in pieces as slots in its window free up.
+
+        :param calls: ``(method, params)`` pairs, where **params** are the arguments that would be passed to
+            :meth:`call`.
+        :param timeout: Seconds to wait for each call, see :meth:`call`. Calls that time out return a
+            :py:class:`netlab.errors.common.NetlabTimeoutError`.
+        :param deadline: Time by which every call must complete, see :meth:`call`.
+        :param raw: Skip field conversion for every call, see :meth:`call`.
+        :param lazy: Return lazily converted records for every call, see :meth:`call`.
+        :param numeric: Convert decimal fields to `float` for every call, see :meth:`call`.
+
+        :return: The results in the same order as **calls**. If a call fails, its exception is returned in
+            its place instead of being raised.
+
+        **Usage**
+
+        ::
+
+            results = await client.call_many([
+                ('pod.get', {'pod_id': 1001}),
+                ('pod.get', {'pod_id': 1002}),
+            ])
+
+        .. warning::
+
+            In most cases, it is better to use the higher level methods, rather than this
+            low level method.
+        """
+        deadline = self._deadline(timeout, deadline)
+        mode = self._mode(raw, lazy, numeric)
+        if not self._ready.is_set():
+            await self._until(self._wait_ready(), deadline, 'call_many')
+
+        limiter = self.limiter
+        entries = []
+        frames: List[bytes] = []
+        waits = []
+        # the error of each call that was never sent, None for the calls that were
+        unsent: List[Optional[NetlabTimeoutError]] = []
+        try:
+            remaining = iter(calls)
+            for method, params in remaining:
+                if limiter is not None and not limiter.try_acquire(method):
+                    # the window is full, send what is batched so far while waiting for a slot
+                    if frames:
+                        await self._send(*frames)
+                        frames = []
+                    try:
+                        await self._until(limiter.acquire(method), deadline, method)
+                    except NetlabTimeoutError as e:
+                        # the deadline passed, so neither this call nor those after it are sent, while the calls
+                        # already sent keep their results
+                        unsent.append(e)
+                        unsent.extend(_deadline_error(method) for method, _ in remaining)
+                        break
+
+                ident = uuid.uuid4()
+                data = {
+                    'id': ident,
+                    'jsonrpc': '2.0',
+                    'method': method,
+                    'params': dict(params),
+                }
+                handle = None
+                completion = None
+                try:
+                    ugly = method in UGLY_TASKS
+                    if method.endswith('.task') and not ugly:
+                        handle = self._prepare_task(data, mode)
+                        completion = self._pending[handle]
+                    reply = self._register(ident, bool(mode) if ugly else mode)
+                except BaseException:
+                    if limiter is not None:
+                        limiter.release(method, 0.0)
+                    raise
+                entries.append((ident, handle))
+                frames.append(self._encode(data))
+                self._in_flight += 1
+                wait = asyncio.ensure_future(self._until(
+                    self._wait_many_entry(reply, completion, ugly, mode), deadline, method))
+                if limiter is not None:
+                    wait.add_done_callback(self._release_callback(method))
+                waits.append(wait)
+                unsent.append(None)
+
+            if frames:
+                await self._send(*frames)
+            results = iter(await asyncio.gather(*waits, return_exceptions=True))
+            return [next(results) if error is None else error for error in unsent]
+        finally:
+            for wait in waits:
+                wait.cancel()
+            self._in_flight -= len(entries)
+            for ident, handle in entries:
+                self._unregister(ident)
+                if handle is not None:
+                    self._unregister(handle)
+
+    async def _wait_many_entry(
+                self,
+                reply: AnyFuture,
+                completion: Optional[AnyFuture],
+                ugly: bool,
+                mode: DecodeMode,
+            ) -> Any:
+        result = await reply
+        if completion is not None:
+            return await completion
+        if ugly:
+            return await self._poll_task(result, mode)
+        return result
+
+    def _release_callback(self, method: str) -> Callable[[AnyFuture], None]:
+        loop = asyncio.get_event_loop()
+        start = loop.time()
+
+        def release(future: AnyFuture) -> None:
+            overloaded = not future.cancelled() and isinstance(
+                future.exception(), (NetlabConnectionClosedError, asyncio.TimeoutError))
+            assert self.limiter is not None
+            self.limiter.release(method, loop.time() - start, overloaded)
+        return release
 
     def subscribe(self, event: str, **criteria: Any) -> EventStreamFactory:
         """
@@ -323,6 +883,94 @@ class NetlabConnection(ClassApiMixin, PodApiMixin, ReservationApiMixin, SystemAp
         return es
 
 
+def _deadline_error(method: str) -> NetlabTimeoutError:
+    return NetlabTimeoutError('{} did not complete before its deadline.'.format(method))
+
+
+def _decode_frame(codec: JsonCodec, frame: bytes, modes: Dict[uuid.UUID, DecodeMode], default: DecodeMode) -> Any:
+    """
+    Decode a frame, converting its fields as the call it answers asked: raw, lazy or with floats for decimals.
+    """
+    msg = codec.decode_raw(frame)
+    ident = None
+    if type(msg) is dict:
+        ident = msg.get('id', msg.get('handle'))
+    mode = modes.get(uuid.UUID(ident), default) if isinstance(ident, str) else default
+
+    if not mode:
+        codec.convert(msg)
+    elif mode == 'float':
+        codec.convert(msg, numeric='float')
+    elif mode == 'bytes' or mode == 'lazy':
+        payload = msg if 'id' in msg else msg.get('params')
+        if isinstance(payload, dict) and 'result' in payload:
+            result = payload['result']
+            payload['result'] = codec.encode(result) if mode == 'bytes' else lazy_records(result)
+    return msg
+
+
+def _decode_result(codec: JsonCodec, data: bytes, mode: DecodeMode) -> Any:
+    """
+    Decode a result received with ``raw='bytes'`` as a call in **mode** would have received it.
+    """
+    if mode == 'bytes':
+        return data
+    if not mode:
+        return codec.decode(data)
+    result = codec.decode_raw(data)
+    if mode == 'lazy':
+        return lazy_records(result)
+    if mode == 'float':
+        return codec.convert(result, numeric='float')
+    return result
+
+
+async def open_connection(config: SystemConfig) -> NetlabConnection:
+    """
+    Open and authenticate a single :py:class:`NetlabConnection` described by **config**.
+
+    :meta private:
+    """
+    try:
+        reader, writer = await _open_streams(config)
+    except ConnectionAbortedError as e:
+        raise NetlabConnectionClosedError() from e
+    client = NetlabConnection(reader, writer, config)
+    try:
+        await client._connect()
+        logger.debug('completed connection to %s', config.host)
+    except Exception:
+        await client._disconnect()
+        raise
+    return client
+
+
+async def _open_streams(config: SystemConfig) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    logger.debug('connecting to %s', config.host)
+
+    ssl_context: Optional[ssl.SSLContext]
+    if not config.ssl:
+        ssl_context = None
+    elif isinstance(config.ssl, ssl.SSLContext):
+        ssl_context = config.ssl
+    else:
+        ssl_context = ssl.create_default_context()
+        if config.ssl_ciphers:
+            ssl_context.set_ciphers(config.ssl_ciphers)
+        if config.ssl == 'self_signed':
+            ssl_context.check_hostname = False
+            ssl_context.verify_mode = ssl.CERT_NONE
+        if cast(Any, config.ssl) not in ('default', 'self_signed'):
+            logging.warning("`ssl` should be an `ssl.SSLContext`, `'default'`, or `'self_signed'`.")
+
+    reader, writer = await asyncio.open_connection(
+        host=config.host, port=config.port, ssl=ssl_context,
+        server_hostname=config.server_hostname if ssl_context is not None else None,
+        limit=READ_CHUNK_SIZE)
+    logger.debug('tcp connection to %s', config.host)
+    return reader, writer
+
+
 class NetlabClient(object):
     """
     Async Context Manager for creating connections to NETLAB+.
@@ -345,38 +993,8 @@ class NetlabClient(object):
 
     async def __aenter__(self) -> NetlabConnection:
         assert self._connection is None
-        config = self._config
-        try:
-            logger.debug('connecting to %s', config.host)
-
-            ssl_context: ssl.SSLContext
-            if isinstance(config.ssl, ssl.SSLContext):
-                ssl_context = config.ssl
-            else:
-                ssl_context = ssl.create_default_context()
-                if self._config.ssl_ciphers:
-                    ssl_context.set_ciphers(self._config.ssl_ciphers)
-                if config.ssl == 'self_signed':
-                    ssl_context.check_hostname = False
-                    ssl_context.verify_mode = ssl.CERT_NONE
-                if cast(Any, config.ssl) not in ('default', 'self_signed'):
-                    logging.warning("`ssl` should be an `ssl.SSLContext`, `'default'`, or `'self_signed'`.")
-
-            reader, writer = await asyncio.open_connection(
-                host=config.host, port=config.port, ssl=ssl_context,
-                server_hostname=config.server_hostname, limit=config.message_byte_limit)
-            logger.debug('tcp connection to %s', config.host)
-        except ConnectionAbortedError as e:
-            raise NetlabConnectionClosedError() from e
-        client = NetlabConnection(reader, writer, config)
-        self._connection = client
-        try:
-            await client._connect()
-            logger.debug('completed connection to %s', config.host)
-        except Exception:
-            await client._disconnect()
-            raise
-        return client
+        self._connection = await open_connection(self._config)
+        return self._connection
 
     async def __aexit__(self, exc_type, exc_value, traceback):
         assert self._connection, "__aexit__ called without __aenter__"
@@ -1,5 +1,6 @@
 from typing import Dict, Union, Optional, NamedTuple, Any, List
 from typing_extensions import Literal
+from concurrent.futures import Executor
 import json
 import ssl
 import logging
@@ -10,9 +11,10 @@ from pathlib import Path
 
 from .errors.common import InvalidConfig
 from .config import NetlabCipherListEnum
+from .serializer import NUMERIC_MODES
 
 ENV_PREFIX = 'NETLAB_CONFIG_'
-ENV_BOOLEANS: List[str] = []
+ENV_BOOLEANS: List[str] = ['reconnect', 'adaptive_concurrency', 'raw', 'lazy', 'cache']
 CONFIG_FILENAME = os.path.join('.netlab', 'config.json')
 DEFAULT_CONFIG_PATH = os.path.join(os.path.expanduser('~'), CONFIG_FILENAME)
 log = logging.getLogger(__name__)
@@ -23,10 +25,27 @@ class SystemConfig(NamedTuple):
     token: str
     host: str
     port: int
-    ssl: Union[ssl.SSLContext, Literal['default', 'self_signed']]
+    ssl: Union[ssl.SSLContext, Literal['default', 'self_signed', False]]
     ssl_ciphers: str
     server_hostname: Optional[str]
-    message_byte_limit: int
+    message_byte_limit: Optional[int]
+    reconnect: bool
+    reconnect_max_delay: float
+    reconnect_timeout: float
+    max_in_flight: Optional[int]
+    adaptive_concurrency: bool
+    method_max_in_flight: Optional[Dict[str, int]]
+    call_timeout: Optional[float]
+    write_coalesce_window: float
+    decode_offload_threshold: Optional[int]
+    decode_executor: Optional[Executor]
+    json_codec: Optional[str]
+    raw: Union[bool, Literal['bytes']]
+    lazy: bool
+    numeric: Literal['decimal', 'float']
+    cache: bool
+    cache_ttl: Optional[Dict[str, float]]
+    cache_size: int
 
 
 def get_system_config(system, config=None, config_path=None) -> SystemConfig:
@@ -37,6 +56,23 @@ def get_system_config(system, config=None, config_path=None) -> SystemConfig:
         'server_hostname': None,
         'message_byte_limit': 1024 * 1024 * 64,
         'ssl_ciphers': 'NETLAB',
+        'reconnect': False,
+        'reconnect_max_delay': 5.0,
+        'reconnect_timeout': 60.0,
+        'max_in_flight': None,
+        'adaptive_concurrency': False,
+        'method_max_in_flight': None,
+        'call_timeout': None,
+        'write_coalesce_window': 0.0,
+        'decode_offload_threshold': 1024 * 1024,
+        'decode_executor': None,
+        'json_codec': None,
+        'raw': False,
+        'lazy': False,
+        'numeric': 'decimal',
+        'cache': False,
+        'cache_ttl': None,
+        'cache_size': 256,
     }
 
     if config:
@@ -52,7 +88,9 @@ def get_system_config(system, config=None, config_path=None) -> SystemConfig:
             env_config: Dict[str, Union[str, bool]] = {}
             for k, v in env_vars:
                 key = k.replace(ENV_PREFIX, '').lower()
-                if key in ENV_BOOLEANS:
+                if key == 'raw' and v.lower() == 'bytes':
+                    env_config[key] = 'bytes'
+                elif key in ENV_BOOLEANS:
                     # convert env value to python boolean
                     env_config[key] = v.lower() in ("true", "yes", "t", "1")
                 else:
@@ -77,6 +115,9 @@ def get_system_config(system, config=None, config_path=None) -> SystemConfig:
     if not defaults['ssl']:
         warnings.warn('SSL is not being used, this is insecure.', DeprecationWarning)
 
+    if defaults['numeric'] not in NUMERIC_MODES:
+        raise InvalidConfig('Config "numeric" must be one of {}.'.format(NUMERIC_MODES))
+
     defaults['ssl_ciphers'] = NetlabCipherListEnum.get_cipher_list(defaults['ssl_ciphers'])
 
     return SystemConfig(**defaults)
@@ -0,0 +1,134 @@
+"""
+Read-through cache for the results of methods whose data rarely changes, such as ``pod.types.list``.
+
+The cache is off by default. The ``cache`` config option turns it on for the methods in :data:`CATALOG_TTLS`, and
+``cache_ttl`` sets how many seconds the results of each method are kept, adding to or replacing those defaults,
+e.g. ``{'pod.types.list': 600, 'class.list': 30}``. ``cache_size`` bounds the results kept, dropping the least
+recently used first. A connection's cache is :py:attr:`netlab.async_client.NetlabConnection.cache`.
+
+Results are keyed by method and params and kept encoded as JSON. Every call decodes its own copy, converted as its
+``raw``, ``lazy`` and ``numeric`` ask, so changing a result leaves the cache alone. Calls made while the same
+result is being fetched wait for that fetch instead of sending their own, still bound by their own ``timeout`` or
+``deadline``. Errors are not cached.
+
+Calls that change the data do not invalidate it. After adding a pod type, for example, call
+``connection.cache.invalidate('pod.types.list')``.
+"""
+
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, TYPE_CHECKING
+
+from .serializer import default
+
+if TYPE_CHECKING:  # TODO python3.9 or mypy version
+    Entries = OrderedDict[Tuple[str, str], Tuple[float, bytes]]
+    Loading = Dict[Tuple[str, str], asyncio.Future[None]]
+else:
+    Entries = Loading = Any
+
+__all__ = ['CallCache', 'CATALOG_TTLS']
+
+CATALOG_TTLS: Dict[str, float] = {
+    'lab.exercise.list': 300.0,
+    'pod.types.get': 300.0,
+    'pod.types.list': 300.0,
+    'system.time.timezone.list': 3600.0,
+    'user.community.list': 300.0,
+    'vm.datacenter.list': 60.0,
+    'vm.host.list': 60.0,
+}
+"Seconds the ``cache`` config option keeps the results of each method."
+
+# keys must not depend on the order params were passed in
+_KEY_ENCODER = json.JSONEncoder(default=default, sort_keys=True, separators=(',', ':'))
+
+
+class CallCache(object):
+    """
+    Keeps the results of calls to the methods in :attr:`ttls` for that many seconds, up to :attr:`max_size`
+    results.
+    """
+
+    def __init__(self, ttls: Dict[str, float], max_size: int = 256):
+        """
+        :param ttls: Seconds to keep the results of each method. Methods with ``0`` are not cached.
+        :param max_size: Most results kept. The least recently used is dropped first.
+        """
+        if max_size < 1:
+            raise ValueError('max_size must be at least 1')
+        self.ttls = {method: float(ttl) for method, ttl in ttls.items() if ttl and float(ttl) > 0}
+        "Seconds the results of each method are kept."
+        self.max_size = max_size
+        "Most results kept."
+        self.hits = 0
+        "Calls answered from the cache, including calls that waited for another call's fetch."
+        self.misses = 0
+        "Calls that fetched their result from the server."
+        self._entries: Entries = OrderedDict()
+        # fetches in progress, done once their result is stored or they failed
+        self._loading: Loading = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return '<CallCache {} results, {} hits, {} misses>'.format(len(self), self.hits, self.misses)
+
+    async def get(self, method: str, params: Dict[str, Any], fetch: Callable[[], Awaitable[bytes]]) -> bytes:
+        """
+        Get the result of **method** with **params**, awaiting **fetch** for it when it isn't cached.
+
+        :meta private:
+
+        :param fetch: Makes the call, returning its result encoded as JSON.
+        """
+        key = (method, _KEY_ENCODER.encode(params))
+        while True:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                del self._entries[key]
+            loading = self._loading.get(key)
+            if loading is None:
+                break
+            # shielded, so a waiter that times out doesn't cancel the others' wait. When the fetch failed, the
+            # next waiter makes its own.
+            await asyncio.shield(loading)
+
+        self.misses += 1
+        loading = self._loading[key] = asyncio.get_event_loop().create_future()
+        try:
+            data = await fetch()
+            self._entries[key] = (time.monotonic() + self.ttls[method], data)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+            return data
+        finally:
+            del self._loading[key]
+            loading.set_result(None)
+
+    def invalidate(self, method: Optional[str] = None, params: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Drop cached results, so the next call fetches them again.
+
+        :param method: Drop the results of this method only. ``None`` drops every result.
+        :param params: Drop only the result of **method** called with these params.
+
+        :return: Number of results dropped.
+        """
+        if method is None:
+            count = len(self._entries)
+            self._entries.clear()
+            return count
+        if params is not None:
+            return 1 if self._entries.pop((method, _KEY_ENCODER.encode(params)), None) else 0
+        keys = [key for key in self._entries if key[0] == method]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
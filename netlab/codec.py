@@ -0,0 +1,182 @@
+"""
+JSON codecs used by :py:class:`netlab.async_client.NetlabConnection` to encode requests and decode responses.
+
+Every codec converts fields exactly as :func:`netlab.serializer.process` and :func:`netlab.serializer.default`
+do, only the JSON implementation underneath differs. The stdlib :py:class:`JsonCodec` is always available. Faster
+codecs are used only when their package is already installed, nothing extra is required:
+
+- ``orjson``: :py:class:`OrjsonCodec`
+
+The codec is chosen with the ``json_codec`` config option. By default the fastest installed codec is used.
+"""
+
+import json
+import uuid
+from typing import Any, Callable, Dict, Optional, Type
+
+from .errors.common import InvalidConfig
+from .serializer import default, process, process_floats
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+__all__ = ['JsonCodec', 'OrjsonCodec', 'CODECS', 'get_codec']
+
+
+class _LongInteger(Exception):
+    pass
+
+
+def _check_float(value: float) -> None:
+    # orjson reads integers beyond 64 bits as floats, the stdlib keeps them exact
+    if not -2.0 ** 63 < value < 2.0 ** 64:
+        raise _LongInteger()
+
+
+def _walk(obj: Any, hook: Optional[Callable[[Dict[str, Any]], Any]], check_floats: bool) -> None:
+    # object_hook order: every nested object is converted before the object containing it
+    values = obj.values() if type(obj) is dict else obj
+    types = set(map(type, values))
+    if dict in types or list in types or (check_floats and float in types):
+        for value in values:
+            if type(value) is dict or type(value) is list:
+                _walk(value, hook, check_floats)
+            elif check_floats and type(value) is float:
+                _check_float(value)
+    if hook is not None and type(obj) is dict:
+        hook(obj)
+
+
+_ENCODER = json.JSONEncoder(default=default)
+
+_REQUEST_HEADS: Dict[str, bytes] = {}
+
+
+def _request_head(method: str) -> bytes:
+    # the envelope between the id and the params, the same for every call of a method
+    head = _REQUEST_HEADS[method] = '","jsonrpc":"2.0","method":{},"params":'.format(json.dumps(method)).encode()
+    return head
+
+
+class JsonCodec(object):
+    """
+    Codec using the standard library `json` module.
+    """
+    name = 'json'
+
+    def encode(self, data: Any) -> bytes:
+        """
+        Encode a message, without a trailing newline.
+        """
+        return _ENCODER.encode(data).encode('utf-8')
+
+    def encode_request(self, ident: uuid.UUID, method: str, params: Dict[str, Any]) -> bytes:
+        """
+        Encode a JSON-RPC request, with its trailing newline. Only **params** is encoded per call, the rest of the
+        request comes from a template made once for each method.
+        """
+        head = _REQUEST_HEADS.get(method) or _request_head(method)
+        return b''.join((b'{"id":"', str(ident).encode('ascii'), head, self.encode(params) if params else b'{}',
+                         b'}\n'))
+
+    def decode(self, data: bytes) -> Any:
+        """
+        Decode a message and convert its fields.
+        """
+        return json.loads(data, object_hook=process)
+
+    def decode_raw(self, data: bytes) -> Any:
+        """
+        Decode a message without converting any fields.
+        """
+        return json.loads(data)
+
+    def convert(self, obj: Any, numeric: str = 'decimal') -> Any:
+        """
+        Convert the fields of a message from :meth:`decode_raw` in place, as :meth:`decode` would have.
+
+        :param numeric: ``'float'`` converts `netlab.serializer.DECIMAL_FIELDS` to `float` instead of
+            `decimal.Decimal`, see :func:`netlab.serializer.to_float`.
+        """
+        if type(obj) is dict or type(obj) is list:
+            _walk(obj, process_floats if numeric == 'float' else process, False)
+        return obj
+
+
+def _orjson_default(obj: Any) -> Any:
+    if isinstance(obj, dict):
+        return dict(obj)
+    return default(obj)
+
+
+_ORJSON_OPTIONS = 0 if orjson is None else (
+    orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_SUBCLASS | orjson.OPT_NON_STR_KEYS)
+_ORJSON_REQUEST_OPTIONS = 0 if orjson is None else _ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE
+
+
+class OrjsonCodec(JsonCodec):
+    """
+    Codec using `orjson <https://github.com/ijl/orjson>`_. Values orjson cannot represent, such as integers
+    beyond 64 bits, fall back to the stdlib codec.
+    """
+    name = 'orjson'
+
+    def encode(self, data: Any) -> bytes:
+        try:
+            # datetimes go through default() so they keep the NETLAB+ layout instead of ISO 8601, dict
+            # subclasses such as LazyRecord so their fields are read converted, and records as dicts
+            return orjson.dumps(data, default=_orjson_default, option=_ORJSON_OPTIONS)
+        except TypeError:
+            return super().encode(data)
+
+    def encode_request(self, ident: uuid.UUID, method: str, params: Dict[str, Any]) -> bytes:
+        # orjson writes the UUID and the newline itself, faster than filling in the template
+        try:
+            return orjson.dumps({'id': ident, 'jsonrpc': '2.0', 'method': method, 'params': params},
+                                default=_orjson_default, option=_ORJSON_REQUEST_OPTIONS)
+        except TypeError:
+            return super().encode_request(ident, method, params)
+
+    def decode(self, data: bytes) -> Any:
+        try:
+            return self._loads(data, process)
+        except (orjson.JSONDecodeError, _LongInteger):
+            # the stdlib decodes long integers exactly, and raises for a frame that really is malformed
+            return super().decode(data)
+
+    def decode_raw(self, data: bytes) -> Any:
+        try:
+            return self._loads(data, None)
+        except (orjson.JSONDecodeError, _LongInteger):
+            return super().decode_raw(data)
+
+    def _loads(self, data: bytes, hook: Optional[Callable[[Dict[str, Any]], Any]]) -> Any:
+        result = orjson.loads(data)
+        if type(result) is dict or type(result) is list:
+            _walk(result, hook, True)
+        elif type(result) is float:
+            _check_float(result)
+        return result
+
+
+CODECS: Dict[str, Type[JsonCodec]] = {'json': JsonCodec}
+"Installed codecs by name, fastest last."
+
+if orjson is not None:
+    CODECS['orjson'] = OrjsonCodec
+
+
+def get_codec(name: Optional[str] = None) -> JsonCodec:
+    """
+    Get a codec by name.
+
+    :param name: A name in :data:`CODECS`. ``None`` picks the fastest installed codec.
+    """
+    if name is None:
+        return list(CODECS.values())[-1]()
+    try:
+        return CODECS[name]()
+    except KeyError:
+        raise InvalidConfig("json_codec '{}' is not installed. Choose from {}.".format(name, list(CODECS))) from None
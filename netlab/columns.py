@@ -0,0 +1,134 @@
+"""
+Column oriented results for list methods whose rows are aggregated right away.
+
+With ``columnar=True``, methods such as ``pod_list`` and ``system_perf_query`` fetch their rows without field
+conversion and return :py:class:`Columns`, one column per property instead of one `dict` per row. Each column is
+converted as a whole:
+
+- `netlab.serializer.INT_FIELDS`: ``array('q')``, or a list when a value is not an integer.
+- `netlab.serializer.DECIMAL_FIELDS`: ``array('d')``, with ``nan`` for blank values.
+- `netlab.serializer.DATETIME_FIELDS`: ``array('d')`` of seconds since 1970-01-01 on the server's clock, with
+  ``nan`` for blank values. The timestamps are naive, like the datetimes they replace.
+- Other converted fields: a list of the values the row would have held.
+- Everything else: a list.
+
+Each distinct string in a column is converted once and shared by its rows, interned per column, so repeated states,
+pod types and timestamps cost one conversion and one object rather than one per row.
+
+NumPy is not required. When it is installed, :meth:`Columns.to_numpy` converts the columns to arrays.
+"""
+
+from array import array
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+from . import serializer
+
+try:
+    import numpy  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover
+    numpy = None  # type: ignore[assignment]
+
+__all__ = ['Columns', 'to_columns']
+
+_EPOCH = datetime(1970, 1, 1)
+_NAN = float('nan')
+_KEYABLE = {str, type(None)}
+
+
+class Columns(Dict[str, Any]):
+    """
+    A `dict` of property name to column. Every column holds one value per row, in row order.
+    """
+
+    def __init__(self, columns: Dict[str, Any], length: int):
+        super().__init__(columns)
+        self.length = length
+        "Number of rows."
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """
+        Return the rows as dicts. Values keep their column types, e.g. timestamps stay seconds.
+        """
+        names = list(self)
+        return [dict(zip(names, values)) for values in zip(*self.values())]
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """
+        Convert every column to a `numpy.ndarray`: arrays without copying, boolean lists to ``bool`` and other
+        lists to ``object`` arrays.
+
+        :raises ImportError: NumPy is not installed.
+        """
+        if numpy is None:
+            raise ImportError('Columns.to_numpy() requires numpy.')
+        converted = {}
+        for name, column in self.items():
+            if isinstance(column, array):
+                converted[name] = numpy.frombuffer(column, dtype='int64' if column.typecode == 'q' else 'float64')
+            elif column and all(type(value) is bool for value in column):
+                converted[name] = numpy.array(column, dtype=bool)
+            else:
+                objects = numpy.empty(len(column), dtype=object)
+                try:
+                    objects[:] = column
+                except ValueError:
+                    # values that are lists themselves
+                    for index, value in enumerate(column):
+                        objects[index] = value
+                converted[name] = objects
+        return converted
+
+
+def to_columns(rows: Sequence[Dict[str, Any]], properties: Optional[Iterable[str]] = None) -> Columns:
+    """
+    Convert rows, decoded without field conversion, to :py:class:`Columns`.
+
+    :param rows: Result objects as the server sent them, e.g. from a call with ``raw=True``.
+    :param properties: Columns to include even if no row has them, first and in this order. Other properties
+        follow in the order they are first seen.
+    """
+    names = dict.fromkeys(properties or ())
+    for row in rows:
+        if not row.keys() <= names.keys():
+            names.update(dict.fromkeys(row))
+    return Columns({name: _column(name, [row.get(name) for row in rows]) for name in names}, len(rows))
+
+
+def _epoch(value: Optional[datetime]) -> float:
+    return _NAN if value is None else (value - _EPOCH).total_seconds()
+
+
+def _map_unique(function: Optional[Callable[[Any], Any]], values: List[Any]) -> List[Any]:
+    # columns repeat a few values, e.g. pt_id and enum states, so each distinct string is converted once and every
+    # row shares the result. Only str and None are keyed, where equal values are interchangeable.
+    if set(map(type, values)) <= _KEYABLE:
+        if function is None:
+            unique = {value: value for value in values}
+        else:
+            unique = dict.fromkeys(values)
+            for value in unique:
+                unique[value] = function(value)
+        return list(map(unique.__getitem__, values))
+    return values if function is None else list(map(function, values))
+
+
+def _column(name: str, values: List[Any]) -> Any:
+    if name in serializer.DATETIME_FIELDS:
+        to_datetime = serializer.FIELD_DECODERS[name]
+        return array('d', _map_unique(lambda value: _epoch(to_datetime(value)), values))
+    decoder = serializer.FIELD_DECODERS.get(name)
+    if name in serializer.DECIMAL_FIELDS:
+        return array('d', _map_unique(serializer.to_float, values))
+    if decoder is None:
+        return _map_unique(None, values)
+    if name in serializer.ENUM_CSV or name in serializer.STR_CSV:
+        # these decode to lists, which rows must not share
+        return list(map(decoder, values))
+    converted = _map_unique(decoder, values)
+    if name in serializer.INT_FIELDS:
+        try:
+            return array('q', converted)
+        except (TypeError, OverflowError):
+            pass
+    return converted
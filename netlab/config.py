@@ -5,7 +5,8 @@ using a json file on your system, or by passing a ``dict`` explicitly.
 
 from enum import Enum
 import ssl
-from typing import Optional, Union, cast
+from concurrent.futures import Executor
+from typing import Dict, Optional, Union, cast
 from typing_extensions import TypedDict, Literal
 
 
@@ -61,12 +62,46 @@ class NetlabServerConfig(TypedDict):
     "Port of remote NETLAB+ API. Usually ``9000``."
     server_hostname: Optional[str]
     "The hostname that ssl is configured to use. Only required if it is diffrent from 'host'."
-    ssl: Union[Literal["default", "self_signed"], ssl.SSLContext]
-    "You may pass `ssl.SSLContext` for complete control over ssl."
+    ssl: Union[Literal["default", "self_signed", False], ssl.SSLContext]
+    "You may pass `ssl.SSLContext` for complete control over ssl. ``False`` disables ssl, for local testing only."
     ssl_ciphers: RAW_CIPHER_LIST
     "ssl ciphers to use. This can be a value from `NetlabCipherListEnum` or an openssl cipher list."
-    message_byte_limit: int
-    "The maximum size of a NETLAB+ message."
+    message_byte_limit: Optional[int]
+    "The maximum size of a NETLAB+ message in bytes. ``0`` or ``None`` is unlimited. Defaults to 64 MiB."
+    reconnect: bool
+    "Reconnect when the connection is lost, replaying subscriptions and read only calls. Defaults to ``False``."
+    reconnect_max_delay: float
+    "The longest wait in seconds between reconnect attempts. Defaults to ``5``."
+    reconnect_timeout: float
+    "Seconds to keep trying to reconnect before the connection is closed for good. Defaults to ``60``."
+    max_in_flight: Optional[int]
+    "Most calls a connection sends at once, the rest wait in a queue. Defaults to unlimited."
+    adaptive_concurrency: bool
+    "Tune the number of calls in flight from server latency, up to ``max_in_flight``. Defaults to ``False``."
+    method_max_in_flight: Optional[Dict[str, int]]
+    "Per method limits on calls in flight, e.g. ``{'pod.clone.task': 2}``."
+    call_timeout: Optional[float]
+    "Default seconds to wait for any call, including task completion. Defaults to no timeout."
+    write_coalesce_window: float
+    "Seconds to gather outgoing requests into one write. Defaults to ``0``, one event loop iteration."
+    decode_offload_threshold: Optional[int]
+    "Messages of at least this many bytes are decoded off the event loop. ``0`` or ``None`` never. Defaults to 1 MiB."
+    decode_executor: Optional[Executor]
+    "Executor for decoding large messages, e.g. a `concurrent.futures.ProcessPoolExecutor`. Defaults to a thread."
+    json_codec: Optional[str]
+    "JSON codec name from `netlab.codec.CODECS`, e.g. ``'json'``. Defaults to the fastest installed."
+    raw: Union[bool, Literal['bytes']]
+    "Return results as the server sent them, without field conversion. ``'bytes'`` returns JSON. Defaults to ``False``."
+    lazy: bool
+    "Return objects as `netlab.records.LazyRecord`, converting each field on first access. Defaults to ``False``."
+    numeric: Literal['decimal', 'float']
+    "``'float'`` converts decimal fields such as ``idle_pct`` to `float`, blanks to ``nan``. Defaults to ``'decimal'``."
+    cache: bool
+    "Cache the results of catalog methods such as ``pod.types.list``, see `netlab.cache`. Defaults to ``False``."
+    cache_ttl: Optional[Dict[str, float]]
+    "Seconds to cache the results of each method, e.g. ``{'pod.list': 5}``. ``0`` stops caching a method."
+    cache_size: int
+    "Most results cached per connection, the least recently used are dropped first. Defaults to ``256``."
 
 
 class NetlabServerEnvConfig(TypedDict, total=True):
@@ -84,3 +119,13 @@ class NetlabServerEnvConfig(TypedDict, total=True):
     "Token obtained from NETLAB+ system."
     NETLAB_CONFIG_PORT: str
     "Port of remote NETLAB+ API."
+    NETLAB_CONFIG_RECONNECT: str
+    "Reconnect automatically when the connection is lost."
+    NETLAB_CONFIG_RAW: str
+    "Return results without field conversion."
+    NETLAB_CONFIG_LAZY: str
+    "Return objects that convert each field on first access."
+    NETLAB_CONFIG_NUMERIC: str
+    "``float`` to convert decimal fields to `float`."
+    NETLAB_CONFIG_CACHE: str
+    "Cache the results of catalog methods."
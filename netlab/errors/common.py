@@ -1,5 +1,6 @@
 "Common and Base errors"
 
+import asyncio
 from typing import Optional, Type, List
 
 CODES: List[Type['NetlabError']] = []
@@ -9,6 +10,10 @@ class NetlabConnectionClosedError(Exception):
     pass
 
 
+class NetlabTimeoutError(asyncio.TimeoutError):
+    """A call did not complete before its timeout or deadline."""
+
+
 class ResponseFormatError(Exception):
     """The server's response was impossible to decode."""
 
@@ -0,0 +1,82 @@
+"""
+Splits the newline delimited NETLAB+ message stream into frames.
+
+`asyncio.StreamReader.readuntil` keeps the whole message in the stream's buffer, growing it as data arrives, and
+gives up with `asyncio.LimitOverrunError` once the buffer passes the stream limit. `FrameReader` instead reads
+fixed size chunks and keeps the chunks of an unfinished message as they are, joining them once when the newline
+arrives. A large message is copied into its final ``bytes`` a single time and the stream's own buffer never
+grows past one chunk, so the frame size can be raised or left unlimited.
+"""
+
+import asyncio
+from collections import deque
+from typing import Deque, List, Optional
+
+from .errors.common import ResponseFormatError
+
+__all__ = ['FrameReader', 'READ_CHUNK_SIZE']
+
+READ_CHUNK_SIZE = 256 * 1024
+"Bytes read from the stream at a time."
+
+
+class FrameReader(object):
+    """
+    Reads newline delimited frames from an `asyncio.StreamReader`.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, limit: Optional[int] = None, chunk_size: int = READ_CHUNK_SIZE):
+        """
+        :param reader: The stream to read from.
+        :param limit: The largest frame allowed in bytes. ``None`` or ``0`` is unlimited.
+        :param chunk_size: Bytes to read from the stream at a time.
+        """
+        self._reader = reader
+        self._limit = limit or None
+        self._chunk_size = chunk_size
+        self._frames: Deque[bytes] = deque()
+        self._parts: List[bytes] = []
+        self._partial_size = 0
+
+    async def read_frame(self) -> bytes:
+        """
+        Wait for the next frame, without its newline.
+
+        :raises asyncio.IncompleteReadError: The stream ended.
+        :raises ResponseFormatError: A frame is larger than the limit.
+        """
+        frames = self._frames
+        while not frames:
+            chunk = await self._reader.read(self._chunk_size)
+            if not chunk:
+                raise asyncio.IncompleteReadError(b''.join(self._parts), None)
+            self._feed(chunk)
+        return frames.popleft()
+
+    def _feed(self, chunk: bytes) -> None:
+        start = 0
+        end = chunk.find(b'\n')
+        while end != -1:
+            if self._parts:
+                self._parts.append(chunk[start:end])
+                self._check_limit(self._partial_size + end - start)
+                frame = b''.join(self._parts)
+                self._parts = []
+                self._partial_size = 0
+            else:
+                self._check_limit(end - start)
+                frame = chunk[start:end]
+            self._frames.append(frame)
+            start = end + 1
+            end = chunk.find(b'\n', start)
+
+        if start < len(chunk):
+            # slicing from 0 returns the chunk itself, so a frame spanning many chunks is only copied by the join
+            self._parts.append(chunk[start:])
+            self._partial_size += len(chunk) - start
+            self._check_limit(self._partial_size)
+
+    def _check_limit(self, size: int) -> None:
+        if self._limit is not None and size > self._limit:
+            raise ResponseFormatError(
+                'message is larger than message_byte_limit ({} bytes).'.format(self._limit))
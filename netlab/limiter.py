@@ -0,0 +1,198 @@
+"""
+Client side limit on the number of calls a :py:class:`netlab.async_client.NetlabConnection` has in flight.
+
+NETLAB+ can only service so many API calls at once. The limiter queues calls beyond the window so bulk scripts
+can start thousands of calls without overloading the server. In adaptive mode the window is tuned with
+additive increase / multiplicative decrease (AIMD): it grows by one call per window of fast responses and is
+halved when responses slow down or calls time out.
+
+The limiter is configured with the ``max_in_flight``, ``adaptive_concurrency`` and ``method_max_in_flight``
+config options and is available as :py:attr:`netlab.async_client.NetlabConnection.limiter`.
+"""
+
+import asyncio
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:  # TODO python3.9 or mypy version
+    Waiter = asyncio.Future[None]
+else:
+    Waiter = Any
+
+__all__ = ['ConcurrencyLimiter']
+
+
+class ConcurrencyLimiter(object):
+    """
+    Limits concurrent calls to a window, optionally adapting the window to the server's latency.
+    """
+
+    ADAPTIVE_INITIAL_WINDOW = 8
+    "Window an adaptive limiter starts with."
+
+    LATENCY_DRIFT = 0.01
+    "How fast a method's baseline latency follows slower responses."
+
+    MIN_QUEUEING_DELAY = 0.005
+    "Latency above the baseline, in seconds, that is always treated as noise."
+
+    def __init__(
+                self,
+                max_in_flight: Optional[int] = None,
+                *,
+                adaptive: bool = False,
+                min_in_flight: int = 1,
+                method_max_in_flight: Optional[Dict[str, int]] = None,
+                latency_tolerance: float = 2.0,
+                backoff: float = 0.5,
+            ):
+        """
+        :param max_in_flight: Most calls allowed in flight. ``None`` is unlimited unless **adaptive** is set.
+        :param adaptive: Tune the window between **min_in_flight** and **max_in_flight** from observed latency.
+        :param min_in_flight: Smallest window an adaptive limiter will back off to.
+        :param method_max_in_flight: Per method limits, e.g. ``{'pod.clone.task': 2}``. These are fixed and apply
+            in addition to the window.
+        :param latency_tolerance: An adaptive limiter backs off when a call takes this many times longer than
+            the fastest recent call of the same method.
+        :param backoff: Factor the window is multiplied by when backing off.
+        """
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError('max_in_flight must be at least 1')
+        if min_in_flight < 1:
+            raise ValueError('min_in_flight must be at least 1')
+
+        self._adaptive = adaptive
+        self._max = float(max_in_flight) if max_in_flight is not None else float('inf')
+        self._min = float(min(min_in_flight, self._max))
+        if adaptive:
+            self._limit = max(self._min, min(self._max, float(self.ADAPTIVE_INITIAL_WINDOW)))
+        else:
+            self._limit = self._max
+        self._method_limits = dict(method_max_in_flight or {})
+        self._latency_tolerance = latency_tolerance
+        self._backoff = backoff
+
+        self._in_flight = 0
+        self._method_in_flight: Dict[str, int] = {}
+        self._waiters: Deque[Tuple[Waiter, str]] = deque()
+        self._baseline: Dict[str, float] = {}
+        self._last_backoff = 0.0
+
+    @property
+    def window(self) -> float:
+        """
+        Current number of calls allowed in flight. ``inf`` when unlimited.
+        """
+        return self._limit if self._limit == float('inf') else float(int(self._limit))
+
+    @property
+    def in_flight(self) -> int:
+        """
+        Number of calls holding a slot.
+        """
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        Number of calls waiting for a slot.
+        """
+        return sum(1 for waiter, _ in self._waiters if not waiter.done())
+
+    def _has_room(self, method: str) -> bool:
+        if self._in_flight + 1 > self._limit:
+            return False
+        method_limit = self._method_limits.get(method)
+        return method_limit is None or self._method_in_flight.get(method, 0) < method_limit
+
+    def _take(self, method: str) -> None:
+        self._in_flight += 1
+        self._method_in_flight[method] = self._method_in_flight.get(method, 0) + 1
+
+    def _give_back(self, method: str) -> None:
+        self._in_flight -= 1
+        count = self._method_in_flight[method] - 1
+        if count:
+            self._method_in_flight[method] = count
+        else:
+            del self._method_in_flight[method]
+
+    def try_acquire(self, method: str) -> bool:
+        """
+        Take a slot for **method** if one is free right now, without waiting.
+        """
+        if self._waiters or not self._has_room(method):
+            return False
+        self._take(method)
+        return True
+
+    async def acquire(self, method: str) -> None:
+        """
+        Wait for a slot for **method**. Every successful acquire must be paired with :meth:`release`.
+        """
+        if self.try_acquire(method):
+            return
+
+        waiter: Waiter = asyncio.get_event_loop().create_future()
+        self._waiters.append((waiter, method))
+        # calls queued ahead of this one may be held back only by their own method limit
+        self._wake()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # the slot was handed over just as we were cancelled
+                self._give_back(method)
+                self._wake()
+            raise
+
+    def release(self, method: str, latency: float, error: bool = False) -> None:
+        """
+        Return a slot and, in adaptive mode, update the window.
+
+        :param method: The method the slot was acquired for.
+        :param latency: Seconds the call took.
+        :param error: The call failed in a way that suggests overload, such as a timeout.
+        """
+        self._give_back(method)
+        if self._adaptive:
+            self._adapt(method, latency, error)
+        self._wake()
+
+    def _adapt(self, method: str, latency: float, error: bool) -> None:
+        baseline = self._baseline.get(method)
+        if baseline is None or latency < baseline:
+            baseline = latency
+        else:
+            baseline += (latency - baseline) * self.LATENCY_DRIFT
+        self._baseline[method] = baseline
+
+        congested = error or (
+            latency > baseline * self._latency_tolerance and latency - baseline > self.MIN_QUEUEING_DELAY)
+
+        if congested:
+            now = asyncio.get_event_loop().time()
+            # back off at most once per round trip, a burst of slow responses is one signal
+            if now - self._last_backoff >= latency:
+                self._last_backoff = now
+                self._limit = max(self._min, self._limit * self._backoff)
+        elif self._in_flight + 2 > self._limit:
+            # only grow while the window is actually limiting calls
+            self._limit = min(self._max, self._limit + 1.0 / self._limit)
+
+    def _wake(self) -> None:
+        waiters = self._waiters
+        skipped: Deque[Tuple[Waiter, str]] = deque()
+        while waiters:
+            waiter, method = waiters.popleft()
+            if waiter.done():
+                continue
+            if not self._has_room(method):
+                skipped.append((waiter, method))
+                if self._in_flight + 1 > self._limit:
+                    break
+                continue
+            self._take(method)
+            waiter.set_result(None)
+        skipped.extend(waiters)
+        self._waiters = skipped
@@ -0,0 +1,87 @@
+"""
+Page sizes for paged searches, chosen from the pages fetched so far.
+
+With ``limit=None``, ``user_account_search_iter`` asks for each page by offset and lets a :py:class:`PageSizer`
+pick its ``limit``. ``user_account_list`` pages this way by default. The first page is asked for with the largest
+limit, as fixed pages were, and the sizer only shrinks the pages after it when the pages so far show their frames
+exceed about :attr:`PageSizer.TARGET_BYTES` or take longer than :attr:`PageSizer.TARGET_SECONDS`. So narrow rows
+keep coming in large pages, while wide rows, e.g. every property of an account, come in pages small enough not to
+hold up the connection. The size of a row is measured by encoding a sample of each page's rows.
+"""
+
+from typing import Any, Optional, Sequence
+
+from .codec import JsonCodec
+
+__all__ = ['PageSizer']
+
+_CODEC = JsonCodec()
+
+
+class PageSizer(object):
+    """
+    Picks the ``limit`` of the next page between **min_limit** and **max_limit** from the bytes per row and the
+    latency of the pages before it.
+    """
+
+    TARGET_BYTES = 256 * 1024
+    "Frame size in bytes pages aim for."
+
+    TARGET_SECONDS = 2.0
+    "Longest a page should take from request to reply."
+
+    MAX_GROWTH = 4
+    "Most the limit may be multiplied by from one page to the next."
+
+    SAMPLE_ROWS = 8
+    "Rows of each page encoded to measure the size of a row."
+
+    def __init__(
+                self,
+                min_limit: int = 50,
+                max_limit: int = 500,
+                *,
+                target_bytes: Optional[int] = None,
+                target_seconds: Optional[float] = None,
+            ):
+        """
+        :param min_limit: Smallest page asked for.
+        :param max_limit: Largest page asked for.
+        :param target_bytes: Frame size to aim for. Defaults to :attr:`TARGET_BYTES`.
+        :param target_seconds: Longest a page should take. Defaults to :attr:`TARGET_SECONDS`.
+        """
+        if min_limit < 1:
+            raise ValueError('min_limit must be at least 1')
+        if max_limit < min_limit:
+            raise ValueError('max_limit must be at least min_limit')
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.target_bytes = target_bytes or self.TARGET_BYTES
+        self.target_seconds = target_seconds or self.TARGET_SECONDS
+        self.row_bytes: Optional[float] = None
+        "Average size of a row in bytes, ``None`` until a page had rows."
+        self.limit = max_limit
+        "Limit for the next page. The first page is asked for with **max_limit**."
+
+    def observe(self, limit: int, rows: Sequence[Any], seconds: float) -> None:
+        """
+        Update :attr:`limit` from a page fetched.
+
+        :param limit: The limit the page was asked for with.
+        :param rows: The rows of the page.
+        :param seconds: Time from request to reply.
+        """
+        if not rows:
+            return
+        sample = rows[::max(1, len(rows) // self.SAMPLE_ROWS)]
+        row_bytes = sum(len(_CODEC.encode(row)) for row in sample) / len(sample)
+        # average with the pages before, so an odd page doesn't swing the size
+        self.row_bytes = row_bytes if self.row_bytes is None else (self.row_bytes + row_bytes) / 2
+        target = self.target_bytes / self.row_bytes
+        if seconds > 0:
+            # latency grows with the rows asked for, at most proportionally
+            target = min(target, len(rows) * self.target_seconds / seconds)
+        self.limit = self._clamp(min(target, limit * self.MAX_GROWTH))
+
+    def _clamp(self, limit: float) -> int:
+        return max(self.min_limit, min(self.max_limit, int(limit)))
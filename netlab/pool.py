@@ -0,0 +1,171 @@
+"""
+`NetlabPool` keeps several authenticated connections to one NETLAB+ system and spreads calls across them.
+
+A single :py:class:`netlab.async_client.NetlabConnection` reads every response from one socket, so one slow task
+or very large response delays every other call made on it. The connection returned by `NetlabPool` exposes the
+same methods as a `NetlabConnection`, but each call is sent to the live connection with the fewest calls in
+flight.
+
+**Usage**
+
+::
+
+    async with NetlabPool(size=8) as client:
+        client: NetlabPoolConnection
+
+        pods = await asyncio.gather(*[client.pod_get(pod_id=pod_id) for pod_id in pod_ids])
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from .async_client import NetlabConnection, EventStreamFactory, open_connection
+from .auth import get_system_config
+from .api import ClassApiMixin, PodApiMixin, ReservationApiMixin, SystemApiMixin, LabApiMixin, UserApiMixin, VmApiMixin
+from .errors.common import NetlabConnectionClosedError
+from .config import NetlabServerConfig
+
+logger = logging.getLogger(__name__)
+
+__all__ = ['NetlabPool', 'NetlabPoolConnection']
+
+
+class NetlabPoolConnection(ClassApiMixin, PodApiMixin, ReservationApiMixin, SystemApiMixin, LabApiMixin,
+                           UserApiMixin, VmApiMixin):
+    """
+    A group of active connections to a NETLAB+ that behaves like a single
+    :py:class:`netlab.async_client.NetlabConnection`. Should only be created by a :py:class:`NetlabPool`.
+    """
+    _server_version: str
+
+    def __init__(self, connections: List[NetlabConnection]):
+        assert connections, "a pool needs at least one connection"
+        self._connections = connections
+        self._server_version = connections[0]._server_version
+        self._next = 0
+
+    @property
+    def connections(self) -> List[NetlabConnection]:
+        """
+        The connections in this pool.
+        """
+        return list(self._connections)
+
+    def _select(self) -> NetlabConnection:
+        """
+        Pick the live connection with the fewest calls in flight. Ties are broken round robin so idle
+        connections share the work. A reconnecting connection is only used when no other is live.
+        """
+        count = len(self._connections)
+        start = self._next
+        self._next = (start + 1) % count
+
+        best: Optional[NetlabConnection] = None
+        reconnecting: Optional[NetlabConnection] = None
+        for i in range(count):
+            connection = self._connections[(start + i) % count]
+            if not connection.alive():
+                if reconnecting is None and not connection._closed:
+                    reconnecting = connection
+                continue
+            if best is None or connection._in_flight < best._in_flight:
+                best = connection
+
+        if best is None:
+            # calls on a connection that is reconnecting wait for it to come back
+            best = reconnecting
+        if best is None:
+            raise NetlabConnectionClosedError("No live connections in pool.")
+        return best
+
+    def alive(self) -> bool:
+        return any(connection.alive() for connection in self._connections)
+
+    async def call(self, method: str, **kwargs: Any) -> Any:
+        """
+        Send a call on the least loaded live connection in the pool.
+
+        :param method: The NETLAB+ method name.
+        :param kwargs: The arguments to pass to netlab.
+
+        .. warning::
+
+            In most cases, it is better to use the higher level methods, rather than this
+            low level method.
+        """
+        return await self._select().call(method, **kwargs)
+
+    async def call_many(self, calls: Iterable[Tuple[str, Dict[str, Any]]], **kwargs: Any) -> List[Any]:
+        """
+        Send a batch of calls on the least loaded live connection in the pool. See
+        :meth:`netlab.async_client.NetlabConnection.call_many`.
+
+        :param calls: ``(method, params)`` pairs.
+        :param kwargs: ``timeout`` or ``deadline`` for the batch, and ``raw``, ``lazy`` or ``numeric`` for its
+            results.
+
+        :return: The results in the same order as **calls**, with exceptions in place of failed calls.
+        """
+        return await self._select().call_many(calls, **kwargs)
+
+    def subscribe(self, event: str, **criteria: Any) -> EventStreamFactory:
+        """
+        Subscribe to a NETLAB+ event on the least loaded live connection in the pool.
+
+        :meta private:
+
+        :param event: The NETLAB+ event name.
+        :param critera: Any filtering criteria.
+
+        :return: Used to accept new events.
+        """
+        return self._select().subscribe(event, **criteria)
+
+
+class NetlabPool(object):
+    """
+    Async Context Manager for creating a pool of connections to NETLAB+.
+    """
+    _pool: Optional[NetlabPoolConnection]
+
+    def __init__(
+                self,
+                system: Optional[str] = 'default',
+                config: Union[None, NetlabServerConfig, Dict[str, Any]] = None,  # TODO Mypy cannot infer TypedDict
+                config_path: Optional[str] = None,
+                size: int = 4,
+            ):
+        """
+        :param system: The name to identify a NETLAB+ system. Defaults to **'default'**.
+        :param config: Configuration options. See :py:class:`netlab.config.NetlabServerConfig`.
+        :param config_path: File path location of a JSON config file to be used instead of the default location.
+        :param size: Number of connections to open. Defaults to **4**.
+        """
+        if size < 1:
+            raise ValueError('size must be at least 1')
+        self._config = get_system_config(system, config, config_path)
+        self._size = size
+        self._pool = None
+
+    async def __aenter__(self) -> NetlabPoolConnection:
+        assert self._pool is None
+        results = await asyncio.gather(
+            *[open_connection(self._config) for _ in range(self._size)],
+            return_exceptions=True)
+
+        connections = [r for r in results if isinstance(r, NetlabConnection)]
+        errors = [r for r in results if not isinstance(r, NetlabConnection)]
+        if errors:
+            await asyncio.gather(*[c._disconnect() for c in connections])
+            raise errors[0]
+
+        self._pool = NetlabPoolConnection(connections)
+        logger.debug('opened %s connections to %s', len(connections), self._config.host)
+        return self._pool
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        assert self._pool, "__aexit__ called without __aenter__"
+        await asyncio.gather(*[c._disconnect() for c in self._pool._connections])
+        self._pool = None
+        logger.debug('successfully disconnected pool from %s', self._config.host)
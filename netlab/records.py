@@ -0,0 +1,350 @@
+"""
+Result objects that convert their fields on first access.
+
+Converting every timestamp, Decimal, UUID and enum of a wide response costs far more than reading the two or three
+fields a caller usually wants. A :py:class:`LazyRecord` keeps the values as the server sent them and converts a
+field through :data:`netlab.serializer.FIELD_DECODERS` the first time it is read, keeping the result. It is a
+`dict`, so existing code keeps working: indexing, ``get``, ``items``, ``values``, comparisons, ``repr``,
+``dict(record)``, ``{**record}`` and JSON encoding all see converted values.
+
+Lazy records are requested with ``lazy=True`` on any call, or with the ``lazy`` config option.
+
+List methods that declare their properties, such as ``pod_list`` and ``user_account_list``, can instead return
+:py:class:`Record` objects with ``records=True``. Their classes are generated from the property lists with
+``__slots__``, so a row costs less than half the memory of a `dict`, and the fields are attributes as well as keys.
+"""
+
+import keyword
+import threading
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Mapping, Optional, Sequence, Set, Tuple, Type
+
+from .serializer import FIELD_DECODERS as _DECODERS
+
+__all__ = ['LazyRecord', 'lazy_records', 'Record', 'record_class', 'to_records']
+
+_MISSING = object()
+
+_FIELD_BITS: Dict[str, int] = {}
+_FIELD_BITS_LOCK = threading.Lock()
+
+
+def _field_bit(field: str) -> int:
+    # bits are never reused, so they stay valid when serializer.compile_decoders() runs again. Only fields with a
+    # decoder get one, which bounds the registry. The lock keeps two fields from sharing a bit.
+    bit = _FIELD_BITS.get(field)
+    if bit is None:
+        with _FIELD_BITS_LOCK:
+            bit = _FIELD_BITS.get(field)
+            if bit is None:
+                bit = _FIELD_BITS[field] = 1 << len(_FIELD_BITS)
+    return bit
+
+
+class LazyRecord(Dict[str, Any]):
+    """
+    A `dict` holding a NETLAB+ object whose fields are converted when they are first read. Nested objects and
+    lists are wrapped with :func:`lazy_records` when their field is first read.
+
+    Fields that are assigned are taken as already converted.
+    """
+    # one bit per converted field with a decoder, so the first read of a record allocates nothing. There is no
+    # __init__ either, so wrapping a decoded dict stays at C speed; _converted is set by whoever wraps, and missing
+    # means nothing converted. Nested values tell by their type whether they are wrapped, except those assigned,
+    # whose fields are kept in _plain.
+    __slots__ = ('_converted', '_plain')
+    _converted: int
+    _plain: Set[str]
+
+    def __getitem__(self, key: str) -> Any:
+        value = dict.__getitem__(self, key)
+        decoder = _DECODERS.get(key)
+        if decoder is None:
+            if (type(value) is dict or type(value) is list) and _unwrapped(value) and not self._assigned(key):
+                # nested objects are wrapped when first read, as eager conversion handles them before their parent
+                value = lazy_records(value)
+                dict.__setitem__(self, key, value)
+            return value
+        bit = _FIELD_BITS.get(key) or _field_bit(key)
+        try:
+            converted = self._converted
+        except AttributeError:
+            converted = 0
+        if converted & bit:
+            return value
+        self._converted = converted | bit
+        if type(value) is dict or type(value) is list:
+            value = lazy_records(value)
+        value = decoder(value)
+        dict.__setitem__(self, key, value)
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        dict.__setitem__(self, key, value)
+        self._mark(key, value)
+
+    def __iter__(self) -> Iterator[str]:
+        # overriding __iter__ makes dict(), ** and dict.update read values through __getitem__
+        return dict.__iter__(self)
+
+    def __eq__(self, other: Any) -> bool:
+        self._convert_all()
+        if isinstance(other, LazyRecord):
+            other._convert_all()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other: Any) -> bool:
+        self._convert_all()
+        if isinstance(other, LazyRecord):
+            other._convert_all()
+        return dict.__ne__(self, other)
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        self._convert_all()
+        return dict.__repr__(self)
+
+    def __reduce__(self) -> Any:
+        # keep pickles and copies lazy, e.g. records decoded in a process pool. Bits differ between processes, so
+        # the converted fields travel by name.
+        return self.__class__, (self._raw(),), self._converted_fields()
+
+    def __setstate__(self, state: List[str]) -> None:
+        self._converted = 0
+        for field in state:
+            self._mark(field, dict.__getitem__(self, field))
+
+    def __or__(self, other: Any) -> Any:
+        if not isinstance(other, dict):
+            return NotImplemented
+        result = self.copy()
+        result.update(other)
+        return result
+
+    def __ror__(self, other: Any) -> Any:
+        if not isinstance(other, dict):
+            return NotImplemented
+        result = dict(other)
+        result.update(self)
+        return result
+
+    def __ior__(self, other: Any) -> Any:
+        self.update(other)
+        return self
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if dict.__contains__(self, key):
+            return self[key]
+        return default
+
+    def pop(self, key: str, default: Any = _MISSING) -> Any:
+        if dict.__contains__(self, key):
+            value = self[key]
+            dict.__delitem__(self, key)
+            return value
+        if default is _MISSING:
+            raise KeyError(key)
+        return default
+
+    def popitem(self) -> Any:
+        self._convert_all()
+        return dict.popitem(self)
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if dict.__contains__(self, key):
+            return self[key]
+        self[key] = default
+        return default
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        other = dict(*args, **kwargs)
+        dict.update(self, other)
+        for key, value in other.items():
+            self._mark(key, value)
+
+    def items(self) -> Any:
+        self._convert_all()
+        return dict.items(self)
+
+    def values(self) -> Any:
+        self._convert_all()
+        return dict.values(self)
+
+    def copy(self) -> 'LazyRecord':
+        record = self.__class__(self._raw())
+        try:
+            record._converted = self._converted
+        except AttributeError:
+            pass
+        try:
+            record._plain = set(self._plain)
+        except AttributeError:
+            pass
+        return record
+
+    def _raw(self) -> Dict[str, Any]:
+        # dict.copy would read the values through __getitem__, converting them
+        return dict(dict.items(self))
+
+    def _mark(self, key: str, value: Any) -> None:
+        if _DECODERS.get(key) is not None:
+            try:
+                converted = self._converted
+            except AttributeError:
+                converted = 0
+            self._converted = converted | _field_bit(key)
+        elif type(value) is dict or type(value) is list:
+            try:
+                self._plain.add(key)
+            except AttributeError:
+                self._plain = {key}
+        # __getitem__ returns any other value as it is, there is nothing to remember
+
+    def _assigned(self, key: str) -> bool:
+        try:
+            return key in self._plain
+        except AttributeError:
+            return False
+
+    def _converted_fields(self) -> List[str]:
+        try:
+            converted = self._converted
+        except AttributeError:
+            converted = 0
+        return [
+            field for field in dict.keys(self) if converted & _FIELD_BITS.get(field, 0) or self._assigned(field)]
+
+    def _convert_all(self) -> None:
+        for key in dict.keys(self):
+            self[key]
+
+
+def _unwrapped(value: Any) -> bool:
+    # lazy_records wraps the dicts of a list in place, so a list is wrapped once no dict is left in it
+    if type(value) is dict:
+        return True
+    return any(type(item) is dict or type(item) is list and _unwrapped(item) for item in value)
+
+
+def lazy_records(obj: Any) -> Any:
+    """
+    Wrap the objects of a decoded message in :py:class:`LazyRecord`. Only the top level is wrapped now, a list
+    in place, everything nested is wrapped as it is read.
+
+    :param obj: A message decoded without field conversion.
+    :return: **obj**, or its replacement when it is a `dict`.
+    """
+    if type(obj) is dict:
+        record = LazyRecord(obj)
+        record._converted = 0
+        return record
+    if type(obj) is list:
+        obj[:] = map(lazy_records, obj)
+    return obj
+
+
+class Record(Mapping[str, Any]):
+    """
+    Base of the record classes made by :func:`record_class`.
+
+    Each property is a slot, read as ``record.pod_id`` or ``record['pod_id']``. A property the server did not return
+    is missing, as it would be from a `dict`. Properties outside the class's list are kept in a `dict` of their own.
+    """
+    __slots__ = ('_extra',)
+    _extra: Optional[Dict[str, Any]]
+    _fields: Tuple[str, ...] = ()
+    "Properties stored in slots, in order."
+    _field_set: FrozenSet[str] = frozenset()
+
+    @classmethod
+    def from_dict(cls, obj: Dict[str, Any]) -> 'Record':
+        """
+        Make a record from a result object.
+        """
+        record = object.__new__(cls)
+        fields = cls._field_set
+        extra: Optional[Dict[str, Any]] = None
+        for key, value in obj.items():
+            if key in fields:
+                setattr(record, key, value)
+            elif extra is None:
+                extra = {key: value}
+            else:
+                extra[key] = value
+        record._extra = extra
+        return record
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._field_set:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                pass
+        elif self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __getattr__(self, name: str) -> Any:
+        # only called for names that are not slots, or slots the server did not return
+        if name not in self._field_set and name != '_extra' and self._extra is not None and name in self._extra:
+            return self._extra[name]
+        raise AttributeError("'{}' record has no property '{}'".format(type(self).__name__, name))
+
+    def __iter__(self) -> Iterator[str]:
+        for field in self._fields:
+            if hasattr(self, field):
+                yield field
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return '{}({})'.format(
+            type(self).__name__, ', '.join('{}={!r}'.format(key, value) for key, value in self.items()))
+
+    def __reduce__(self) -> Any:
+        # generated classes cannot be pickled by reference, so they are made again when loading
+        return _load_record, (type(self).__name__, self._fields, self.to_dict())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return the record as a `dict`, as the call would have returned without ``records=True``.
+        """
+        return dict(self.items())
+
+
+_RECORD_CLASSES: Dict[Tuple[str, Tuple[str, ...]], Type[Record]] = {}
+
+
+def record_class(name: str, properties: Iterable[str]) -> Type[Record]:
+    """
+    Get the record class for a property list, e.g. ``record_class('Pod', PodApiMixin.pod_props)``. The class is
+    made once for each name and list.
+
+    :param name: Class name.
+    :param properties: The properties to give slots. Duplicates are ignored, as are names that cannot be
+        attributes; those are kept like any other property outside the list.
+    """
+    if isinstance(properties, str):
+        properties = [properties]
+    fields = tuple(field for field in dict.fromkeys(properties)
+                   if field.isidentifier() and not keyword.iskeyword(field) and not hasattr(Record, field))
+    cls = _RECORD_CLASSES.get((name, fields))
+    if cls is None:
+        cls = _RECORD_CLASSES[name, fields] = type(name, (Record,), {
+            '__slots__': fields, '__module__': __name__, '_fields': fields, '_field_set': frozenset(fields)})
+    return cls
+
+
+def to_records(rows: Iterable[Dict[str, Any]], name: str, properties: Sequence[str]) -> List[Record]:
+    """
+    Convert result objects to records of :func:`record_class`.
+    """
+    from_dict = record_class(name, properties).from_dict
+    return [from_dict(row) for row in rows]
+
+
+def _load_record(name: str, fields: Tuple[str, ...], obj: Dict[str, Any]) -> Record:
+    return record_class(name, fields).from_dict(obj)
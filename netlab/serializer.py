@@ -1,5 +1,8 @@
-from typing import Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import functools
 import json
+import re
+from collections.abc import Mapping
 from datetime import date, datetime, timedelta
 from decimal import Decimal
 from enum import Enum
@@ -195,59 +198,205 @@ def deserialize(data):
 
 
 def resolve_enum(enum, value):
-    if not isinstance(enum, tuple):
-        enum = (enum,)
-    for e in enum:
+    """
+    Resolve a value to a member of **enum**, or of the first of a tuple of candidates that accepts it. Candidates
+    that are not enums, such as `int`, coerce values no enum has.
+
+    :raises ResponseFormatError: No candidate accepts the value.
+    """
+    resolver = _ENUM_RESOLVERS.get(enum)
+    if resolver is None:
+        resolver = _ENUM_RESOLVERS[enum] = _enum_resolver(enum)
+    return resolver(value)
+
+
+ENUM_CSV_CACHE_SIZE = 1024
+"Number of recently seen comma separated values, such as ``acc_privs``, each :data:`ENUM_CSV` field remembers."
+
+_ENUM_RESOLVERS: Dict[Any, Callable[[Any], Any]] = {}
+
+
+def _enum_resolver(enum):
+    # every member by value, so the common case is one dict lookup. Enum candidates are only called for values
+    # that are not keys, e.g. unhashable ones, and coercions such as int are tried after the lookup misses rather
+    # than after an enum raises.
+    candidates = enum if isinstance(enum, tuple) else (enum,)
+    enum_candidates = [c for c in candidates if isinstance(c, type) and issubclass(c, Enum)]
+    coercions = tuple(c for c in candidates if c not in enum_candidates)
+    members: Dict[Any, Enum] = {}
+    for candidate in reversed(enum_candidates):
+        members.update((member.value, member) for member in candidate)
+        members.update((member, member) for member in candidate)
+
+    def resolve(value):
         try:
-            return e(value)
-        except:  # noqa
-            pass
-    raise ResponseFormatError("The value {} could not resolve to one of '{}'.".format(
-        value, enum))
+            member = members.get(value)
+        except TypeError:
+            # unhashable values are left to the enums to compare
+            fallbacks = candidates
+        else:
+            if member is not None:
+                return member
+            fallbacks = coercions
+        for fallback in fallbacks:
+            try:
+                return fallback(value)
+            except:  # noqa
+                pass
+        raise ResponseFormatError("The value {} could not resolve to one of '{}'.".format(
+            value, candidates))
+    return resolve
+
+
+def _enum_csv(enum):
+    # privilege lists repeat across accounts, so each distinct string is split and looked up once. The cached
+    # tuple is copied to a new list every time, as callers may change the list they get.
+    members = dict(enum.__members__)
+
+    @functools.lru_cache(maxsize=ENUM_CSV_CACHE_SIZE)
+    def split(value):
+        return tuple(members[name] for name in value.split(','))
+    return lambda value: list(split(value))
+
+
+def _split_csv(value):
+    return value.split(',')
+
+
+def _none(value):
+    return None
+
+
+def _is_not_none(value):
+    return value is not None
+
+
+def _is_blank(value):
+    return value == ''
+
+
+def _when_not_none(converter):
+    return lambda value: converter(value) if value is not None else value
+
+
+def _when_blank(converter):
+    return lambda value: converter(value) if value == '' else value
+
+
+_GUARDED = {_is_not_none: _when_not_none, _is_blank: _when_blank}
+
+
+def _chain(steps):
+    # every converter sees the original value and the last one that applies wins, in the order of the field sets
+    def convert(value):
+        result = value
+        for converter, guard in steps:
+            if guard is None or guard(value):
+                result = converter(value)
+        return result
+    return convert
+
+
+def compile_decoders():
+    """
+    Compile the field sets above into :data:`FIELD_DECODERS` and :data:`FLOAT_FIELD_DECODERS`. Call again after
+    changing any of the sets.
+    """
+    for decoders, decimal in ((FIELD_DECODERS, to_decimal), (FLOAT_FIELD_DECODERS, to_float)):
+        decoders.clear()
+        decoders.update(_compile(decimal))
+
+
+def _compile(decimal):
+    steps: Dict[str, List[Tuple[Callable[[Any], Any], Optional[Callable[[Any], bool]]]]] = {}
+
+    def add(fields, converter, guard=None):
+        for field in fields:
+            steps.setdefault(field, []).append((converter, guard))
+
+    add(DATE_FIELDS, to_date)
+    add(DATETIME_FIELDS, to_datetime)
+    add(TIMEDELTA_FIELDS, to_timedelta)
+    add(BOOLEAN_FIELDS, to_bool)
+    add(DECIMAL_FIELDS, decimal)
+    add(INT_FIELDS, to_int)
+    add(UUID_FIELDS, to_uuid)
+    for field, enum in ENUMS.items():
+        add([field], _enum_resolver(enum), _is_not_none)
+    for field, enum in ENUM_CSV.items():
+        add([field], _enum_csv(enum), _is_not_none)
+    add(STR_CSV, _split_csv)
+    add(BLANK_IS_NONE_FIELDS, _none, _is_blank)
+
+    decoders = {}
+    for field, field_steps in steps.items():
+        if len(field_steps) > 1:
+            decoders[field] = _chain(field_steps)
+        else:
+            converter, guard = field_steps[0]
+            decoders[field] = converter if guard is None else _GUARDED[guard](converter)
+    return decoders
+
+
+FIELD_DECODERS: Dict[str, Callable[[Any], Any]] = {}
+"Converter for each field that needs one, built from the field sets by :func:`compile_decoders`."
+
+FLOAT_FIELD_DECODERS: Dict[str, Callable[[Any], Any]] = {}
+"As :data:`FIELD_DECODERS`, but :data:`DECIMAL_FIELDS` convert to `float` with :func:`to_float`."
+
+NUMERIC_MODES = ('decimal', 'float')
+"Values of the ``numeric`` option: convert :data:`DECIMAL_FIELDS` to `decimal.Decimal` or to `float`."
 
 
 def process(obj):
-    for field, value in obj.items():
-        if field in DATE_FIELDS:
-            obj[field] = to_date(value)
-        if field in DATETIME_FIELDS:
-            obj[field] = to_datetime(value)
-        if field in TIMEDELTA_FIELDS:
-            obj[field] = to_timedelta(value)
-        if field in BOOLEAN_FIELDS:
-            obj[field] = to_bool(value)
-        if field in DECIMAL_FIELDS:
-            obj[field] = to_decimal(value)
-        if field in INT_FIELDS:
-            obj[field] = to_int(value)
-        if field in UUID_FIELDS:
-            obj[field] = to_uuid(value)
-        if field in ENUMS and value is not None:
-            obj[field] = resolve_enum(ENUMS[field], value)
-        if field in ENUM_CSV and value is not None:
-            enum = ENUM_CSV[field]
-            obj[field] = list(map(lambda v: enum[v], value.split(',')))
-        if field in STR_CSV:
-            obj[field] = value.split(',')
-        if field in BLANK_IS_NONE_FIELDS and value == '':
-            obj[field] = None
+    decoders = FIELD_DECODERS
+    for field in decoders.keys() & obj.keys():
+        obj[field] = decoders[field](obj[field])
     return obj
 
 
+def process_floats(obj):
+    decoders = FLOAT_FIELD_DECODERS
+    for field in decoders.keys() & obj.keys():
+        obj[field] = decoders[field](obj[field])
+    return obj
+
+
+TIMESTAMP_CACHE_SIZE = 4096
+"Number of recently seen date and timestamp strings :func:`to_date` and :func:`to_datetime` remember."
+
+_NAN = float('nan')
+
+_DATE_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2})', re.ASCII)
+_DATETIME_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2}) (\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6}))?', re.ASCII)
+
+
+@functools.lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
 def to_date(value):
     if value:
-        return datetime.strptime(value, '%Y-%m-%d').date()
+        match = _DATE_RE.fullmatch(value)
+        if match is None:
+            # unpadded or otherwise unusual dates
+            return datetime.strptime(value, '%Y-%m-%d').date()
+        return date(int(match[1]), int(match[2]), int(match[3]))
     else:
         return None
 
 
+@functools.lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
 def to_datetime(value):
     if value:
-        try:
-            return datetime.strptime(value, '%Y-%m-%d %H:%M:%S')
-        except ValueError:
-            # rarely timestamps include microseconds. catch and process those
-            return datetime.strptime(value, '%Y-%m-%d %H:%M:%S.%f')
+        match = _DATETIME_RE.fullmatch(value)
+        if match is None:
+            try:
+                return datetime.strptime(value, '%Y-%m-%d %H:%M:%S')
+            except ValueError:
+                return datetime.strptime(value, '%Y-%m-%d %H:%M:%S.%f')
+        # rarely timestamps include microseconds
+        fraction = match[7]
+        return datetime(
+            int(match[1]), int(match[2]), int(match[3]), int(match[4]), int(match[5]), int(match[6]),
+            int(fraction.ljust(6, '0')) if fraction else 0)
     else:
         return None
 
@@ -273,6 +422,13 @@ def to_decimal(value):
         return None
 
 
+def to_float(value):
+    # blank values are nan rather than None, so results can go straight into arithmetic. Zero stays zero.
+    if value is None or value == '':
+        return _NAN
+    return float(value)
+
+
 def to_int(value):
     if value:
         return int(value)
@@ -296,27 +452,52 @@ def serialize(data, pretty=False):
 
 
 def default(obj):
-    if isinstance(obj, Enum):
-        return obj.value
-    if isinstance(obj, datetime):
-        return from_datetime(obj)
-    if isinstance(obj, date):
-        return from_date(obj)
-    if isinstance(obj, timedelta):
-        return from_timedelta(obj)
-    if isinstance(obj, UUID):
-        return from_uuid(obj)
-    if isinstance(obj, Decimal):
-        return from_decimal(obj)
-    return obj
+    encoder = _ENCODERS.get(type(obj))
+    if encoder is None:
+        encoder = _ENCODERS[type(obj)] = _encoder_for(type(obj))
+    return encoder(obj)
+
+
+def _encoder_for(cls):
+    # the checks default() once ran for every value, now run once per type
+    if issubclass(cls, Enum):
+        return _enum_value
+    if issubclass(cls, datetime):
+        return from_datetime
+    if issubclass(cls, date):
+        return from_date
+    if issubclass(cls, timedelta):
+        return from_timedelta
+    if issubclass(cls, UUID):
+        return from_uuid
+    if issubclass(cls, Decimal):
+        return from_decimal
+    if issubclass(cls, Mapping):
+        # records and other mappings that aren't dicts
+        return _mapping_dict
+    return _unchanged
+
+
+def _enum_value(value):
+    return value.value
+
+
+def _mapping_dict(value):
+    to_dict = getattr(value, 'to_dict', None)
+    return to_dict() if to_dict is not None else dict(value)
+
+
+def _unchanged(value):
+    return value
 
 
 def from_date(value):
-    return value.strftime("%Y-%m-%d")
+    return '%04d-%02d-%02d' % (value.year, value.month, value.day)
 
 
 def from_datetime(value):
-    return value.strftime("%Y-%m-%d %H:%M:%S")
+    return '%04d-%02d-%02d %02d:%02d:%02d' % (
+        value.year, value.month, value.day, value.hour, value.minute, value.second)
 
 
 def from_timedelta(value):
@@ -333,3 +514,16 @@ def from_uuid(value):
 
 def from_decimal(value):
     return str(value)
+
+
+# encoder for each type default() has seen, the types below up front and others as they come along
+_ENCODERS = {
+    UUID: from_uuid,
+    datetime: from_datetime,
+    date: from_date,
+    timedelta: from_timedelta,
+    Decimal: from_decimal,
+}
+
+
+compile_decoders()
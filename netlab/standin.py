@@ -0,0 +1,431 @@
+"""
+A local stand-in for a NETLAB+ API server, for benchmarks and soak tests.
+
+`StandInServer` speaks the same newline delimited JSON-RPC protocol as a NETLAB+ appliance. It authenticates any
+user, answers ``system.status.get`` and keep-alive pings, completes ``.task`` methods through ``notify_handle``,
+answers ``task.check`` polls for tasks that report progress that way, emits events to ``event.subscribe``
+subscribers, and returns canned records for the main list and get methods. Latency, payload size and error rate
+are configurable, so client throughput can be measured on any machine without an appliance.
+
+The records are realistic in shape only, they are generated and nothing is stored between calls.
+
+**Usage**
+
+::
+
+    async with StandInServer(latency=0.005, records=200) as server:
+        async with NetlabClient(config=server.config()) as client:
+            pods = await client.pod_list()
+
+Or from a shell::
+
+    python -m netlab.standin --port 9000 --latency 0.005
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import random
+import ssl
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from .async_client import UGLY_TASKS
+
+logger = logging.getLogger(__name__)
+
+__all__ = ['StandInServer']
+
+Handler = Callable[[Dict[str, Any]], Any]
+
+UNFAILING_METHODS = {
+    'user.authenticate', 'system.status.get', 'internal.mbusd.ping', 'task.check', 'event.subscribe',
+    'event.unsubscribe',
+}
+"Methods that never get an injected error, so connections can always be opened and kept alive."
+
+_EPOCH = datetime(2022, 1, 3, 8, 30, 0)
+
+
+def _timestamp(n: int) -> str:
+    return (_EPOCH + timedelta(minutes=17 * n)).strftime('%Y-%m-%d %H:%M:%S')
+
+
+class StandInServer(object):
+    """
+    Async Context Manager for a local server that answers NETLAB+ API calls.
+    """
+
+    def __init__(
+                self,
+                host: str = '127.0.0.1',
+                port: int = 0,
+                *,
+                latency: float = 0.0,
+                jitter: float = 0.0,
+                task_latency: float = 0.05,
+                records: int = 25,
+                accounts: int = 1000,
+                padding: int = 0,
+                error_rate: float = 0.0,
+                error_code: str = 'E_NETLAB_ERROR',
+                event_interval: float = 1.0,
+                ssl_context: Optional[ssl.SSLContext] = None,
+                seed: Optional[int] = None,
+            ):
+        """
+        :param host: Address to listen on.
+        :param port: Port to listen on. ``0`` picks a free port, see :attr:`port`.
+        :param latency: Seconds to wait before answering each call.
+        :param jitter: Up to this many seconds are added to **latency** at random.
+        :param task_latency: Seconds between accepting a task and reporting it complete.
+        :param records: Number of records returned by list methods.
+        :param accounts: Number of accounts ``user.account.search.task`` pages through.
+        :param padding: Extra bytes of text added to every record, to test large responses.
+        :param error_rate: Fraction of calls, between ``0`` and ``1``, answered with **error_code** instead.
+        :param error_code: The NETLAB+ error returned for injected errors.
+        :param event_interval: Seconds between events sent to each subscription.
+        :param ssl_context: Serve over TLS with this context. Defaults to plain TCP.
+        :param seed: Seed for latency jitter and error injection, for repeatable runs.
+        """
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.jitter = jitter
+        self.task_latency = task_latency
+        self.records = records
+        self.accounts = accounts
+        self.padding = padding
+        self.error_rate = error_rate
+        self.error_code = error_code
+        self.event_interval = event_interval
+        self._ssl = ssl_context
+        self._random = random.Random(seed)
+
+        self.calls: Dict[str, int] = {}
+        "Number of calls received for each method."
+
+        self.handlers: Dict[str, Handler] = {
+            'user.authenticate': lambda params: 'OK',
+            'internal.mbusd.ping': lambda params: 'OK',
+            'system.status.get': self._system_status_get,
+            'system.perf.query': lambda params: [self._perf(n) for n in range(1, self.records + 1)],
+            'pod.list': lambda params: [self._pod(n) for n in range(1, self.records + 1)],
+            'pod.get': lambda params: self._pod(int(params.get('pod_id') or 1)),
+            'pod.types.list': lambda params: [self._pod_type(n) for n in range(1, self.records + 1)],
+            'class.list': lambda params: [self._class(n) for n in range(1, self.records + 1)],
+            'class.get': lambda params: self._class(int(params.get('cls_id') or 1)),
+            'user.account.get': lambda params: self._account(int(params.get('acc_id') or 1)),
+            'user.account.search.task': self._user_account_search,
+            'reservation.query': lambda params: [self._reservation(n) for n in range(1, self.records + 1)],
+            'vm.inventory.get': lambda params: [self._vm(n) for n in range(1, self.records + 1)],
+            'user.community.list': lambda params: [self._community(n) for n in range(1, self.records + 1)],
+            'vm.datacenter.list': lambda params: [self._datacenter(n) for n in range(1, self.records + 1)],
+            'vm.host.list': lambda params: [self._host(n) for n in range(1, self.records + 1)],
+        }
+        """
+        Answers for each method, called with the call's params. Add or replace entries to change the canned
+        responses. Methods without a handler answer ``'OK'``.
+        """
+
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._tasks: Dict[int, Any] = {}
+        self._task_ids = itertools.count(1)
+        self._background: Set['asyncio.Future[Any]'] = set()
+        self._writers: Set[asyncio.StreamWriter] = set()
+
+    async def __aenter__(self) -> 'StandInServer':
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def start(self) -> None:
+        """
+        Start listening. When **port** is ``0``, :attr:`port` is set to the port picked.
+        """
+        assert self._server is None
+        self._server = await asyncio.start_server(
+            self._serve, self.host, self.port, ssl=self._ssl, limit=2 ** 24)
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.debug('stand-in server listening on %s:%s', self.host, self.port)
+
+    async def close(self) -> None:
+        """
+        Stop listening and drop every connection.
+        """
+        if self._server is None:
+            return
+        self._server.close()
+        for future in list(self._background):
+            future.cancel()
+        for writer in list(self._writers):
+            writer.close()
+        await self._server.wait_closed()
+        self._server = None
+
+    def drop(self, port: Optional[int] = None) -> int:
+        """
+        Close connections as a network failure would, while still listening for new ones.
+
+        :param port: Only close the connection from this client port.
+
+        :return: Number of connections closed.
+        """
+        writers = [writer for writer in self._writers if port is None or writer.get_extra_info('peername')[1] == port]
+        for writer in writers:
+            writer.close()
+        return len(writers)
+
+    def config(self, **options: Any) -> Dict[str, Any]:
+        """
+        Config for connecting to this server, for :py:class:`netlab.async_client.NetlabClient`.
+
+        :param options: Any other config options. See :py:class:`netlab.config.NetlabServerConfig`.
+        """
+        config: Dict[str, Any] = {
+            'host': self.host, 'port': self.port, 'user': 'standin', 'token': 'standin',
+            'ssl': 'self_signed' if self._ssl else False,
+        }
+        config.update(options)
+        return config
+
+    def _spawn(self, coro: Any) -> None:
+        future = asyncio.ensure_future(coro)
+        self._background.add(future)
+        future.add_done_callback(self._background.discard)
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        subscriptions: Set[str] = set()
+        self._writers.add(writer)
+        try:
+            while True:
+                try:
+                    line = await reader.readuntil(b'\n')
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                request = json.loads(line)
+                self.calls[request['method']] = self.calls.get(request['method'], 0) + 1
+                delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+                if delay:
+                    self._spawn(self._respond_later(delay, request, writer, subscriptions))
+                else:
+                    self._respond(request, writer, subscriptions)
+        finally:
+            subscriptions.clear()
+            self._writers.discard(writer)
+            writer.close()
+
+    async def _respond_later(self, delay: float, *args: Any) -> None:
+        await asyncio.sleep(delay)
+        self._respond(*args)
+
+    def _respond(self, request: Dict[str, Any], writer: asyncio.StreamWriter, subscriptions: Set[str]) -> None:
+        method = request['method']
+        params = request.get('params') or {}
+
+        if method not in UNFAILING_METHODS and self.error_rate and self._random.random() < self.error_rate:
+            self._write(writer, {'id': request['id'], 'jsonrpc': '2.0', 'error': {
+                'message': self.error_code, 'data': {'message': 'injected by the stand-in server'}}})
+            return
+
+        if method == 'event.subscribe':
+            subscriptions.add(params['handle'])
+            self._spawn(self._emit(writer, params['event'], params['handle'], subscriptions))
+            result: Any = 'OK'
+        elif method == 'event.unsubscribe':
+            subscriptions.discard(params.get('handle'))
+            result = 'OK'
+        elif method == 'task.check':
+            if params.get('task_id') not in self._tasks:
+                self._write(writer, {'id': request['id'], 'jsonrpc': '2.0', 'error': {
+                    'message': 'E_TASK_NOT_FOUND', 'data': {'message': 'unknown task'}}})
+                return
+            done_at, task_result = self._tasks[params['task_id']]
+            complete = asyncio.get_event_loop().time() >= done_at
+            if complete:
+                del self._tasks[params['task_id']]
+            result = {'is_complete': complete, 'result': task_result if complete else None}
+        else:
+            handler = self.handlers.get(method)
+            result = handler(params) if handler is not None else 'OK'
+
+        if method in UGLY_TASKS:
+            task_id = next(self._task_ids)
+            self._tasks[task_id] = (asyncio.get_event_loop().time() + self.task_latency, result)
+            result = task_id
+        elif method.endswith('.task') and params.get('notify_handle'):
+            self._spawn(self._complete(writer, params['notify_handle'], result))
+            result = next(self._task_ids)
+
+        self._write(writer, {'id': request['id'], 'jsonrpc': '2.0', 'result': result})
+
+    async def _complete(self, writer: asyncio.StreamWriter, handle: str, result: Any) -> None:
+        await asyncio.sleep(self.task_latency)
+        self._write(writer, {'handle': handle, 'jsonrpc': '2.0', 'params': {'result': result}})
+
+    async def _emit(self, writer: asyncio.StreamWriter, event: str, handle: str, subscriptions: Set[str]) -> None:
+        for seq in itertools.count(1):
+            await asyncio.sleep(self.event_interval)
+            if handle not in subscriptions or writer.is_closing():
+                return
+            self._write(writer, {'handle': handle, 'event': event, 'params': {
+                'seq': seq, 'time': datetime.now().strftime('%Y-%m-%d %H:%M:%S')}})
+
+    def _write(self, writer: asyncio.StreamWriter, message: Dict[str, Any]) -> None:
+        if not writer.is_closing():
+            writer.write(json.dumps(message).encode('utf-8') + b'\n')
+
+    def _pad(self, record: Dict[str, Any], field: str) -> Dict[str, Any]:
+        if self.padding:
+            record[field] += ' ' + 'x' * self.padding
+        return record
+
+    def _system_status_get(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            'cpu_n': '8', 'uptime_sec': '86400.25', 'hostname': 'standin', 'sys_lic_exp_date': '2030-01-01',
+            'sys_lic_op_state': 'ACTIVE', 'sys_logins_enabled': '1', 'sys_maint_ends': None, 'sys_mode': 'NORMAL',
+            'sys_name': 'NETLAB+ stand-in', 'sys_product_id': 'VE', 'sys_sdn_release_date': '2022-04-01',
+            'sys_sdn_release_type': 'GA', 'sys_sdn_version': '22.4.0', 'sys_serial': '0000-0000',
+        }
+
+    def _perf(self, n: int) -> Dict[str, Any]:
+        metric, source = [('cpu_pct', 'sysspd'), ('mem_used_pct', 'sysspd'), ('res_active', 'respd'),
+                          ('user_logins', 'userspd')][n % 4]
+        return {'sp_time': _timestamp(n // 4), 'sp_metric': metric, 'sp_source': source,
+                'sp_value': '{:.2f}'.format((n * 7.31) % 100)}
+
+    def _pod(self, n: int) -> Dict[str, Any]:
+        return self._pad({
+            'pod_id': str(n), 'pod_name': 'Pod {}'.format(n), 'pod_uuid': str(uuid.UUID(int=n)),
+            'pod_cat': 'NV', 'pod_admin_state': 'ONLINE', 'pod_current_state': 'ONLINE' if n % 3 else 'OFFLINE',
+            'pod_desc': 'Stand-in pod {}'.format(n), 'pod_acl_enabled': '0', 'pod_dyn_vlan': '1',
+            'pod_managed': '1', 'pod_res_id': str(n * 11) if n % 4 == 0 else None, 'pt_id': 'STANDIN_POD',
+            'pt_name': 'Stand-in Pod', 'pt_desc': 'Stand-in pod type', 'pt_apdid': 'NDG', 'pt_gpdid': '1.0',
+            'def_topology_image': '/img/topology.png', 'sched_image': '/img/sched.png',
+        }, 'pod_desc')
+
+    def _pod_type(self, n: int) -> Dict[str, Any]:
+        return self._pad({
+            'pt_id': 'STANDIN_{}'.format(n), 'pt_name': 'Stand-in Pod Type {}'.format(n),
+            'pt_desc': 'Stand-in pod type', 'pt_build': str(n), 'pt_pod_max': '64', 'pt_removable': '1',
+            'pt_vlan_pool': '0', 'remote_pc_count': '4',
+        }, 'pt_desc')
+
+    def _class(self, n: int) -> Dict[str, Any]:
+        return self._pad({
+            'cls_id': str(n), 'cls_name': 'Class {}'.format(n), 'cls_uuid': str(uuid.UUID(int=n)),
+            'cls_start_date': '2022-01-03', 'cls_end_date': '2022-05-13', 'cls_lab_limit': 'E',
+            'cls_email_logs': 'N', 'cls_self_sched': '1', 'cls_team_sched': '0', 'com_id': '1',
+        }, 'cls_name')
+
+    def _account(self, n: int) -> Dict[str, Any]:
+        return self._pad({
+            'acc_id': str(n), 'acc_user_id': 'user{}'.format(n), 'acc_full_name': 'User Number {}'.format(n),
+            'acc_display_name': 'User {}'.format(n), 'acc_sort_name': 'Number {}, User'.format(n),
+            'acc_email': 'user{}@example.com'.format(n), 'acc_type': 'SIZ'[n % 3],
+            'acc_privs': 'COMWIDE,LAB_DESIGNER' if n % 10 == 0 else None, 'acc_can_login': '1',
+            'acc_pw_change': '0', 'acc_sys': '0', 'acc_logins': str(n % 97),
+            'acc_last_login': _timestamp(n), 'acc_time_created': _timestamp(n // 2),
+            'acc_last_ip': '10.0.{}.{}'.format(n // 256 % 256, n % 256), 'acc_uuid': str(uuid.UUID(int=n)),
+            'com_id': '1', 'tz_id': '52',
+        }, 'acc_full_name')
+
+    def _user_account_search(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        limit = int(params.get('limit') or 100)
+        page = params.get('page')
+        offset = params.get('offset')
+        total_pages = -(-self.accounts // limit)
+
+        data: List[Dict[str, Any]] = []
+        start = None
+        if offset is not None:
+            start = int(offset)
+        elif page is not None:
+            start = (int(page) - 1) * limit
+        if start is not None:
+            properties = params.get('properties')
+            for n in range(start + 1, min(start + limit, self.accounts) + 1):
+                record = self._account(n)
+                if isinstance(properties, list):
+                    record = {k.split('.')[-1]: record.get(k.split('.')[-1]) for k in properties}
+                data.append(record)
+
+        return {
+            'current_page': page, 'page_limit': limit, 'page_length': len(data), 'total_pages': total_pages,
+            'total_records': self.accounts, 'out_of_bounds': '0' if data or page is None else '1', 'data': data,
+        }
+
+    def _reservation(self, n: int) -> Dict[str, Any]:
+        return self._pad({
+            'res_id': str(n), 'res_uuid': str(uuid.UUID(int=n)), 'res_type': 'SCTI'[n % 4], 'res_pod_id': str(n),
+            'res_acc_id': str(n), 'res_cls_id': '1', 'res_com_id': '1', 'res_pt_id': 'STANDIN_POD',
+            'res_start': _timestamp(n), 'res_end': _timestamp(n + 7), 'res_minutes': '120',
+            'res_active_time': _timestamp(n) if n % 2 else None, 'res_is_active': str(n % 2), 'res_done': '0',
+            'res_flags': '0', 'res_init_fail': '0', 'res_team': 'A' if n % 5 else '',
+            'pod_id': str(n), 'pod_name': 'Pod {}'.format(n), 'pod_desc': 'Stand-in pod {}'.format(n),
+            'acc_id': str(n), 'acc_full_name': 'User Number {}'.format(n), 'cls_id': '1', 'cls_name': 'Class 1',
+        }, 'pod_desc')
+
+    def _vm(self, n: int) -> Dict[str, Any]:
+        return self._pad({
+            'vm_id': str(n), 'vm_name': 'vm{}'.format(n), 'vm_role': ['NORMAL', 'MASTER', 'TEMPLATE'][n % 3],
+            'vm_alloc_cpu_n': '2', 'vm_alloc_mem_mb': '4096', 'vm_child_count': str(n % 4),
+            'vm_comments': 'Stand-in VM {}'.format(n), 'vm_date_added': _timestamp(n),
+            'vm_parent_id': None, 'vdc_id': '1', 'vdc_name': 'Datacenter 1', 'vh_id': str(n % 8 + 1),
+            'vh_name': 'host{}'.format(n % 8 + 1), 'pc_id': str(n % 4 + 1), 'pc_pod_id': str(n // 4 + 1),
+            'pod_name': 'Pod {}'.format(n // 4 + 1),
+        }, 'vm_comments')
+
+    def _community(self, n: int) -> Dict[str, Any]:
+        return self._pad({
+            'com_id': str(n), 'com_full_name': 'Community {}'.format(n), 'com_enabled': '1',
+            'com_uuid': str(uuid.UUID(int=n)), 'com_max_slots_per_res': '4', 'com_min_hours_btw_res': '0',
+        }, 'com_full_name')
+
+    def _datacenter(self, n: int) -> Dict[str, Any]:
+        return self._pad({
+            'vdc_id': str(n), 'vdc_name': 'Datacenter {}'.format(n), 'vdc_address': '10.1.0.{}'.format(n % 256),
+            'vdc_date_added': _timestamp(n), 'vdc_date_tested': _timestamp(n + 1),
+        }, 'vdc_name')
+
+    def _host(self, n: int) -> Dict[str, Any]:
+        return self._pad({
+            'vh_id': str(n), 'vh_name': 'host{}'.format(n), 'vdc_id': '1', 'vh_online': '1',
+            'vh_cpu_cores': '16', 'vh_cpu_mhz': '2400', 'vh_memory_mb': '131072', 'vh_pra_enabled': '0',
+            'vh_date_added': _timestamp(n), 'vh_date_tested': _timestamp(n + 1),
+        }, 'vh_name')
+
+
+async def _main() -> None:
+    parser = argparse.ArgumentParser(description='Serve a local stand-in for the NETLAB+ API.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=9000)
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--jitter', type=float, default=0.0)
+    parser.add_argument('--task-latency', type=float, default=0.05)
+    parser.add_argument('--records', type=int, default=25)
+    parser.add_argument('--accounts', type=int, default=1000)
+    parser.add_argument('--padding', type=int, default=0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    server = StandInServer(
+        args.host, args.port, latency=args.latency, jitter=args.jitter, task_latency=args.task_latency,
+        records=args.records, accounts=args.accounts, padding=args.padding, error_rate=args.error_rate,
+        seed=args.seed)
+    async with server:
+        print('serving on {}:{}'.format(server.host, server.port))
+        await asyncio.Event().wait()
+
+
+if __name__ == '__main__':
+    try:
+        asyncio.run(_main())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,288 @@
+"""
+List results decoded one row at a time, straight from the frame they arrive in.
+
+With ``stream=True``, ``user_account_search``, ``reservation_query``, ``vm_inventory_list`` and
+``system_perf_query`` return a :py:class:`ResultStream` instead of a list, and so does
+:meth:`netlab.async_client.NetlabConnection.call`. The frame carrying the result is routed to the call without
+being decoded. Iterating the stream then decodes and converts one row at a time, so only the frame's text and the
+current row are held, never the whole list of dicts, and the first row is ready without waiting for the rest to
+decode::
+
+    async for reservation in await client.reservation_query(stream=True):
+        writer.writerow(reservation)
+
+Rows are decoded by the stdlib `json` module, whatever the ``json_codec`` config option, because it can decode
+a value at a time. The frame itself is still read whole before the first row.
+"""
+
+import asyncio
+import json
+import re
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, Match, Optional, Set, Tuple, Union, cast
+
+from .codec import JsonCodec
+from .errors import error_decode, ResponseFormatError
+from .records import lazy_records
+from .serializer import process, process_floats
+
+__all__ = ['ResultStream', 'STREAM_YIELD_ROWS']
+
+STREAM_YIELD_ROWS = 500
+"Rows a :py:class:`ResultStream` decodes between yielding to the event loop."
+
+_IDENT_RE = re.compile(rb'"(id|handle)"\s*:\s*"([0-9a-fA-F-]{36})"')
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+# the pattern matches the empty string, so there is always a match
+_match_whitespace = cast(Callable[[str, int], Match[str]], _WHITESPACE.match)
+_SPACES = frozenset(' \t\n\r')
+
+# json.decoder exports scanstring, the stubs don't declare it
+_scanstring = cast(Callable[[str, int], Tuple[str, int]], getattr(json.decoder, 'scanstring'))
+
+_DECODERS = {
+    False: json.JSONDecoder(object_hook=process),
+    'float': json.JSONDecoder(object_hook=process_floats),
+}
+_RAW_DECODER = json.JSONDecoder()
+
+
+class _Frame(object):
+    # the undecoded frame, passed as the result of a streamed call
+    __slots__ = ('data',)
+
+    def __init__(self, data: bytes):
+        self.data = data
+
+
+def stream_message(frame: bytes, idents: Set[str]) -> Optional[Dict[str, Any]]:
+    """
+    Find whether **frame** answers one of the streamed calls in **idents** without decoding it.
+
+    :meta private:
+
+    :return: A message for `NetlabConnection._handle_message` whose result is the undecoded frame, or ``None``
+        when the frame is for someone else.
+    """
+    for match in _IDENT_RE.finditer(frame):
+        ident = match[2].decode('ascii').lower()
+        if ident in idents:
+            if match[1] == b'id':
+                return {'id': ident, 'result': _Frame(frame)}
+            return {'handle': ident, 'params': {'result': _Frame(frame)}}
+        start = match.start()
+        if frame.count(b'{', 0, start) == 1 and frame.find(b'[', 0, start) == -1:
+            # the frame's own id or handle, everything after it is data
+            return None
+    return None
+
+
+class _Cursor(object):
+    # walks the JSON text of a frame, decoding only what it is asked for
+
+    def __init__(self, text: str):
+        self.text = text
+        self.pos = 0
+
+    def skip(self) -> str:
+        self.pos = _match_whitespace(self.text, self.pos).end()
+        return self.text[self.pos:self.pos + 1]
+
+    def expect(self, char: str) -> None:
+        if self.skip() != char:
+            raise self.error('expected {!r}'.format(char))
+        self.pos += 1
+
+    def value(self, decoder: json.JSONDecoder = _RAW_DECODER) -> Any:
+        self.skip()
+        try:
+            value, self.pos = decoder.raw_decode(self.text, self.pos)
+        except ValueError as e:
+            raise ResponseFormatError('streamed result is not valid JSON: {}'.format(e)) from e
+        return value
+
+    def keys(self) -> Iterator[str]:
+        # yields each key of an object, the caller reads its value before asking for the next
+        self.expect('{')
+        if self.skip() == '}':
+            self.pos += 1
+            return
+        while True:
+            self.expect('"')
+            key, self.pos = _scanstring(self.text, self.pos)
+            self.expect(':')
+            yield key
+            char = self.skip()
+            self.pos += 1
+            if char == '}':
+                return
+            if char != ',':
+                raise self.error("expected ',' or '}'")
+
+    def error(self, message: str) -> ResponseFormatError:
+        return ResponseFormatError('streamed result is not valid JSON: {} at {}'.format(message, self.pos))
+
+
+class ResultStream(object):
+    """
+    The rows of a list result, decoded and converted as they are iterated. Use ``async for``, or a plain ``for``
+    outside the event loop. A stream can be iterated once.
+    """
+
+    def __init__(self, result: Any, codec: JsonCodec, mode: Union[bool, str] = False, key: Optional[str] = None):
+        """
+        :meta private:
+
+        :param result: The undecoded frame of the reply, or the result when it was already decoded without field
+            conversion, e.g. from a polled task.
+        :param codec: Encodes rows for ``raw='bytes'`` and converts already decoded results.
+        :param mode: How to convert rows, as the call's ``raw``, ``lazy`` and ``numeric`` ask.
+        :param key: The property of an object result that holds the rows, e.g. ``'data'`` for paged searches.
+            ``None`` when the result is the list of rows.
+        """
+        self.info: Dict[str, Any] = {}
+        """
+        The properties of an object result other than its rows, such as ``total_pages`` of paged searches.
+        Properties after the rows in the frame are added once every row is read.
+        """
+        self._codec = codec
+        self._mode = mode
+        self._key = key
+        self._yield_rows = STREAM_YIELD_ROWS
+        if isinstance(result, _Frame):
+            frame, result.data = result.data, b''
+            self._rows = self._decode(frame)
+        else:
+            self._rows = self._convert(result)
+
+    def __iter__(self) -> Iterator[Any]:
+        return self._rows
+
+    def __aiter__(self) -> AsyncIterator[Any]:
+        return self
+
+    async def __anext__(self) -> Any:
+        self._yield_rows -= 1
+        if self._yield_rows <= 0:
+            # a long result must not hold up pings and other replies
+            self._yield_rows = STREAM_YIELD_ROWS
+            await asyncio.sleep(0)
+        try:
+            return next(self._rows)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+    def _decode(self, frame: bytes) -> Iterator[Any]:
+        cursor = _Cursor(frame.decode('utf-8'))
+        # the result is found before the first row is asked for, so a failed call raises from the call itself
+        self._find_result(cursor)
+        keys = None
+        if self._key is not None:
+            if cursor.skip() != '{':
+                raise ResponseFormatError('streamed result is not an object')
+            keys = cursor.keys()
+            for name in keys:
+                if name == self._key:
+                    break
+                self.info[name] = cursor.value()
+            else:
+                self._convert_info()
+                return iter(())
+            if cursor.skip() == 'n' and cursor.value() is None:
+                # null rows are no rows, as missing ones are
+                for name in keys:
+                    self.info[name] = cursor.value()
+                self._convert_info()
+                return iter(())
+        if cursor.skip() != '[':
+            raise ResponseFormatError('streamed result is not a list')
+        return self._decode_rows(cursor, keys)
+
+    def _find_result(self, cursor: _Cursor) -> None:
+        error = None
+        for key in cursor.keys():
+            if key == 'params':
+                # task completions carry the result inside their params
+                for key in cursor.keys():
+                    if key == 'result':
+                        return
+                    cursor.value()
+                break
+            if key == 'result':
+                return
+            value = cursor.value()
+            if key == 'error':
+                error = value
+        if error is not None:
+            raise error_decode(error)
+        raise ResponseFormatError('message did not contain "result" or "error"')
+
+    def _decode_rows(self, cursor: _Cursor, keys: Optional[Iterator[str]]) -> Iterator[Any]:
+        mode = self._mode
+        # scan_once is the decoder's C scanner, missing from the stubs
+        scan: Callable[[str, int], Tuple[Any, int]] = cast(Any, _DECODERS.get(mode, _RAW_DECODER)).scan_once
+        text = cursor.text
+        skip = _match_whitespace
+        # the cursor's steps cost more than decoding a small row, so the rows are walked here directly
+        cursor.expect('[')
+        pos = skip(text, cursor.pos).end()
+        if text[pos:pos + 1] == ']':
+            pos += 1
+        else:
+            while True:
+                try:
+                    row, end = scan(text, pos)
+                except StopIteration:
+                    cursor.pos = pos
+                    raise cursor.error('expected a value') from None
+                if mode == 'lazy':
+                    row = lazy_records(row)
+                elif mode == 'bytes':
+                    row = text[pos:end].encode('utf-8')
+                yield row
+                char = text[end:end + 1]
+                if char in _SPACES:
+                    end = skip(text, end).end()
+                    char = text[end:end + 1]
+                pos = end + 1
+                if char == ',':
+                    if text[pos:pos + 1] in _SPACES:
+                        pos = skip(text, pos).end()
+                elif char == ']':
+                    break
+                else:
+                    cursor.pos = end
+                    raise cursor.error("expected ',' or ']'")
+        cursor.pos = pos
+        if keys is not None:
+            for name in keys:
+                self.info[name] = cursor.value()
+            self._convert_info()
+
+    def _convert(self, result: Any) -> Iterator[Any]:
+        rows: Any = result
+        if self._key is not None:
+            if not isinstance(result, dict):
+                raise ResponseFormatError('streamed result is not an object')
+            rows = result.get(self._key)
+            if rows is None:
+                rows = []
+            self.info.update((name, value) for name, value in result.items() if name != self._key)
+            self._convert_info()
+        if not isinstance(rows, list):
+            raise ResponseFormatError('streamed result is not a list')
+        return map(self._converter(), rows)
+
+    def _converter(self) -> Callable[[Any], Any]:
+        mode = self._mode
+        if mode == 'lazy':
+            return lazy_records
+        if mode == 'bytes':
+            return self._codec.encode
+        if mode is True:
+            return lambda row: row
+        return lambda row: self._codec.convert(row, numeric='float' if mode == 'float' else 'decimal')
+
+    def _convert_info(self) -> None:
+        # the properties beside the rows are few, so lazy results have them converted as well
+        if self._mode is not True and self._mode != 'bytes':
+            self._codec.convert(self.info, numeric='float' if self._mode == 'float' else 'decimal')
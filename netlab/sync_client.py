@@ -19,6 +19,11 @@ def _sync_wrap_iter(it, loop):
             yield r
     except StopAsyncIteration:
         pass
+    finally:
+        # a caller that stopped early closes this generator, which closes the async one, so it can cancel the work
+        # it started ahead
+        if hasattr(it, 'aclose') and not loop.is_running():
+            loop.run_until_complete(it.aclose())
 
 
 class SyncClient(object):
@@ -1,12 +1,16 @@
 
 # GENERATED
 
-from typing import Union, Optional, Dict, Any, List, Generator
+from typing import Union, Optional, Dict, Any, List, Generator, Iterable, Tuple, overload
 from typing_extensions import Literal
 import netlab.enums
 import netlab.datatypes.pod
 import netlab.api.system_results
 import netlab.config
+import netlab.columns
+import netlab.paging
+import netlab.records
+import netlab.streaming
 import datetime
 import uuid
 
@@ -20,18 +24,57 @@ class SyncClient(object):
     def alive(self) -> bool:
         ...
 
-    def call(self, method: str, **kwargs: Any) -> Any:
+    def call(self, method: str, *, timeout: Optional[float] = None, deadline: Optional[float] = None, raw: Optional[Union[bool, Literal['bytes']]] = None, lazy: Optional[bool] = None, numeric: Optional[Literal['decimal', 'float']] = None, stream: Union[bool, str] = False, **kwargs: Any) -> Any:
         r"""
+        Send a call and wait for its result. Results of the methods in :py:attr:`cache` are read from it while
+        they are cached.
 
         :param method: The NETLAB+ method name.
+        :param timeout: Seconds to wait for the call to complete, including the completion of task methods.
+            Defaults to the ``call_timeout`` config option. Every higher level method accepts this as well.
+        :param deadline: Time, on the event loop's clock (``asyncio.get_event_loop().time()``), by which the call
+            must complete. If both **timeout** and **deadline** are given, the earlier one applies.
+        :param raw: ``True`` returns the result as the server sent it, skipping field conversion, e.g. timestamps
+            stay strings. ``'bytes'`` returns the result encoded as JSON. Defaults to the ``raw`` config option.
+            Every higher level method accepts this as well, though some expect converted results.
+        :param lazy: Return objects as :py:class:`netlab.records.LazyRecord`, converting each field on first
+            access. Defaults to the ``lazy`` config option.
+        :param numeric: ``'float'`` converts `netlab.serializer.DECIMAL_FIELDS`, such as ``idle_pct`` and
+            ``sp_value``, to `float` instead of `decimal.Decimal`, with ``nan`` for blank values. It applies to
+            converted results, not raw or lazy ones. Defaults to the ``numeric`` config option.
+        :param stream: ``True`` returns a :py:class:`netlab.streaming.ResultStream` over the rows of a list result,
+            decoding and converting each row as it is read. The name of a property, such as ``'data'``, streams
+            the list in that property of an object result. **raw**, **lazy** and **numeric** apply to each row.
         :param kwargs: The arguments to pass to netlab.
 
+        :raises netlab.errors.common.NetlabTimeoutError: The call did not complete in time.
+
         .. warning::
 
             In most cases, it is better to use the higher level methods, rather than this
             low level method.
         """
 
+    def call_many(self, calls: Iterable[Tuple[str, Dict[str, Any]]], *, timeout: Optional[float] = None, deadline: Optional[float] = None, raw: Optional[Union[bool, Literal['bytes']]] = None, lazy: Optional[bool] = None, numeric: Optional[Literal['decimal', 'float']] = None) -> List[Any]:
+        r"""
+        Send several calls in a single write and wait for all of their responses.
+
+        Every request is written to the socket before any response is awaited, so a batch of calls costs
+        roughly one round trip instead of one round trip per call. Task methods are supported.
+
+        :param calls: ``(method, params)`` pairs, where **params** are the arguments that would be passed to
+            :meth:`call`.
+        :param timeout: Seconds to wait for each call, see :meth:`call`. Calls that time out return a
+            :py:class:`netlab.errors.common.NetlabTimeoutError`.
+        :param deadline: Time by which every call must complete, see :meth:`call`.
+        :param raw: Skip field conversion for every call, see :meth:`call`.
+        :param lazy: Return lazily converted records for every call, see :meth:`call`.
+        :param numeric: Convert decimal fields to `float` for every call, see :meth:`call`.
+
+        :return: The results in the same order as **calls**. If a call fails, its exception is returned in
+            its place instead of being raised.
+        """
+
     def class_add(self, *, cls_name: str, com_id: int, cls_change_ex: bool = True, cls_def_pw_account: Optional[str] = None, cls_def_pw_console: Optional[str] = None, cls_def_pw_enable: Optional[str] = None, cls_email_logs: netlab.enums.klass.ClassEmailLogs = netlab.enums.ClassEmailLogs.NO, cls_end_date: Optional[datetime.date] = None, cls_lab_limit: netlab.enums.klass.ClassLabLimit = netlab.enums.ClassLabLimit.ENFORCE, cls_max_slots_per_res: Optional[int] = None, cls_min_hours_btw_res: Optional[int] = None, cls_no_delete: bool = False, cls_retain_ilt: bool = False, cls_retain_period: Optional[datetime.date] = None, cls_retain_st: bool = True, cls_self_sched: bool = True, cls_start_date: Optional[datetime.date] = None, cls_team_sched: bool = False, **kwargs) -> int:
         r"""
         This method allows you to add a class to the NETLAB+ system.
@@ -220,13 +263,17 @@ class SyncClient(object):
             List of leads and properties sorted by acc_sort_name.
         """
 
-    def class_list(self, *, com_id: Optional[int] = None, member: bool = False, properties: Union[List[str], Literal['default', 'all']] = 'default', **kwargs) -> List[Dict[str, Any]]:
+    @overload
+    def class_list(self, *, com_id: Optional[int] = None, member: bool = False, properties: Union[List[str], Literal['default', 'all']] = 'default', records: Literal[True], **kwargs) -> List[netlab.records.Record]: ...
+    @overload
+    def class_list(self, *, com_id: Optional[int] = None, member: bool = False, properties: Union[List[str], Literal['default', 'all']] = 'default', records: Literal[False] = False, **kwargs) -> List[Dict[str, Any]]:
         r"""
         This method allows you to retrieve a list of classes and their properties.
 
         :param com_id: Community ID.
         :param member: If true, get list of classes the caller is in.
         :param properties: List of properties to retrieve. See Properties section for list of available properties.
+        :param records: Return :py:class:`netlab.records.Record` objects instead of dicts.
 
         :return: On success, returns an object with the requested properties:
 
@@ -336,13 +383,14 @@ class SyncClient(object):
             Team identifier [A-Z] or `None` if user is not assigned to a team.
         """
 
-    def class_roster_list(self, *, cls_id: int, leads: bool = False, **kwargs):
+    def class_roster_list(self, *, cls_id: int, leads: bool = False, records: bool = False, **kwargs):
         r"""
         This method lists users in the class roster.
 
         :param cls_id: Local system class.
         :param leads: `None` Return all users in the roster (leads and learners).
             `True` Return lead instructors only. `False` Return learners only.
+        :param records: Return :py:class:`netlab.records.Record` objects instead of dicts.
 
         :return: On success, returns an object with the requested properties:
 
@@ -741,11 +789,18 @@ class SyncClient(object):
             VM resource allocation properties. `netlab.datatypes.VMAlloc` Added in 18.5.0.
         """
 
-    def pod_list(self, *, pod_cat: Optional[netlab.enums.pod.PodCategory] = None, **kwargs) -> List[Dict[str, Any]]:
+    @overload
+    def pod_list(self, *, pod_cat: Optional[netlab.enums.pod.PodCategory] = None, records: bool = False, columnar: Literal[True], **kwargs) -> netlab.columns.Columns: ...
+    @overload
+    def pod_list(self, *, pod_cat: Optional[netlab.enums.pod.PodCategory] = None, records: Literal[True], columnar: Literal[False] = False, **kwargs) -> List[netlab.records.Record]: ...
+    @overload
+    def pod_list(self, *, pod_cat: Optional[netlab.enums.pod.PodCategory] = None, records: Literal[False] = False, columnar: Literal[False] = False, **kwargs) -> List[Dict[str, Any]]:
         r"""
         List pods on the system.
 
         :param pod_cat: Pod category type.
+        :param records: Return :py:class:`netlab.records.Record` objects instead of dicts.
+        :param columnar: Return :py:class:`netlab.columns.Columns`, one column per property, instead of dicts.
         :return: Returns a list of dictionary objects containing the following properties:
 
         **Properties**
@@ -1130,13 +1185,17 @@ class SyncClient(object):
             - ca_to_port
         """
 
-    def pod_types_list(self, *, properties: Union[List[str], Literal['default', 'all']] = 'default', **kwargs) -> List[Dict[str, Any]]:
+    @overload
+    def pod_types_list(self, *, properties: Union[List[str], Literal['default', 'all']] = 'default', records: Literal[True], **kwargs) -> List[netlab.records.Record]: ...
+    @overload
+    def pod_types_list(self, *, properties: Union[List[str], Literal['default', 'all']] = 'default', records: Literal[False] = False, **kwargs) -> List[Dict[str, Any]]:
         r"""
         Obtain a list of pod types.
 
         :param properties: Properties consist of any combination of properties listed below under Properties.
                            You may also use **"all"** to include all properties, or **"default"** for a smaller subset
                            of properties.
+        :param records: Return :py:class:`netlab.records.Record` objects instead of dicts.
         :return: On success, returns [rt_id, pt_build, pt_name] by default, or the following properties if requested.
 
         **Properties**
@@ -1463,7 +1522,12 @@ class SyncClient(object):
         :param res_id: Reservation identifier.
         """
 
-    def reservation_query(self, *, active: Optional[bool] = None, scope: netlab.enums.reservation.ReservationScope = netlab.enums.ReservationScope.ALL, min_time: Optional[datetime.datetime] = None, max_time: Optional[datetime.datetime] = None, com_id: Optional[int] = None, cls_id: Optional[int] = None, pod_id: Optional[int] = None, **kwargs) -> List[Dict[str, Any]]:
+    @overload
+    def reservation_query(self, *, active: Optional[bool] = None, scope: netlab.enums.reservation.ReservationScope = netlab.enums.ReservationScope.ALL, min_time: Optional[datetime.datetime] = None, max_time: Optional[datetime.datetime] = None, com_id: Optional[int] = None, cls_id: Optional[int] = None, pod_id: Optional[int] = None, columnar: Literal[True], stream: bool = False, **kwargs) -> netlab.columns.Columns: ...
+    @overload
+    def reservation_query(self, *, active: Optional[bool] = None, scope: netlab.enums.reservation.ReservationScope = netlab.enums.ReservationScope.ALL, min_time: Optional[datetime.datetime] = None, max_time: Optional[datetime.datetime] = None, com_id: Optional[int] = None, cls_id: Optional[int] = None, pod_id: Optional[int] = None, columnar: Literal[False] = False, stream: Literal[True], **kwargs) -> netlab.streaming.ResultStream: ...
+    @overload
+    def reservation_query(self, *, active: Optional[bool] = None, scope: netlab.enums.reservation.ReservationScope = netlab.enums.ReservationScope.ALL, min_time: Optional[datetime.datetime] = None, max_time: Optional[datetime.datetime] = None, com_id: Optional[int] = None, cls_id: Optional[int] = None, pod_id: Optional[int] = None, columnar: Literal[False] = False, stream: Literal[False] = False, **kwargs) -> List[Dict[str, Any]]:
         r"""
         Return a list of reservations filtered on criteria. Take note of the acceptable overrides.
 
@@ -1474,6 +1538,9 @@ class SyncClient(object):
         :param max_time: Maximum time range.
         :param min_time: Minimum time range.
         :param pod_id: Pod identifier.
+        :param columnar: Return :py:class:`netlab.columns.Columns`, one column per property, instead of dicts.
+        :param stream: Return a :py:class:`netlab.streaming.ResultStream` that decodes the rows as they are read,
+            instead of a list.
 
         :return: On success, returns an object with the following properties:
 
@@ -1709,7 +1776,12 @@ class SyncClient(object):
         :return: Datetime rounded to half hour.
         """
 
-    def system_perf_query(self, *, start_time: datetime.datetime, end_time: Optional[datetime.datetime] = None, metrics: Optional[List[str]] = None, sources: Optional[List[str]] = None, **kwargs) -> List[Dict[str, Any]]:
+    @overload
+    def system_perf_query(self, *, start_time: datetime.datetime, end_time: Optional[datetime.datetime] = None, metrics: Optional[List[str]] = None, sources: Optional[List[str]] = None, columnar: Literal[True], stream: bool = False, **kwargs) -> netlab.columns.Columns: ...
+    @overload
+    def system_perf_query(self, *, start_time: datetime.datetime, end_time: Optional[datetime.datetime] = None, metrics: Optional[List[str]] = None, sources: Optional[List[str]] = None, columnar: Literal[False] = False, stream: Literal[True], **kwargs) -> netlab.streaming.ResultStream: ...
+    @overload
+    def system_perf_query(self, *, start_time: datetime.datetime, end_time: Optional[datetime.datetime] = None, metrics: Optional[List[str]] = None, sources: Optional[List[str]] = None, columnar: Literal[False] = False, stream: Literal[False] = False, **kwargs) -> List[Dict[str, Any]]:
         r"""
         This method is used to query system performance metrics.
 
@@ -1718,6 +1790,9 @@ class SyncClient(object):
         :param metrics: If specified, only returns metrics from :ref:`this list<System Performance Metrics>`.
         :param sources: If specified, only returns metrics originating from sources in this list.
             Valid sources include mbusd, podspd, sysspd, respd, userspd, vmspd, histpd, filespd.
+        :param columnar: Return :py:class:`netlab.columns.Columns`, one column per property, instead of dicts.
+        :param stream: Return a :py:class:`netlab.streaming.ResultStream` that decodes the rows as they are read,
+            instead of a list.
         :return: A list of dicts with the following properties.
 
         **Properties**
@@ -1990,7 +2065,10 @@ class SyncClient(object):
             *-1* will disable pagination and return all items.
         """
 
-    def user_account_list(self, *, com_id: Optional[int] = None, acc_type: Optional[netlab.enums.user.AccountType] = None, properties: Union[List[str], Literal['default', 'all']] = 'default', **kwargs) -> List[Dict[str, Any]]:
+    @overload
+    def user_account_list(self, *, com_id: Optional[int] = None, acc_type: Optional[netlab.enums.user.AccountType] = None, properties: Union[List[str], Literal['default', 'all']] = 'default', records: Literal[True], **kwargs) -> List[netlab.records.Record]: ...
+    @overload
+    def user_account_list(self, *, com_id: Optional[int] = None, acc_type: Optional[netlab.enums.user.AccountType] = None, properties: Union[List[str], Literal['default', 'all']] = 'default', records: Literal[False] = False, **kwargs) -> List[Dict[str, Any]]:
         r"""
         Query a list of the user accounts in the NETLAB system. The list method
         is only restricted by community id and account types. The properties
@@ -2002,6 +2080,7 @@ class SyncClient(object):
         :param properties: Properties consist of any combination of properties listed below under Properties.
                            You may also use **"all"** to include all properties, or **"default"** for a smaller subset
                            of properties.
+        :param records: Return :py:class:`netlab.records.Record` objects instead of dicts.
 
         :return: A list of dictionaries (a set of records) where the dictionaries contain requested properties
             per user.
@@ -2070,7 +2149,11 @@ class SyncClient(object):
         :param acc_id: User Account ID
         """
 
-    def user_account_search(self, *, properties: List[str] = ['acc_id'], order: Union[str, List[str], NoneType] = None, filter=None, limit: int = 100, page: Optional[int] = None, offset: Optional[int] = None, **kwargs) -> Dict[str, Any]:
+    @overload
+    def user_account_search(self, *, properties: List[str] = ['acc_id'], order: Union[str, List[str], NoneType] = None, filter=None, limit: int = 100, page: Optional[int] = None, offset: Optional[int] = None, stream: Literal[True], **kwargs) -> netlab.streaming.ResultStream: ...
+    @overload
+    @overload
+    def user_account_search(self, *, properties: List[str] = ['acc_id'], order: Union[str, List[str], NoneType] = None, filter=None, limit: int = 100, page: Optional[int] = None, offset: Optional[int] = None, stream: Literal[False] = False, **kwargs) -> Dict[str, Any]:
         r"""
         This method queries and/or retrieves user accounts. Also see
         :meth:`~netlab.api.UserApiMixin.user_account_search_iter`.
@@ -2089,6 +2172,8 @@ class SyncClient(object):
             'total_records' with no accounts. A page that goes pass all records will return no accounts.
         :param offset: Starting record number. If page and offset are both None, no records are returned; only meta
             data about total users and pages are returned.
+        :param stream: Return a :py:class:`netlab.streaming.ResultStream` that decodes the accounts of the page as
+            they are read. The other properties, such as ``total_pages``, are in its ``info``.
 
         :return: A list of user accounts that match **filter**.
 
@@ -2218,7 +2303,7 @@ class SyncClient(object):
             **SELECT, FILTER, ORDER** | Timezone sort order.
         """
 
-    def user_account_search_iter(self, *, properties: List[str] = ['acc_id'], order: Union[str, List[str], NoneType] = None, filter: Any = None, limit: int = 100) -> Generator[Dict[str, Any], NoneType, NoneType]:
+    def user_account_search_iter(self, *, properties: List[str] = ['acc_id'], order: Union[str, List[str], NoneType] = None, filter: Any = None, limit: Union[int, netlab.paging.PageSizer, NoneType] = 100, prefetch: int = 4, **kwargs) -> Generator[Dict[str, Any], NoneType, NoneType]:
         r"""
         This method queries and/or retrieves user accounts.
 
@@ -2230,7 +2315,13 @@ class SyncClient(object):
         :param order: Sort order.
         :param filter: Search criteria. See below for how to use filters.
         :param limit: Page size collected in a single request from the server. This can be used to tune performace
-            over large record sets. Maximum 500.
+            over large record sets. Maximum 500. ``None`` asks for 500 and sizes each page after the first from
+            the size and latency of the pages before it, see `netlab.paging`. A :py:class:`netlab.paging.PageSizer`
+            does the same within its bounds, e.g. ``PageSizer(min_limit=100, max_limit=500, target_bytes=1024 * 1024)``.
+        :param prefetch: Number of pages requested at once after the first page. Accounts are still yielded in page
+            order, while the following pages are fetched. ``1`` requests one page at a time. A caller that stops
+            early should close the iterator, with ``contextlib.aclosing`` or by awaiting its ``aclose()``, so the
+            pages ahead are cancelled instead of running until the iterator is garbage collected.
 
         :return: A series of user accounts that match **filter**. This method returns an iterator, which can be
             used in for loops like a list. See
@@ -2450,7 +2541,7 @@ class SyncClient(object):
             Community MyNETLAB+ welcome message.
         """
 
-    def user_community_list(self, *, properties='default', sort_property='com_id', **kwargs):
+    def user_community_list(self, *, properties='default', sort_property='com_id', records=False, **kwargs):
         r"""
         Retrieve a list of communities.
 
@@ -2459,6 +2550,7 @@ class SyncClient(object):
         :type properties: list[str] or 'all' or 'default'
         :param str sort_property: Property to sort list by. Only **com_id** (default) and **com_full_name** are
                    valid options.
+        :param bool records: Return :py:class:`netlab.records.Record` objects instead of dicts.
 
         :return: A list of objects with the properties requested:
         :rtype: list[dict]
@@ -3025,14 +3117,21 @@ class SyncClient(object):
             Virtual machine identifier.
         """
 
-    def vm_inventory_list(self, *, vdc_id: Optional[int] = None, roles: Optional[List[str]] = None, attached: Optional[bool] = None, **kwargs) -> List[Dict[str, Any]]:
+    @overload
+    def vm_inventory_list(self, *, vdc_id: Optional[int] = None, roles: Optional[List[str]] = None, attached: Optional[bool] = None, columnar: Literal[True], stream: bool = False, **kwargs) -> netlab.columns.Columns: ...
+    @overload
+    def vm_inventory_list(self, *, vdc_id: Optional[int] = None, roles: Optional[List[str]] = None, attached: Optional[bool] = None, columnar: Literal[False] = False, stream: Literal[True], **kwargs) -> netlab.streaming.ResultStream: ...
+    @overload
+    def vm_inventory_list(self, *, vdc_id: Optional[int] = None, roles: Optional[List[str]] = None, attached: Optional[bool] = None, columnar: Literal[False] = False, stream: Literal[False] = False, **kwargs) -> List[Dict[str, Any]]:
         r"""
         This method allows you to list the virtual machines from NETLAB+ inventory.
 
         :param vdc_id: VM Datacenter identifier.
         :param roles: Filter by specified roles.
         :param attached: List virtual machines attached to a pod.
-
+        :param columnar: Return :py:class:`netlab.columns.Columns`, one column per property, instead of dicts.
+        :param stream: Return a :py:class:`netlab.streaming.ResultStream` that decodes the rows as they are read,
+            instead of a list.
 
         :return: Returns an object with the following properties:
 
@@ -67,3 +67,78 @@ def omit_nones(value: Dict[str, Any], names: Set[str]) -> Dict[str, Any]:
             result[k] = v
 
     return result
+
+
+ID_SET_SLACK_BYTES = 1 << 16
+"Bytes an :py:class:`IdSet` bitmap may take beyond its ids' share, e.g. for the gaps in a range of ids."
+ID_SET_BYTES_PER_ID = 8
+"Bytes of bitmap an :py:class:`IdSet` may take for each id it holds, a fraction of what a `set` entry costs."
+
+
+class IdSet(object):
+    """
+    A set of integer ids, such as the ``acc_id`` of accounts paged through, kept as one bit per id in the range
+    seen. Dense ids cost a bit each instead of an `int` and a `set` entry. Ids the bitmap would grow too sparse
+    for are kept in a `set`, as are values other than `int`, which never equal an id, e.g. ``1.0`` is not ``1``.
+    """
+    __slots__ = ('_bits', '_base', '_count', '_others')
+
+    def __init__(self):
+        self._bits = bytearray()
+        self._base = 0
+        "Id of the first bit, a multiple of 8."
+        self._count = 0
+        "Number of bits set."
+        self._others: Set[Any] = set()
+
+    def __len__(self) -> int:
+        return self._count + len(self._others)
+
+    def __contains__(self, value: Any) -> bool:
+        if type(value) is int:
+            index = value - self._base
+            if 0 <= index < len(self._bits) << 3:
+                return bool(self._bits[index >> 3] & (1 << (index & 7)))
+        return value in self._others
+
+    def add(self, value: Any) -> bool:
+        """
+        Add **value**, returning whether it was new, so a dedup takes one call per value.
+        """
+        if type(value) is int:
+            index = value - self._base
+            if (0 <= index < len(self._bits) << 3) or self._grow(value):
+                index = value - self._base
+                bit = 1 << (index & 7)
+                if self._bits[index >> 3] & bit:
+                    return False
+                self._bits[index >> 3] |= bit
+                self._count += 1
+                return True
+        if value in self._others:
+            return False
+        self._others.add(value)
+        return True
+
+    def _grow(self, value: int) -> bool:
+        # the range at least doubles, so ids arriving in either order are added in amortized constant time
+        size = len(self._bits) << 3
+        low, high = (min(self._base, value), max(self._base + size, value + 1)) if size else (value, value + 1)
+        budget = (ID_SET_SLACK_BYTES + len(self) * ID_SET_BYTES_PER_ID) << 3
+        if high - low > budget:
+            return False
+        span = min(max(high - low, size * 2), budget)
+        if value < self._base:
+            low = high - span
+        else:
+            high = low + span
+        low, high = low & ~7, -(-high // 8) * 8
+        bits = bytearray((high - low) >> 3)
+        start = (self._base - low) >> 3
+        bits[start:start + len(self._bits)] = self._bits
+        self._bits, self._base = bits, low
+        # ids kept aside before may fall in the new range
+        for other in [other for other in self._others if type(other) is int and low <= other < high]:
+            self._others.discard(other)
+            self.add(other)
+        return True
@@ -1,8 +1,8 @@
 import asyncio
-from typing import DefaultDict
 import json
 import sys
-from collections import defaultdict
+from collections import Counter
+from itertools import compress
 
 from paepy.ChannelDefinition import CustomSensorResult  # type: ignore
 
@@ -22,14 +22,10 @@ async def main():
     # PRTG runs sensors as a different user. Specify the Administrator user's netlab config file here
     async with NetlabClient(system, config_path='C:/Users/Administrator/.netlab/config.json') as client:
 
-        # query data from netlab api
-        total: DefaultDict[int, int] = defaultdict(int)
-        used: DefaultDict[int, int] = defaultdict(int)
-
-        for pod in await client.pod_list():
-            total[pod['pt_id']] += 1
-            if pod['pod_res_id']:
-                used[pod['pt_id']] += 1
+        # query data from netlab api, one column per property
+        pods = await client.pod_list(columnar=True)
+        total = Counter(pods['pt_id'])
+        used = Counter(compress(pods['pt_id'], pods['pod_res_id']))
 
         pod_types = {pt['pt_id']: pt['pt_name'] for pt in await client.pod_types_list()}
 
@@ -0,0 +1,13 @@
+import json
+
+import pytest
+
+from netlab.auth import get_system_config
+
+
+@pytest.mark.parametrize('value, expected', [('bytes', 'bytes'), ('BYTES', 'bytes'), ('true', True), ('0', False)])
+def test_raw_from_environment(tmp_path, monkeypatch, value, expected):
+    path = tmp_path / 'config.json'
+    path.write_text(json.dumps({'default': {'user': 'user', 'token': 'token'}}))
+    monkeypatch.setenv('NETLAB_CONFIG_RAW', value)
+    assert get_system_config('default', config_path=str(path)).raw == expected
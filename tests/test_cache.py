@@ -0,0 +1,44 @@
+import asyncio
+
+import pytest
+
+from netlab.async_client import NetlabClient
+from netlab.cache import CallCache
+from netlab.errors.common import NetlabTimeoutError
+from netlab.standin import StandInServer
+
+
+@pytest.mark.asyncio
+async def test_waiters_keep_their_timeout():
+    async with StandInServer(latency=1.0) as server:
+        async with NetlabClient(config=server.config(cache=True)) as client:
+            loop = asyncio.get_event_loop()
+            fetch = asyncio.ensure_future(client.pod_types_list())
+            await asyncio.sleep(0.05)
+            start = loop.time()
+            with pytest.raises(NetlabTimeoutError):
+                await client.pod_types_list(timeout=0.1)
+            assert loop.time() - start < 0.5
+            # the fetch being waited for is not cancelled with the waiter
+            assert len(await fetch) == server.records
+            assert await client.pod_types_list(timeout=0.1) == await fetch
+            assert server.calls['pod.types.list'] == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_fetch_is_made_again():
+    cache = CallCache({'pod.types.list': 60})
+    release = asyncio.Event()
+
+    async def slow():
+        await release.wait()
+        return b'[1]'
+
+    first = asyncio.ensure_future(cache.get('pod.types.list', {}, slow))
+    waiter = asyncio.ensure_future(cache.get('pod.types.list', {}, slow))
+    await asyncio.sleep(0)
+    first.cancel()
+    await asyncio.sleep(0)
+    release.set()
+    assert await waiter == b'[1]'
+    assert cache.misses == 2 and len(cache) == 1
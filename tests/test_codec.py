@@ -0,0 +1,95 @@
+"""
+Conformance of the codecs in `netlab.codec`: every installed codec must decode the same frames to the same Python
+objects as the stdlib codec, with and without field conversion, and its encoded messages and requests must read
+back the same.
+"""
+
+import json
+import uuid
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Any, Dict, List
+
+import pytest
+
+from netlab import enums
+from netlab.codec import CODECS, JsonCodec, get_codec
+from netlab.errors.common import InvalidConfig
+from netlab.records import to_records
+from netlab.serializer import serialize
+from netlab.standin import StandInServer
+
+EDGE_FRAMES = [
+    b'{"id": "1", "result": {"acc_sys": "1", "acc_privs": "COMWIDE,SYSWIDE", "ros_team": "", "con_pt_ids": "A,B",'
+    b' "res_remaining_dhms": "1,2,3,4", "acc_last_login": "2022-01-02 03:04:05.25", "cls_end_date": "2022-01-02",'
+    b' "uptime_sec": "12.50", "pod_uuid": "00000000-0000-0000-0000-000000000001", "cls_ext_slots_per_res": -1,'
+    b' "pod_cat": "NV", "pod_res_id": null, "nested": [{"pod_id": "7", "more": {"acc_id": "3"}}, [], 1.5]}}',
+    b'{"handle": "00000000-0000-0000-0000-000000000002", "params": {"result": [1, "two", null, true, {}]}}',
+    b'{"id": "2", "result": 123456789012345678901234567890}',
+    b'{"id": "4", "result": -9223372036854775809}',
+    b'{"id": "3", "error": {"message": "E_POD_NOT_FOUND", "data": {"message": "caf\\u00e9 \xe2\x98\x83"}}}',
+]
+
+_SERVER = StandInServer(records=50, accounts=50)
+STANDIN_FRAMES = [
+    json.dumps({'id': '1', 'result': _SERVER.handlers['pod.list']({})}).encode(),
+    json.dumps({'id': '1', 'result': _SERVER.handlers['user.account.search.task']({'page': 1, 'limit': 50})}).encode(),
+]
+
+EDGE_REQUEST = {
+    'jsonrpc': '2.0', 'id': uuid.UUID(int=5), 'method': 'class.add', 'params': {
+        'cls_start_date': date(2022, 1, 3), 'res_start': datetime(2022, 1, 3, 8, 30, 15, 999),
+        'res_minutes': timedelta(hours=2, seconds=7), 'pod_cat': enums.PodCategory.NORMAL_VM,
+        'uptime_sec': Decimal('1.10'), 'cls_name': 'café', 'big': 2 ** 70, 'pod_ids': [1, 2, 3],
+        'filter': {1: 'int key', 'acc_can_login': 1}, 'notify_handle': uuid.UUID(int=9),
+    },
+}
+
+REFERENCE = JsonCodec()
+
+
+@pytest.fixture(params=list(CODECS))
+def codec(request):
+    return CODECS[request.param]()
+
+
+@pytest.mark.parametrize('frame', EDGE_FRAMES + STANDIN_FRAMES)
+def test_decode(codec, frame):
+    assert codec.decode(frame) == REFERENCE.decode(frame)
+
+
+@pytest.mark.parametrize('frame', EDGE_FRAMES + STANDIN_FRAMES)
+def test_decode_raw_and_convert(codec, frame):
+    assert codec.decode_raw(frame) == json.loads(frame)
+    assert codec.convert(codec.decode_raw(frame)) == REFERENCE.decode(frame)
+
+
+def test_encode(codec):
+    assert json.loads(codec.encode(EDGE_REQUEST)) == json.loads(REFERENCE.encode(EDGE_REQUEST))
+
+
+def test_encode_request(codec):
+    request = codec.encode_request(EDGE_REQUEST['id'], EDGE_REQUEST['method'], EDGE_REQUEST['params'])
+    assert request.endswith(b'\n')
+    assert json.loads(request) == json.loads(REFERENCE.encode(EDGE_REQUEST))
+
+
+def test_encode_request_without_params(codec):
+    ident = uuid.UUID(int=7)
+    assert json.loads(codec.encode_request(ident, 'internal.mbusd.ping', {})) == {
+        'id': str(ident), 'jsonrpc': '2.0', 'method': 'internal.mbusd.ping', 'params': {}}
+
+
+def test_get_codec():
+    assert type(get_codec()) is list(CODECS.values())[-1]
+    assert type(get_codec('json')) is JsonCodec
+    with pytest.raises(InvalidConfig):
+        get_codec('missing')
+
+
+def test_encode_records(codec):
+    rows: List[Dict[str, Any]] = [
+        {'pod_id': 7, 'pod_name': 'café', 'pod_res_id': None, 'not_a_property': [1]}, {'pod_id': 8}]
+    records = to_records([dict(row) for row in rows], 'Pod', ['pod_id', 'pod_name', 'pod_res_id'])
+    assert json.loads(codec.encode({'rows': records})) == {'rows': rows}
+    assert json.loads(serialize(records)) == rows
@@ -0,0 +1,9 @@
+import math
+
+from netlab.columns import to_columns
+
+
+def test_float_column_keeps_zero():
+    column = to_columns([{'uptime_sec': 0}, {'uptime_sec': '0.00'}, {'uptime_sec': ''}, {'uptime_sec': None}])
+    assert list(column['uptime_sec'])[:2] == [0.0, 0.0]
+    assert all(map(math.isnan, list(column['uptime_sec'])[2:]))
@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+
+from netlab.async_client import NetlabClient
+from netlab.errors.common import ResponseFormatError
+from netlab.framing import READ_CHUNK_SIZE, FrameReader
+from netlab.standin import StandInServer
+
+FRAMES = [b'{"id": "1"}', b'', b'x' * 40, b'{"a": [1, 2, 3]}', b'y']
+
+
+def _reader(data: bytes, eof: bool = True) -> asyncio.StreamReader:
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    if eof:
+        reader.feed_eof()
+    return reader
+
+
+async def _read_all(frames: FrameReader):
+    result = []
+    while True:
+        try:
+            result.append(await frames.read_frame())
+        except asyncio.IncompleteReadError:
+            return result
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('chunk_size', [1, 3, 7, 11, 41, 42, 4096])
+async def test_frames_across_chunks(chunk_size):
+    data = b''.join(frame + b'\n' for frame in FRAMES)
+    assert await _read_all(FrameReader(_reader(data), chunk_size=chunk_size)) == FRAMES
+
+
+@pytest.mark.asyncio
+async def test_several_frames_in_one_chunk():
+    frames = FrameReader(_reader(b'a\nbb\nccc\n', eof=False), chunk_size=4096)
+    assert await frames.read_frame() == b'a'
+    # the rest came with the same read
+    assert len(frames._frames) == 2
+    assert [await frames.read_frame(), await frames.read_frame()] == [b'bb', b'ccc']
+
+
+@pytest.mark.asyncio
+async def test_incomplete_frame_at_eof():
+    frames = FrameReader(_reader(b'a\nunfinished'), chunk_size=4)
+    assert await frames.read_frame() == b'a'
+    with pytest.raises(asyncio.IncompleteReadError) as info:
+        await frames.read_frame()
+    assert info.value.partial == b'unfinished'
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('chunk_size', [3, 4096])
+async def test_limit(chunk_size):
+    frames = FrameReader(_reader(b'x' * 10 + b'\n'), limit=10, chunk_size=chunk_size)
+    assert await frames.read_frame() == b'x' * 10
+    frames = FrameReader(_reader(b'y' * 11 + b'\n'), limit=10, chunk_size=chunk_size)
+    with pytest.raises(ResponseFormatError):
+        await frames.read_frame()
+
+
+@pytest.mark.asyncio
+async def test_limit_applies_before_the_newline_arrives():
+    frames = FrameReader(_reader(b'z' * 100, eof=False), limit=10, chunk_size=4)
+    with pytest.raises(ResponseFormatError):
+        await frames.read_frame()
+
+
+@pytest.mark.asyncio
+async def test_frames_larger_than_a_chunk():
+    async with StandInServer(records=20, padding=READ_CHUNK_SIZE // 8) as server:
+        async with NetlabClient(config=server.config()) as client:
+            pods = await client.pod_list()
+    assert len(pods) == 20
+    assert all(len(pod['pod_desc']) > READ_CHUNK_SIZE // 8 for pod in pods)
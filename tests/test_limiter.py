@@ -0,0 +1,28 @@
+import asyncio
+
+import pytest
+
+from netlab.async_client import NetlabClient
+from netlab.errors.common import NetlabTimeoutError
+from netlab.standin import StandInServer
+
+
+@pytest.mark.asyncio
+async def test_call_many_keeps_sent_results_when_a_slot_wait_times_out():
+    async with StandInServer() as server:
+        config = server.config(method_max_in_flight={'pod.remove': 1})
+        async with NetlabClient(config=config) as client:
+            assert client.limiter is not None
+            # hold the only pod.remove slot, so the batch waits for it after sending the calls before it
+            await client.limiter.acquire('pod.remove')
+            loop = asyncio.get_event_loop()
+            start = loop.time()
+            results = await client.call_many([
+                ('pod.get', {'pod_id': 1}), ('pod.get', {'pod_id': 2}), ('pod.remove', {'pod_id': 3}),
+                ('pod.get', {'pod_id': 4}),
+            ], timeout=0.2)
+            assert loop.time() - start < 1
+            assert [result['pod_id'] for result in results[:2]] == [1, 2]
+            assert all(isinstance(result, NetlabTimeoutError) for result in results[2:])
+            assert 'pod.remove' not in server.calls and server.calls['pod.get'] == 2
+            assert not client._pending and client._in_flight == 0
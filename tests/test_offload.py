@@ -0,0 +1,35 @@
+import asyncio
+import json
+import uuid
+from typing import Any, Dict
+
+import pytest
+
+from netlab.async_client import NetlabClient
+from netlab.standin import StandInServer
+
+
+@pytest.mark.asyncio
+async def test_notifications_wait_for_offloaded_frames():
+    async with StandInServer() as server:
+        async with NetlabClient(config=server.config(decode_offload_threshold=10000)) as client:
+            queue: 'asyncio.Queue[Dict[str, Any]]' = asyncio.Queue()
+            handle = uuid.uuid4()
+            client._event_mapping[handle] = queue
+            replies = []
+            data = b''
+            for seq in range(1, 4):
+                ident = uuid.uuid4()
+                replies.append(client._register(ident, True))
+                rows = [{'pod_id': n, 'pod_desc': 'x' * 100} for n in range(200 * seq)]
+                data += json.dumps({'id': str(ident), 'result': rows}).encode() + b'\n'
+                data += json.dumps({'handle': str(handle), 'params': {'seq': seq}}).encode() + b'\n'
+            # as if the server had sent them, the large replies are decoded off the loop
+            client._reader.feed_data(data)
+
+            for seq, reply in enumerate(replies, 1):
+                event = await asyncio.wait_for(queue.get(), 5)
+                assert event['params']['seq'] == seq
+                # each notification is delivered after the reply that arrived before it
+                assert reply.done() and len(reply.result()) == 200 * seq
+            assert client.alive()
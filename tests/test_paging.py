@@ -0,0 +1,60 @@
+import asyncio
+
+import pytest
+
+from netlab.api.user import UserApiMixin
+from netlab.async_client import NetlabClient
+from netlab.paging import PageSizer
+from netlab.standin import StandInServer
+
+
+def test_starts_at_max_limit():
+    assert PageSizer().limit == 500
+    assert PageSizer(max_limit=200).limit == 200
+
+
+def test_narrow_rows_keep_the_largest_pages():
+    sizer = PageSizer()
+    sizer.observe(500, [{'acc_id': n} for n in range(500)], 0.05)
+    assert sizer.limit == 500
+
+
+def test_wide_or_slow_rows_shrink_the_pages():
+    sizer = PageSizer()
+    sizer.observe(500, [{'acc_id': n, 'acc_full_name': 'x' * 2000} for n in range(500)], 0.05)
+    assert 50 <= sizer.limit < 500
+
+    sizer = PageSizer()
+    sizer.observe(500, [{'acc_id': n} for n in range(500)], 10.0)
+    assert sizer.limit == 100
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('limit', [None, 100, PageSizer(min_limit=10, max_limit=40)])
+async def test_every_account_once(limit):
+    async with StandInServer(accounts=1234, task_latency=0) as server:
+        async with NetlabClient(config=server.config()) as client:
+            accounts = [account['acc_id'] async for account in client.user_account_search_iter(
+                properties=UserApiMixin.user_account_list_props, limit=limit)]
+    assert accounts == list(range(1, 1235))
+
+
+def _fetching():
+    return [
+        task for task in asyncio.all_tasks()
+        if getattr(task.get_coro(), '__name__', None) == 'fetch' and not task.done()]
+
+
+@pytest.mark.asyncio
+async def test_closing_early_cancels_the_pages_ahead():
+    async with StandInServer(accounts=1000, task_latency=0.2) as server:
+        async with NetlabClient(config=server.config()) as client:
+            accounts = client.user_account_search_iter(limit=10, prefetch=4)
+            async for account in accounts:
+                if account['acc_id'] > 20:
+                    # the pages up to the third were requested together, the sixth after the second was read
+                    break
+            assert _fetching()
+            await accounts.aclose()
+            await asyncio.sleep(0)
+            assert not _fetching()
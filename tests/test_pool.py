@@ -0,0 +1,87 @@
+import asyncio
+from typing import Any, List
+
+import pytest
+
+from netlab.errors.common import NetlabConnectionClosedError
+from netlab.errors.pod import PodNotFoundError
+from netlab.pool import NetlabPool, NetlabPoolConnection
+from netlab.standin import StandInServer
+
+
+class _Connection(object):
+    _server_version = '22.4.0'
+
+    def __init__(self, in_flight=0, live=True, closed=False):
+        self._in_flight = in_flight
+        self._live = live
+        self._closed = closed
+
+    def alive(self):
+        return self._live
+
+
+def _port(connection):
+    return connection._writer.get_extra_info('sockname')[1]
+
+
+def test_selects_least_loaded():
+    connections: List[Any] = [_Connection(3), _Connection(1), _Connection(2)]
+    pool = NetlabPoolConnection(connections)
+    assert all(pool._select() is connections[1] for _ in range(4))
+
+
+def test_ties_are_round_robin():
+    connections: List[Any] = [_Connection(), _Connection(), _Connection()]
+    pool = NetlabPoolConnection(connections)
+    assert {id(pool._select()) for _ in range(3)} == set(map(id, connections))
+
+
+def test_reconnecting_connections_are_a_last_resort():
+    connections: List[Any] = [_Connection(0, live=False), _Connection(50)]
+    assert NetlabPoolConnection(connections)._select() is connections[1]
+
+    connections[1] = _Connection(live=False, closed=True)
+    assert NetlabPoolConnection(connections)._select() is connections[0]
+
+    connections[0] = _Connection(live=False, closed=True)
+    with pytest.raises(NetlabConnectionClosedError):
+        NetlabPoolConnection(connections)._select()
+
+
+async def _lost(connection):
+    # the connection notices the socket closed within a few loop iterations
+    for _ in range(100):
+        if not connection._ready.is_set():
+            return
+        await asyncio.sleep(0)
+    raise AssertionError('connection did not notice it was dropped')
+
+
+@pytest.mark.asyncio
+async def test_calls_go_to_live_connections_while_one_reconnects():
+    # the latency holds the reconnect in its login long enough to call in the meantime
+    async with StandInServer(latency=0.2) as server:
+        async with NetlabPool(config=server.config(reconnect=True), size=2) as pool:
+            dropped, other = pool.connections
+            assert server.drop(_port(dropped)) == 1
+            await _lost(dropped)
+
+            assert pool._select() is other
+            assert len(await pool.pod_list()) == server.records
+            assert other.alive()
+
+            await asyncio.wait_for(dropped._ready.wait(), 5)
+            assert dropped.alive()
+
+
+@pytest.mark.asyncio
+async def test_call_many_keeps_order_when_some_calls_fail():
+    async with StandInServer(error_rate=0.5, error_code='E_POD_NOT_FOUND', seed=1) as server:
+        async with NetlabPool(config=server.config(), size=2) as pool:
+            pod_ids = list(range(1, 41))
+            results = await pool.call_many([('pod.get', {'pod_id': pod_id}) for pod_id in pod_ids])
+    failed = [pod_id for pod_id, result in zip(pod_ids, results) if isinstance(result, PodNotFoundError)]
+    assert 0 < len(failed) < len(pod_ids)
+    assert [result['pod_id'] for result in results if not isinstance(result, Exception)] == [
+        pod_id for pod_id in pod_ids if pod_id not in failed]
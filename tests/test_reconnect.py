@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+
+from netlab.async_client import NetlabClient
+from netlab.errors.common import NetlabConnectionClosedError
+from netlab.standin import StandInServer
+
+
+async def _received(server, method, count=1):
+    for _ in range(500):
+        if server.calls.get(method, 0) >= count:
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError('{} was not received'.format(method))
+
+
+@pytest.mark.asyncio
+async def test_idempotent_calls_are_retried():
+    async with StandInServer(latency=0.1) as server:
+        async with NetlabClient(config=server.config(reconnect=True)) as client:
+            call = asyncio.ensure_future(client.pod_list())
+            await _received(server, 'pod.list')
+            assert server.drop() == 1
+            assert len(await asyncio.wait_for(call, 5)) == server.records
+            assert server.calls['pod.list'] == 2
+            assert server.calls['user.authenticate'] == 2
+
+
+@pytest.mark.asyncio
+async def test_other_calls_fail_when_the_connection_drops():
+    async with StandInServer(latency=0.1) as server:
+        async with NetlabClient(config=server.config(reconnect=True)) as client:
+            call = asyncio.ensure_future(client.call('pod.remove', pod_id=1))
+            await _received(server, 'pod.remove')
+            server.drop()
+            with pytest.raises(NetlabConnectionClosedError):
+                await asyncio.wait_for(call, 5)
+            assert server.calls['pod.remove'] == 1
+            # the connection itself comes back
+            assert (await client.system_status_get())['sys_name']
+
+
+@pytest.mark.asyncio
+async def test_subscriptions_are_replayed():
+    async with StandInServer(event_interval=0.05) as server:
+        async with NetlabClient(config=server.config(reconnect=True)) as client:
+            async with client.subscribe('RESERVATION.ADDED') as events:
+                assert (await asyncio.wait_for(events.get(), 5))['params']['seq'] == 1
+                server.drop()
+                await _received(server, 'event.subscribe', 2)
+                # the events of the new socket start over
+                while (await asyncio.wait_for(events.get(), 5))['params']['seq'] != 1:
+                    pass
+            assert server.calls['event.unsubscribe'] == 1
+
+
+@pytest.mark.asyncio
+async def test_gives_up_after_reconnect_timeout():
+    async with StandInServer() as server:
+        config = server.config(reconnect=True, reconnect_timeout=0.5, reconnect_max_delay=0.1)
+        async with NetlabClient(config=config) as client:
+            loop = asyncio.get_event_loop()
+            start = loop.time()
+            # stops listening as well, so every attempt fails
+            await server.close()
+            with pytest.raises(NetlabConnectionClosedError):
+                await asyncio.wait_for(client.pod_list(), 5)
+            assert 0.4 < loop.time() - start < 1.5
+            assert client._closed and not client.alive()
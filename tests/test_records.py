@@ -0,0 +1,98 @@
+import pickle
+import threading
+from datetime import datetime
+
+import pytest
+
+from netlab import records
+from netlab.async_client import NetlabClient
+from netlab.records import LazyRecord, Record, lazy_records
+from netlab.standin import StandInServer
+
+
+def test_converts_on_read():
+    record = lazy_records({'pod_id': '7', 'acc_last_login': '2022-01-02 03:04:05', 'name': 'x'})
+    assert dict.__getitem__(record, 'pod_id') == '7'
+    assert record['pod_id'] == 7
+    assert record['acc_last_login'] == datetime(2022, 1, 2, 3, 4, 5)
+    assert record == {'pod_id': 7, 'acc_last_login': datetime(2022, 1, 2, 3, 4, 5), 'name': 'x'}
+
+
+def test_assigned_values_are_not_converted():
+    record = lazy_records({})
+    record['pod_id'] = '7'
+    record.update(acc_id='3', nested={'pod_id': '1'})
+    assert record['pod_id'] == '7'
+    assert record['acc_id'] == '3'
+    assert record['nested'] == {'pod_id': '1'}
+
+
+def test_only_decoded_fields_get_a_bit():
+    record = lazy_records({'not_an_api_field_0': {'pod_id': '1'}, 'not_an_api_field_4': [{'pod_id': '2'}]})
+    record['not_an_api_field_1'] = 'value'
+    record.update(not_an_api_field_2={'pod_id': '3'})
+    record.setdefault('not_an_api_field_3', ['value'])
+    assert record['not_an_api_field_0']['pod_id'] == 1
+    assert record['not_an_api_field_4'][0]['pod_id'] == 2
+    assert record['not_an_api_field_2'] == {'pod_id': '3'}
+    assert not {'not_an_api_field_{}'.format(n) for n in range(5)} & set(records._FIELD_BITS)
+
+
+def test_nested_values_are_wrapped_once():
+    rows = [{'pod_id': '2'}, [{'pod_id': '3'}]]
+    record = lazy_records({'nested': {'pod_id': '1'}, 'rows': rows})
+    nested = record['nested']
+    assert type(nested) is LazyRecord
+    assert nested['pod_id'] == 1
+    assert record['nested'] is nested
+    assert record['rows'] is rows
+    assert type(rows[0]) is LazyRecord and type(rows[1][0]) is LazyRecord
+    first = rows[0]
+    assert record['rows'][0] is first and first['pod_id'] == 2
+
+
+def test_pickle_keeps_converted_fields():
+    record = lazy_records({'pod_id': '7', 'acc_id': '3'})
+    record['pod_id']
+    record['acc_id'] = 'assigned'
+    record['nested'] = {'pod_id': '1'}
+    copy = pickle.loads(pickle.dumps(record))
+    assert type(copy) is LazyRecord
+    assert dict.__getitem__(copy, 'pod_id') == 7
+    assert copy['acc_id'] == 'assigned'
+    assert copy['nested'] == {'pod_id': '1'} == record.copy()['nested']
+
+
+def test_field_bits_are_unique_across_threads(monkeypatch):
+    # a registry of its own, so the bits of the other tests are left alone
+    monkeypatch.setattr(records, '_FIELD_BITS', {})
+    fields = sorted(records._DECODERS)[:200]
+    barrier = threading.Barrier(4)
+
+    def assign():
+        barrier.wait()
+        for field in fields:
+            records._field_bit(field)
+
+    threads = [threading.Thread(target=assign) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    bits = list(records._FIELD_BITS.values())
+    assert len(bits) == len(fields) == len(set(bits))
+
+
+@pytest.mark.asyncio
+async def test_records_ignore_a_raw_default():
+    async with StandInServer(records=5, accounts=5) as server:
+        async with NetlabClient(config=server.config(raw='bytes')) as client:
+            assert isinstance(await client.pod_list(), bytes)
+            for rows in [
+                    await client.pod_list(records=True), await client.pod_types_list(records=True),
+                    await client.class_list(records=True), await client.user_account_list(records=True)]:
+                assert rows and all(isinstance(row, Record) for row in rows)
+            pods = await client.pod_list(records=True)
+            assert isinstance(pods[0].pod_id, int)
+            assert (await client.pod_list(columnar=True)).length == len(pods)
+            assert (await client.reservation_query(columnar=True)).length == 5
@@ -0,0 +1,160 @@
+import math
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Dict, List
+
+import pytest
+
+from netlab import serializer
+from netlab.errors import ResponseFormatError
+from netlab.serializer import from_date, from_datetime, process, to_date, to_datetime, to_float
+
+
+@pytest.mark.parametrize('value, expected', [(0, 0.0), (0.0, 0.0), ('0', 0.0), ('0.00', 0.0), ('12.5', 12.5), (3, 3.0)])
+def test_to_float(value, expected):
+    assert to_float(value) == expected
+
+
+@pytest.mark.parametrize('value', [None, ''])
+def test_to_float_blank(value):
+    assert math.isnan(to_float(value))
+
+
+def _baseline_resolve_enum(enum: Any, value: Any) -> Any:
+    if not isinstance(enum, tuple):
+        enum = (enum,)
+    for e in enum:
+        try:
+            return e(value)
+        except:  # noqa
+            pass
+    raise ResponseFormatError("The value {} could not resolve to one of '{}'.".format(value, enum))
+
+
+def _baseline_process(obj: Dict[str, Any]) -> Dict[str, Any]:
+    # the per-set conversion process() used before the decoders were compiled
+    s = serializer
+    for field, value in obj.items():
+        if field in s.DATE_FIELDS:
+            obj[field] = s.to_date(value)
+        if field in s.DATETIME_FIELDS:
+            obj[field] = s.to_datetime(value)
+        if field in s.TIMEDELTA_FIELDS:
+            obj[field] = s.to_timedelta(value)
+        if field in s.BOOLEAN_FIELDS:
+            obj[field] = s.to_bool(value)
+        if field in s.DECIMAL_FIELDS:
+            obj[field] = s.to_decimal(value)
+        if field in s.INT_FIELDS:
+            obj[field] = s.to_int(value)
+        if field in s.UUID_FIELDS:
+            obj[field] = s.to_uuid(value)
+        if field in s.ENUMS and value is not None:
+            obj[field] = _baseline_resolve_enum(s.ENUMS[field], value)
+        if field in s.ENUM_CSV and value is not None:
+            enum = s.ENUM_CSV[field]
+            obj[field] = list(map(lambda v: enum[v], value.split(',')))
+        if field in s.STR_CSV:
+            obj[field] = value.split(',')
+        if field in s.BLANK_IS_NONE_FIELDS and value == '':
+            obj[field] = None
+    return obj
+
+
+def _samples(field: str) -> List[Any]:
+    samples: List[Any] = [
+        None, '', '0', '1', '12', '-3', '1.50', 'true', 'false', 'a,b', '2022-01-02', '2022-01-02 03:04:05',
+        '2022-01-02 03:04:05.25', '01:02:03', '12345678-1234-5678-1234-567812345678', 7, True]
+    enums = serializer.ENUMS.get(field, ())
+    for enum in enums if isinstance(enums, tuple) else (enums,):
+        if isinstance(enum, type) and issubclass(enum, Enum):
+            samples.extend(member.value for member in enum)
+    if field in serializer.ENUM_CSV:
+        names = list(serializer.ENUM_CSV[field].__members__)
+        samples.extend([names[0], ','.join(names[:3])])
+    return samples
+
+
+def _outcome(convert: Any, field: str, value: Any) -> Any:
+    try:
+        result = convert({field: value, 'unrelated': value})
+    except Exception:
+        return Exception
+    return [(key, type(result[key]), result[key]) for key in sorted(result)]
+
+
+@pytest.mark.parametrize('field', sorted(serializer.FIELD_DECODERS))
+def test_process_matches_per_set_conversion(field):
+    for value in _samples(field):
+        assert _outcome(process, field, value) == _outcome(_baseline_process, field, value), (field, value)
+
+
+def test_process_covers_overlapping_sets():
+    sets = [
+        serializer.DATE_FIELDS, serializer.DATETIME_FIELDS, serializer.TIMEDELTA_FIELDS, serializer.BOOLEAN_FIELDS,
+        serializer.DECIMAL_FIELDS, serializer.INT_FIELDS, serializer.UUID_FIELDS, serializer.ENUMS,
+        serializer.ENUM_CSV, serializer.STR_CSV, serializer.BLANK_IS_NONE_FIELDS]
+    overlapping = [field for field in serializer.FIELD_DECODERS if sum(field in fields for fields in sets) > 1]
+    assert overlapping
+    for field in overlapping:
+        for value in _samples(field):
+            assert _outcome(process, field, value) == _outcome(_baseline_process, field, value), (field, value)
+
+
+def test_process_converts_whole_rows():
+    row: Dict[str, Any] = {field: '' for field in serializer.BLANK_IS_NONE_FIELDS}
+    row.update({field: None for field in serializer.ENUMS})
+    row.update({'acc_sys': '1', 'cls_ext_slots_per_res': 3, 'acc_privs': None, 'ros_team': 'a,b'})
+    assert process(dict(row)) == _baseline_process(dict(row))
+
+
+def _strptime(value: str) -> datetime:
+    # how timestamps were parsed before the fast path
+    try:
+        return datetime.strptime(value, '%Y-%m-%d %H:%M:%S')
+    except ValueError:
+        return datetime.strptime(value, '%Y-%m-%d %H:%M:%S.%f')
+
+
+@pytest.mark.parametrize('value', [
+    '2022-01-02 03:04:05', '2022-01-02 03:04:05.25', '2022-01-02 03:04:05.000001', '2022-12-31 23:59:59.999999',
+    '2022-1-2 3:04:05', '2022-01-02 3:4:5', '2022-1-2 03:04:05.5'])
+def test_to_datetime_matches_strptime(value):
+    assert to_datetime(value) == _strptime(value)
+
+
+def test_to_datetime_fraction_is_microseconds():
+    assert to_datetime('2022-01-02 03:04:05.25').microsecond == 250000
+    assert to_datetime('2022-01-02 03:04:05.000250').microsecond == 250
+
+
+@pytest.mark.parametrize('value', ['2022-01-02', '2022-1-2', '2022-01-2', '0999-12-31'])
+def test_to_date_matches_strptime(value):
+    assert to_date(value) == datetime.strptime(value, '%Y-%m-%d').date()
+
+
+@pytest.mark.parametrize('convert, value', [
+    (to_datetime, '2022-13-02 03:04:05'), (to_datetime, '2022-01-02 03:04:05.1234567'), (to_datetime, '2022-01-02'),
+    (to_date, '2022-02-30'), (to_date, '2022-01-02 03:04:05'), (to_date, 'today')])
+def test_invalid_timestamps_raise(convert, value):
+    with pytest.raises(ValueError):
+        convert(value)
+
+
+@pytest.mark.parametrize('value', [None, ''])
+def test_blank_timestamps(value):
+    assert to_datetime(value) is None
+    assert to_date(value) is None
+
+
+@pytest.mark.parametrize('value', [
+    datetime(2022, 1, 2, 3, 4, 5), datetime(2022, 12, 31, 23, 59, 59, 999999), datetime(1999, 10, 9, 0, 0, 0)])
+def test_from_datetime_round_trip(value):
+    assert from_datetime(value) == value.strftime('%Y-%m-%d %H:%M:%S')
+    assert to_datetime(from_datetime(value)) == value.replace(microsecond=0)
+
+
+@pytest.mark.parametrize('value', [date(2022, 1, 2), date(2022, 12, 31), date(1999, 10, 9)])
+def test_from_date_round_trip(value):
+    assert from_date(value) == value.strftime('%Y-%m-%d')
+    assert to_date(from_date(value)) == value
@@ -0,0 +1,156 @@
+import asyncio
+import json
+import uuid
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from netlab.async_client import NetlabClient
+from netlab.codec import JsonCodec
+from netlab.errors import ResponseFormatError
+from netlab.errors.pod import PodNotFoundError
+from netlab.records import LazyRecord
+from netlab.standin import StandInServer
+from netlab.streaming import ResultStream, _Frame, stream_message
+
+CODEC = JsonCodec()
+IDENT = str(uuid.UUID(int=1))
+OTHER = str(uuid.UUID(int=2))
+ROWS = [
+    {'pod_id': '1', 'uptime_sec': '1.50', 'res_start': '2022-01-02 03:04:05', 'nested': {'acc_id': '3', 'list': [1]}},
+    {'pod_id': '2', 'uptime_sec': '', 'res_start': None, 'nested': [{'pod_id': '4'}, []]},
+]
+
+
+def _stream(message, mode=False, key=None):
+    return ResultStream(_Frame(json.dumps(message).encode()), CODEC, mode, key)
+
+
+def test_rows():
+    assert list(_stream({'id': IDENT, 'result': ROWS})) == [
+        {'pod_id': 1, 'uptime_sec': Decimal('1.50'), 'res_start': datetime(2022, 1, 2, 3, 4, 5),
+         'nested': {'acc_id': 3, 'list': [1]}},
+        {'pod_id': 2, 'uptime_sec': None, 'res_start': None, 'nested': [{'pod_id': 4}, []]},
+    ]
+
+
+@pytest.mark.parametrize('mode', [False, True, 'lazy', 'float', 'bytes'])
+def test_modes_match_decoded_results(mode):
+    streamed = list(_stream({'id': IDENT, 'result': ROWS}, mode))
+    converted = list(ResultStream(json.loads(json.dumps(ROWS)), CODEC, mode))
+    assert streamed == converted
+    if mode == 'lazy':
+        assert all(type(row) is LazyRecord for row in streamed)
+    elif mode == 'bytes':
+        assert [json.loads(row) for row in streamed] == ROWS
+    elif mode is True:
+        assert streamed == ROWS
+    elif mode == 'float':
+        assert streamed[0]['uptime_sec'] == 1.5
+
+
+def test_whitespace_and_nesting():
+    frame = (
+        '\n{ "jsonrpc" : "2.0" ,\t"result"\r\n: [ \n {"a": {"b": [1, {"c": "]"}]}, "d": "x,y"} ,\n'
+        '  [ [ ] , { } ] , "s\\"]" , null\t] , "id" : "' + IDENT + '" }\n'
+    ).encode()
+    assert list(ResultStream(_Frame(frame), CODEC, True)) == [
+        {'a': {'b': [1, {'c': ']'}]}, 'd': 'x,y'}, [[], {}], 's"]', None]
+
+
+@pytest.mark.parametrize('frame', [b'{"id": "1", "result": [1 2]}', b'{"id": "1", "result": [1,]}',
+                                   b'{"id": "1", "result": {}}', b'{"id": "1"}'])
+def test_invalid_results(frame):
+    with pytest.raises(ResponseFormatError):
+        list(ResultStream(_Frame(frame), CODEC, True))
+
+
+def test_error_reply():
+    message = {'id': IDENT, 'error': {'message': 'E_POD_NOT_FOUND', 'data': {'message': 'no pod'}}}
+    # raised by the call, before the first row is asked for
+    with pytest.raises(PodNotFoundError):
+        _stream(message)
+
+
+def test_task_completion():
+    message = {'handle': IDENT, 'method': 'task.complete', 'params': {'status': 'OK', 'result': ROWS}}
+    assert list(_stream(message, True)) == ROWS
+
+
+def test_keyed_rows_and_info():
+    result = {'current_page': '1', 'total_pages': '3', 'data': ROWS, 'total_records': '60'}
+    stream = _stream({'id': IDENT, 'result': result}, True, 'data')
+    assert stream.info == {'current_page': '1', 'total_pages': '3'}
+    assert list(stream) == ROWS
+    # properties after the rows are read with the last row
+    assert stream.info == {'current_page': '1', 'total_pages': '3', 'total_records': '60'}
+
+
+@pytest.mark.parametrize('result', [{'total_pages': '0', 'data': None, 'total_records': '0'},
+                                    {'total_pages': '0', 'total_records': '0'}])
+def test_missing_rows(result):
+    for stream in _stream({'id': IDENT, 'result': result}, False, 'data'), ResultStream(result, CODEC, False, 'data'):
+        assert list(stream) == []
+        assert stream.info == {'total_pages': 0, 'total_records': 0}
+
+
+def test_stream_message():
+    idents = {IDENT}
+    frame = json.dumps({'id': IDENT, 'result': []}).encode()
+    message = stream_message(frame, idents)
+    assert message is not None and message['id'] == IDENT and message['result'].data == frame
+
+    frame = json.dumps({'handle': IDENT.upper(), 'params': {'result': []}}).encode()
+    message = stream_message(frame, idents)
+    assert message is not None and message['handle'] == IDENT and message['params']['result'].data == frame
+
+
+def test_stream_message_ignores_ids_in_data():
+    idents = {IDENT}
+    assert stream_message(json.dumps({'id': OTHER, 'result': [{'id': IDENT}]}).encode(), idents) is None
+    assert stream_message(json.dumps({'handle': OTHER, 'params': {'handle': IDENT}}).encode(), idents) is None
+    assert stream_message(json.dumps({'id': OTHER, 'result': 'OK'}).encode(), set()) is None
+
+
+@pytest.mark.asyncio
+async def test_streamed_calls_match():
+    async with StandInServer(records=30) as server:
+        async with NetlabClient(config=server.config()) as client:
+            assert [row async for row in await client.reservation_query(stream=True)] == \
+                await client.reservation_query()
+            assert [row async for row in await client.vm_inventory_list(stream=True)] == \
+                await client.vm_inventory_list()
+            page = await client.user_account_search(page=1, limit=10, stream=True)
+            assert [row['acc_id'] async for row in page] == list(range(1, 11))
+            assert page.info['total_records'] == 1000
+
+
+@pytest.mark.asyncio
+async def test_columnar_calls_match():
+    async with StandInServer(records=30) as server:
+        async with NetlabClient(config=server.config()) as client:
+            for method in client.reservation_query, client.vm_inventory_list:
+                columns = await method(columnar=True)
+                rows = await method()
+                assert columns.length == len(rows)
+                assert list(columns['vm_id' if 'vm_id' in columns else 'res_id']) == [
+                    row.get('vm_id', row.get('res_id')) for row in rows]
+
+
+@pytest.mark.asyncio
+async def test_yields_to_the_loop():
+    stream = _stream({'id': IDENT, 'result': [{'pod_id': str(n)} for n in range(1200)]})
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0)
+            ticks += 1
+
+    ticker = asyncio.ensure_future(tick())
+    assert len([row async for row in stream]) == 1200
+    ticker.cancel()
+    # the rows are decoded without waiting, so only the stream's own yields let the ticker run
+    assert ticks >= 1
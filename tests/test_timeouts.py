@@ -0,0 +1,60 @@
+import asyncio
+from typing import List
+
+import pytest
+
+from netlab.async_client import NetlabClient
+from netlab.errors.common import NetlabTimeoutError
+from netlab.standin import StandInServer
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('method, params', [
+    ('pod.list', {}), ('user.account.search.task', {'page': 1}),
+])
+async def test_timed_out_calls_are_cleaned_up(method, params):
+    async with StandInServer(latency=0.3, task_latency=1.0) as server:
+        config = server.config(max_in_flight=4)
+        async with NetlabClient(config=config) as client:
+            assert client.limiter is not None
+            loop = asyncio.get_event_loop()
+            start = loop.time()
+            with pytest.raises(NetlabTimeoutError):
+                # raw differs from the connection's default, so the call has an entry in _decode_modes
+                await client.call(method, timeout=0.1, raw=True, **params)
+            assert loop.time() - start < 0.3
+            assert not client._pending
+            assert not client._decode_modes
+            assert client._in_flight == 0
+            assert client.limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_task_deadline_covers_its_completion():
+    async with StandInServer(task_latency=1.0) as server:
+        async with NetlabClient(config=server.config()) as client:
+            with pytest.raises(NetlabTimeoutError):
+                await client.call('user.account.search.task', page=1, timeout=0.2)
+            # the task was accepted, its completion is what timed out
+            assert server.calls['user.account.search.task'] == 1
+            assert not client._pending
+
+
+@pytest.mark.asyncio
+async def test_past_deadline_sends_nothing(monkeypatch):
+    async with StandInServer() as server:
+        async with NetlabClient(config=server.config()) as client:
+            writes: List[List[bytes]] = []
+            writelines = client._writer.writelines
+
+            def record(frames):
+                writes.append(list(frames))
+                writelines(frames)
+
+            monkeypatch.setattr(client._writer, 'writelines', record)
+            with pytest.raises(NetlabTimeoutError):
+                await client.pod_list(deadline=asyncio.get_event_loop().time() - 1)
+            await asyncio.sleep(0.05)
+            assert writes == []
+            assert 'pod.list' not in server.calls
+            assert not client._pending
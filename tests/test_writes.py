@@ -0,0 +1,39 @@
+import asyncio
+from typing import List
+
+import pytest
+
+from netlab.async_client import NetlabClient
+from netlab.standin import StandInServer
+
+
+def _record_writes(monkeypatch, client) -> List[List[bytes]]:
+    writes: List[List[bytes]] = []
+    writelines = client._writer.writelines
+
+    def record(frames):
+        writes.append(list(frames))
+        writelines(frames)
+
+    monkeypatch.setattr(client._writer, 'writelines', record)
+    return writes
+
+
+@pytest.mark.asyncio
+async def test_sends_in_one_loop_iteration_are_one_write(monkeypatch):
+    async with StandInServer() as server:
+        async with NetlabClient(config=server.config()) as client:
+            writes = _record_writes(monkeypatch, client)
+            pods = await asyncio.gather(*[client.pod_get(pod_id=pod_id) for pod_id in range(1, 11)])
+            assert [pod['pod_id'] for pod in pods] == list(range(1, 11))
+            # the first frame goes out at once, the rest of the iteration's frames together after it
+            assert [len(frames) for frames in writes] == [1, 9]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_window_gathers_every_frame(monkeypatch):
+    async with StandInServer() as server:
+        async with NetlabClient(config=server.config(write_coalesce_window=0.05)) as client:
+            writes = _record_writes(monkeypatch, client)
+            await asyncio.gather(*[client.pod_get(pod_id=pod_id) for pod_id in range(1, 11)])
+            assert [len(frames) for frames in writes] == [10]